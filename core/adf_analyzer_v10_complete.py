@@ -73,6 +73,8 @@ import re
 import unicodedata
 import shutil
 import gc
+import os
+import functools
 import traceback
 from pathlib import Path
 from datetime import datetime
@@ -89,6 +91,13 @@ import warnings
 warnings.filterwarnings('ignore', category=FutureWarning)
 warnings.filterwarnings('ignore', category=UserWarning)
 
+# Optional: faster JSON parsing for config files
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 # Optional: Progress bar for large datasets
 try:
     from tqdm import tqdm
@@ -130,6 +139,12 @@ class Config:
     COMPLEXITY_HIGH_THRESHOLD = 50
     COMPLEXITY_MEDIUM_THRESHOLD = 20
     
+    # Execution-stage columns guaranteed on export (blank when upstream lacks them)
+    STAGE_COLUMNS = {
+        'Activities': ('ExecutionStage', 'HasDependsOn', 'DependsOnCount', 'CycleFlag'),
+        'ActivityExecutionOrder': ('FromExecutionStage', 'ToExecutionStage'),
+    }
+    
     # Supported ARM template schemas
     SUPPORTED_SCHEMAS = [
         "http://schema.management.azure.com/schemas/2015-01-01/deploymentTemplate.json#",
@@ -6476,14 +6491,15 @@ class UltimateEnterpriseADFAnalyzer:
                         self.results['activities'][i]['ExecutionStage'] = stage_map[act_name]
 
         # Update activity_execution_order entries with stages
-        for i, row in enumerate(self.results.get('activity_execution_order', [])):
+        # (flat (pipeline, activity) -> stage map: one dict lookup per edge endpoint)
+        stage_of = {
+            key: info.get('ExecutionStage', 'UNKNOWN')
+            for key, info in self.lookup.get('activities', {}).items()
+        }
+        for row in self.results.get('activity_execution_order', []):
             p = row.get('Pipeline')
-            from_act = row.get('FromActivity')
-            to_act = row.get('ToActivity')
-            from_stage = self.lookup.get('activities', {}).get((p, from_act), {}).get('ExecutionStage', 'UNKNOWN')
-            to_stage = self.lookup.get('activities', {}).get((p, to_act), {}).get('ExecutionStage', 'UNKNOWN')
-            self.results['activity_execution_order'][i]['FromExecutionStage'] = from_stage
-            self.results['activity_execution_order'][i]['ToExecutionStage'] = to_stage
+            row['FromExecutionStage'] = stage_of.get((p, row.get('FromActivity')), 'UNKNOWN')
+            row['ToExecutionStage'] = stage_of.get((p, row.get('ToActivity')), 'UNKNOWN')
 
         self.logger.info("ExecutionStage computation complete")
 
@@ -7846,6 +7862,49 @@ class UltimateEnterpriseADFAnalyzer:
     # CORE DATA SHEETS
     # ═══════════════════════════════════════════════════════════════════════
     
+    @staticmethod
+    def _stage_sort_key(stage) -> Tuple[int, float]:
+        """
+         Sort key for ExecutionStage values
+        
+        Stages are ints, but cycles are marked 'CYCLE' and unresolved
+        endpoints 'UNKNOWN'; comparing those with ints inside one pipeline
+        would raise. Numeric stages sort ascending (blank counts as 0) and
+        the markers go last.
+        """
+        if not stage:
+            return (0, 0)
+        if isinstance(stage, (int, float)):
+            return (0, stage)
+        try:
+            return (0, float(stage))
+        except (TypeError, ValueError):
+            return (1, 0)
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=8)
+    def _load_hide_config(path: str, mtime: float) -> Dict:
+        """Parsed hide_config section of one config file (cached until the file changes)"""
+        with open(path, 'rb') as f:
+            raw = f.read()
+        config = orjson.loads(raw) if HAS_ORJSON else json.loads(raw)
+        return config.get('hide_config', {})
+    
+    def _get_hide_config(self) -> Dict:
+        """
+         Resolve hide_config from enhancement_config.json or config/enhancement_config.json
+        
+        The first existing file wins; its mtime is part of the cache key so
+        edits made between exports are picked up.
+        """
+        for cfg_path in ('enhancement_config.json', 'config/enhancement_config.json'):
+            try:
+                mtime = os.path.getmtime(cfg_path)
+            except OSError:
+                continue
+            return self._load_hide_config(cfg_path, mtime)
+        return {}
+    
     def _write_core_data_sheets(self, writer):
         """
         Write core data sheets with auto-split for large datasets
@@ -7854,17 +7913,13 @@ class UltimateEnterpriseADFAnalyzer:
         """
         
         # Load hide_config for column removal
-        hide_cfg = {}
         hidden_columns = {}
+        # Sheet -> columns dropped from the data here (later column-hiding passes can skip them)
+        self._removed_hidden_columns = {}
         try:
-            for cfg_path in ['enhancement_config.json', 'config/enhancement_config.json']:
-                if Path(cfg_path).exists():
-                    with open(cfg_path, 'r') as f:
-                        cfg = json.load(f)
-                        hide_cfg = cfg.get('hide_config', {})
-                        if hide_cfg.get('enabled', False):
-                            hidden_columns = hide_cfg.get('hidden_columns', {})
-                        break
+            hide_cfg = self._get_hide_config()
+            if hide_cfg.get('enabled', False):
+                hidden_columns = hide_cfg.get('hidden_columns', {})
         except Exception as e:
             self.logger.warning(f"Could not load hide_config: {e}")
         
@@ -7875,10 +7930,10 @@ class UltimateEnterpriseADFAnalyzer:
             ('Pipelines', self.results['pipelines']),
             
             # Activities - sorted by Pipeline A-Z, then ExecutionStage smallest to largest
-            ('Activities', sorted(self.results['activities'], key=lambda x: ((x.get('Pipeline', '') or '').lower(), x.get('ExecutionStage', 0) or 0)) if self.results['activities'] else []),
+            ('Activities', sorted(self.results['activities'], key=lambda x: ((x.get('Pipeline', '') or '').lower(), self._stage_sort_key(x.get('ExecutionStage')))) if self.results['activities'] else []),
             ('ActivityCount', self.results['activity_count']),
             # ActivityExecutionOrder - sorted by Pipeline A-Z, then FromExecutionStage smallest to largest
-            ('ActivityExecutionOrder', sorted(self.results['activity_execution_order'], key=lambda x: ((x.get('Pipeline', '') or '').lower(), x.get('FromExecutionStage', 0) or 0)) if self.results['activity_execution_order'] else []),
+            ('ActivityExecutionOrder', sorted(self.results['activity_execution_order'], key=lambda x: ((x.get('Pipeline', '') or '').lower(), self._stage_sort_key(x.get('FromExecutionStage')))) if self.results['activity_execution_order'] else []),
             
             # DataFlows
             ('DataFlows', self.results['dataflows']),
@@ -7904,6 +7959,7 @@ class UltimateEnterpriseADFAnalyzer:
                         filtered_row = {k: v for k, v in row.items() if k not in cols_to_hide}
                         filtered_data.append(filtered_row)
                     self._write_sheet_with_auto_split(writer, sheet_name, filtered_data)
+                    self._removed_hidden_columns[sheet_name] = frozenset(cols_to_hide)
                     self.logger.info(f"    {sheet_name}: Removed columns {cols_to_hide}")
                 else:
                     self._write_sheet_with_auto_split(writer, sheet_name, data)
@@ -8335,18 +8391,7 @@ class UltimateEnterpriseADFAnalyzer:
         
         if len(data) <= Config.SHEET_SPLIT_THRESHOLD:
             # Single sheet
-            df = pd.DataFrame(data)
-            # Ensure new execution-stage columns exist for Activities and ActivityExecutionOrder
-            # Note: Do NOT add columns that may be hidden via hide_config - let the data define what columns exist
-            if sheet_name == 'Activities':
-                for col in ('ExecutionStage','HasDependsOn','DependsOnCount','CycleFlag'):
-                    if col not in df.columns:
-                        df[col] = ''
-            if sheet_name == 'ActivityExecutionOrder':
-                if 'FromExecutionStage' not in df.columns:
-                    df['FromExecutionStage'] = ''
-                if 'ToExecutionStage' not in df.columns:
-                    df['ToExecutionStage'] = ''
+            df = self._build_sheet_df(sheet_name, data)
             # Ensure PipelineAnalysis columns follow a consistent order:
             # Pipeline, Folder, standard activity counts, then any discovered activity-type columns, then the rest
             if sheet_name == 'PipelineAnalysis':
@@ -8386,18 +8431,7 @@ class UltimateEnterpriseADFAnalyzer:
                 part_data = data[start_idx:end_idx]
                 part_sheet_name = self._get_unique_sheet_name(f"{sheet_name}_P{i+1}")
                 
-                df = pd.DataFrame(part_data)
-                # Ensure new execution-stage columns exist for Activities and ActivityExecutionOrder (split parts)
-                # Note: Do NOT add columns that may be hidden via hide_config
-                if sheet_name == 'Activities':
-                    for col in ('ExecutionStage','HasDependsOn','DependsOnCount','CycleFlag'):
-                        if col not in df.columns:
-                            df[col] = ''
-                if sheet_name == 'ActivityExecutionOrder':
-                    if 'FromExecutionStage' not in df.columns:
-                        df['FromExecutionStage'] = ''
-                    if 'ToExecutionStage' not in df.columns:
-                        df['ToExecutionStage'] = ''
+                df = self._build_sheet_df(sheet_name, part_data)
                 if sheet_name == 'PipelineAnalysis':
                     standard_activity_cols = [
                         'TotalActivities','CopyActivities','DataFlowActivities','StoredProcActivities','ScriptActivities',
@@ -8423,6 +8457,25 @@ class UltimateEnterpriseADFAnalyzer:
             
             self.logger.warning(f"    {sheet_name} split into {num_parts} parts (total: {len(data):,} rows)")
     
+    def _build_sheet_df(self, sheet_name: str, data: List[Dict]) -> pd.DataFrame:
+        """
+         Build the export DataFrame, guaranteeing execution-stage columns
+        
+        The common case (upstream stage extraction already populated every
+        record) is detected from the first record and skips any column fixup.
+        Missing columns are added in a single reindex instead of one
+        `df[col] = ''` assignment per column.
+        """
+        df = pd.DataFrame(data)
+        required = Config.STAGE_COLUMNS.get(sheet_name)
+        if not required or set(required).issubset(data[0].keys()):
+            return df
+        
+        missing = [col for col in required if col not in df.columns]
+        if missing:
+            df = df.reindex(columns=[*df.columns, *missing], fill_value='')
+        return df
+    
     # ═══════════════════════════════════════════════════════════════════════
     # HELPER: UNIQUE SHEET NAME GENERATOR
     # ═══════════════════════════════════════════════════════════════════════
@@ -8493,11 +8546,13 @@ class UltimateEnterpriseADFAnalyzer:
                 worksheet.column_dimensions[column_letter].width = adjusted_width
             
             # ═══════════════════════════════════════════════════════════════
-            # Bold headers
+            # Bold headers (font and fill only: border/alignment pandas wrote stay as they are)
             # ═══════════════════════════════════════════════════════════════
+            header_font = Font(bold=True)
+            header_fill = PatternFill(start_color='D3D3D3', end_color='D3D3D3', fill_type='solid')
             for cell in worksheet[1]:
-                cell.font = Font(bold=True)
-                cell.fill = PatternFill(start_color='D3D3D3', end_color='D3D3D3', fill_type='solid')
+                cell.font = header_font
+                cell.fill = header_fill
             
             # ═══════════════════════════════════════════════════════════════
             # Freeze panes (header row)
@@ -8734,110 +8789,8 @@ def main():
     
     # Check arguments
     if len(sys.argv) < 2:
-        print("""
-USAGE:
-  python adf_analyzer_v10_complete.py <template.json> [options]
-
-ARGUMENTS:
-  template.json    : Path to your ARM template JSON file
-
-OPTIONS:
-  --no-discovery   : Disable pattern discovery (faster parsing)
-  --debug          : Enable debug logging
-  --quiet          : Minimize console output
-
-COMPLETE FEATURES IN v10.0:
-   CRITICAL FIXES (15):
-     Global parameters extraction (NEW)
-     Balanced CTE extraction (multi-nested queries)
-     Escaped quote handling (infinite loop prevention)
-     Sequence=0 bug fix
-     O(N²) → O(1) performance (1000x faster)
-     Duplicate pipeline count prevention
-     Integration Runtime usage (NEW - was missing)
-     IntegrationRuntimes sheet export (NEW)
-     Sheet name collision prevention
-     Trigger parameters extraction (NEW)
-     DataFlow flowlets support (NEW)
-     Copy activity mappings (DIU, staging, columns)
-     All dataset types (Oracle, MongoDB, REST, SAP)
-     All activity types (Synapse, ML, HDInsight, Custom)
-     Dynamic table names (@param display)
-  
-   ENHANCEMENTS (10):
-     Missing resource types (credentials, vNets)
-     Pipeline metrics (Web, Notebook, source/target systems)
-     IR properties (vNet integration)
-     Max depth type checking
-     Activity reference validation
-     Freeze panes on all sheets
-     Auto-filter on all sheets
-     Hyperlinks in summary
-     Data validation dropdowns
-     Empty data handling
-  
-   PRODUCTION FEATURES (5):
-     Comprehensive error recovery
-     Memory-efficient processing
-     Configurable thresholds
-     Detailed logging with levels
-     Rich CLI with validation
-
-OUTPUT:
-  📁 output/adf_analysis_latest.xlsx - Main output (for Streamlit)
-  📁 output/adf_analysis_TIMESTAMP.xlsx - Archive copy
-
-EXCEL SHEETS (30+):
-  • Summary - Overall statistics with hyperlinks
-  • PipelineAnalysis - Comprehensive pipeline metrics
-  • Activities - All activities (auto-split if >500k rows)
-  • ActivityExecutionOrder - Activity dependencies
-  • ImpactAnalysis - Multi-level impact (BFS algorithm)
-  • CircularDependencies - Cycle detection (DFS)
-  • DataLineage - Complete source→sink flow
-  • OrphanedPipelines, OrphanedDataFlows, etc.
-  • DatasetUsage, LinkedServiceUsage, IntegrationRuntimeUsage
-  • And 20+ more sheets...
-
-ENTERPRISE EXCEL FEATURES:
-   Auto-adjust column widths (10-60 chars)
-   Freeze panes (header row)
-   Auto-filter on all sheets
-   Conditional formatting (color-coded impact/severity)
-   Bold headers with gray background
-   Auto-split for large datasets (>500k rows)
-   Hyperlinks in summary sheet
-   Sheet ordering (Pipeline first)
-
-EXAMPLES:
-  # Standard analysis
-  python adf_analyzer_v10_complete.py factory_arm_template.json
-
-  # Fast mode (no discovery)
-  python adf_analyzer_v10_complete.py factory_arm_template.json --no-discovery
-
-  # Debug mode
-  python adf_analyzer_v10_complete.py factory_arm_template.json --debug
-
-STREAMLIT AUTO-COPY:
-  Create streamlit_config.json:
-  {
-    "streamlit_path": "./streamlit_app/data",
-    "auto_copy": true
-  }
-
-REQUIREMENTS:
-  - Python 3.7+
-  - pandas
-  - openpyxl
-
-INSTALL:
-  pip install pandas openpyxl
-
-SUPPORT:
-  For issues, check the Errors sheet in the output Excel file.
-  All errors and warnings are logged with timestamps and context.
-        """)
+        # Usage text lives beside the module so it is only read on the help path
+        print(Path(__file__).with_name('_cli_help.txt').read_text(encoding='utf-8'))
         sys.exit(1)
     
     # Parse arguments
@@ -1,25 +1,70 @@
 """Excel Enhancement Module - Professional Excel formatting and styling capabilities"""
 
 from openpyxl.styles import (
-    Font, PatternFill, Border, Side, Alignment,
+    Font, PatternFill, Border, Side, Alignment, NamedStyle,
     numbers, Color, GradientFill
 )
+from openpyxl.styles.fonts import DEFAULT_FONT
+from openpyxl import load_workbook
 from openpyxl.utils import get_column_letter
 from openpyxl.worksheet.table import Table, TableStyleInfo
 from openpyxl.formatting.rule import (
     ColorScaleRule, DataBarRule, IconSetRule, CellIsRule, Rule
 )
+from openpyxl.formatting.formatting import ConditionalFormatting
 from openpyxl.worksheet.hyperlink import Hyperlink
 from openpyxl.worksheet.protection import SheetProtection
 from openpyxl.worksheet.page import PageMargins, PrintPageSetup
 from openpyxl.comments import Comment
-from typing import Any, Dict, List, Tuple, Optional
+from openpyxl.xml import LXML
+from typing import Any, Dict, Iterable, List, Tuple, Optional
 import re
+import contextlib
+import functools
+import heapq
 import traceback
 from pathlib import Path
+from types import MappingProxyType, SimpleNamespace
 from datetime import datetime
 from collections import Counter
+from operator import itemgetter
 import json
+import os
+import shutil
+import threading
+import zipfile
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+# Optional: faster JSON for config loading and debug dumps
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+def _json_loads(raw: bytes) -> Any:
+    """Parse UTF-8 JSON bytes (orjson when installed)"""
+    if HAS_ORJSON:
+        return orjson.loads(raw)
+    return json.loads(raw.decode('utf-8'))
+
+def _json_dumps(obj: Any) -> bytes:
+    """Compact UTF-8 JSON bytes; non-JSON values fall back to str()"""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, default=str, separators=(',', ':')).encode('utf-8')
+
+# Set ADF_EXCEL_DEBUG=1 to print module load progress
+_DEBUG = os.environ.get('ADF_EXCEL_DEBUG', '').lower() in ('1', 'true', 'yes')
+
+# Resolved location of the loaded enhancement config (None when defaults are used)
+_CONFIG_PATH: Optional[Path] = None
+
+# Flattened truthy feature paths of the active config: (config, paths)
+_ENABLED_PATHS: Optional[Tuple[Dict, frozenset]] = None
 
 class EnhancementConfig:
     """
@@ -31,6 +76,7 @@ class EnhancementConfig:
     DEFAULT_CONFIG = {
         "excel_enhancements": {
             "enabled": True,
+            "async_archive": False,
             "core_formatting": {
                 "enabled": True,
                 "column_sizing": True,
@@ -81,39 +127,59 @@ class EnhancementConfig:
                 "enabled": True,
                 "orientation": "landscape"
             }
+        },
+        "debug": {
+            "dump_stage_samples": False
         }
     }
 
     @staticmethod
+    @functools.lru_cache(maxsize=4)
     def load_config(config_file: str = "enhancement_config.json") -> Dict:
         """
         Load enhancement configuration from file
 
+        The parsed result is cached per ``config_file``; call
+        ``EnhancementConfig.invalidate()`` to force a re-read from disk.
+
         Args:
             config_file: Path to config file
 
         Returns:
             Configuration dictionary
         """
+        global _CONFIG_PATH
+
         # Primary: relative to current working directory
-        config_path = Path(config_file)
         # Fallback: next to this module (works with dashboard UI save location)
-        module_fallback = Path(__file__).parent / config_file
+        candidates = (Path(config_file), Path(__file__).parent / config_file)
 
-        for path in (config_path, module_fallback):
-            if path.exists():
-                try:
-                    with open(path, 'r', encoding='utf-8') as f:
-                        config = json.load(f)
-                    print(f" Loaded enhancement config from: {path}")
-                    return config
-                except Exception as e:
-                    print(f"  Config file error at {path}, using defaults: {e}")
-                    return EnhancementConfig.DEFAULT_CONFIG
+        for path in candidates:
+            try:
+                raw = path.read_bytes()
+            except OSError:
+                continue
+            try:
+                config = _json_loads(raw)
+                _CONFIG_PATH = path
+                print(f" Loaded enhancement config from: {path}")
+                return config
+            except Exception as e:
+                print(f"  Config file error at {path}, using defaults: {e}")
+                return EnhancementConfig.DEFAULT_CONFIG
 
         print("ℹ  No config file found, using default settings")
         return EnhancementConfig.DEFAULT_CONFIG
 
+    @staticmethod
+    def invalidate() -> None:
+        """Drop cached configs so the next ``load_config`` re-reads from disk"""
+        global _CONFIG_PATH, _ENHANCEMENT_CONFIG, _ENABLED_PATHS
+        _CONFIG_PATH = None
+        _ENHANCEMENT_CONFIG = None
+        _ENABLED_PATHS = None
+        EnhancementConfig.load_config.cache_clear()
+
     @staticmethod
     def is_enabled(config: Dict, *path) -> bool:
         """
@@ -126,17 +192,139 @@ class EnhancementConfig:
         Returns:
             True if enabled, False otherwise
         """
-        current = config.get('excel_enhancements', {})
+        return path in EnhancementConfig._enabled_paths(config)
 
-        for key in path:
-            if isinstance(current, dict):
-                current = current.get(key, False)
-            else:
-                return False
+    @staticmethod
+    def _enabled_paths(config: Dict) -> frozenset:
+        """
+        Flatten a config into the set of feature paths whose value is truthy
+
+        Only the active config (see get_enhancement_config) is cached; any
+        other dict is flattened on every call. Edits made in place to the
+        active config need EnhancementConfig.invalidate() to be picked up.
+        """
+        global _ENABLED_PATHS
+
+        cached = _ENABLED_PATHS
+        if cached is not None and cached[0] is config:
+            return cached[1]
+
+        paths = set()
+
+        def walk(node, prefix):
+            if node:
+                paths.add(prefix)
+            if isinstance(node, dict):
+                for key, value in node.items():
+                    walk(value, prefix + (key,))
+
+        walk(config.get('excel_enhancements', {}), ())
+
+        enabled = frozenset(paths)
+        if config is _active_config():
+            _ENABLED_PATHS = (config, enabled)
+        return enabled
+
+# Loaded on first use (see get_enhancement_config) so importing the module does no I/O
+_ENHANCEMENT_CONFIG: Optional[Dict] = None
+
+def _active_config() -> Optional[Dict]:
+    """The config get_enhancement_config() would return, without loading it"""
+    assigned = globals().get('ENHANCEMENT_CONFIG')
+    return assigned if assigned is not None else _ENHANCEMENT_CONFIG
+
+def get_enhancement_config() -> Dict:
+    """Return the active enhancement config, loading it from disk on first use"""
+    global _ENHANCEMENT_CONFIG
+
+    # Callers (e.g. the dashboard) may assign module.ENHANCEMENT_CONFIG directly
+    assigned = globals().get('ENHANCEMENT_CONFIG')
+    if assigned is not None:
+        return assigned
+
+    if _ENHANCEMENT_CONFIG is None:
+        _ENHANCEMENT_CONFIG = EnhancementConfig.load_config()
+    return _ENHANCEMENT_CONFIG
+
+def __getattr__(name: str):
+    # PEP 562: keeps `from ... import ENHANCEMENT_CONFIG` working without import-time loading
+    if name == 'ENHANCEMENT_CONFIG':
+        return get_enhancement_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+@functools.lru_cache(maxsize=1024)
+def _col_letter(col_idx: int) -> str:
+    """Cached get_column_letter for per-column/per-row hot loops"""
+    return get_column_letter(col_idx)
+
+@functools.lru_cache(maxsize=256)
+def _solid_fill(color: str) -> PatternFill:
+    """Shared solid PatternFill per colour (fills are never mutated after assignment)"""
+    return PatternFill(start_color=color, end_color=color, fill_type='solid')
+
+@functools.lru_cache(maxsize=256)
+def _font(name: str = None, size: int = None, bold: bool = None, italic: bool = None,
+          color: str = None, underline: str = None) -> Font:
+    """Shared Font per distinct set of attributes"""
+    return Font(name=name, size=size, bold=bold, italic=italic, color=color, underline=underline)
+
+def _sheet_bounds(worksheet) -> Tuple[int, int]:
+    """
+    (max_row, max_column) of a worksheet, read once
+
+    Read-only worksheets trust the <dimension> record written by whatever
+    produced the file; when that is missing or the empty-sheet "A1:A1",
+    drop it and measure the rows instead.
+    """
+    if hasattr(worksheet, 'reset_dimensions'):
+        try:
+            dimension = worksheet.calculate_dimension()
+        except ValueError:
+            dimension = None
+
+        if dimension in (None, 'A1:A1'):
+            worksheet.reset_dimensions()
+            try:
+                worksheet.calculate_dimension(force=True)
+            except Exception:
+                # openpyxl fails to measure a sheet without any rows
+                return 0, 0
+
+    return worksheet.max_row or 0, worksheet.max_column or 0
+
+
+def _header_index(worksheet) -> Dict[Any, int]:
+    """Header value -> 1-based column index for row 1 (blank headers skipped)"""
+    first_row = next(worksheet.iter_rows(min_row=1, max_row=1, values_only=True), ())
+    return {value: col for col, value in enumerate(first_row, 1) if value}
 
-        return bool(current)
 
-ENHANCEMENT_CONFIG = EnhancementConfig.load_config()
+# Post-export copies still running on worker threads (excel_enhancements.async_archive)
+_PENDING_COPIES: List[threading.Thread] = []
+
+def _copy_in_background(logger, name: str, func, *args) -> None:
+    """Run a post-export copy on a worker thread; failures are logged, not lost"""
+    def run():
+        try:
+            func(*args)
+        except Exception as e:
+            logger.warning(f"{name} failed: {e}")
+
+    thread = threading.Thread(target=run, name=name)
+    thread.start()
+    _PENDING_COPIES.append(thread)
+
+def _wait_for_background_copies() -> None:
+    """Join the previous export's copies before its workbook is replaced"""
+    while _PENDING_COPIES:
+        _PENDING_COPIES.pop().join()
+
+def _first_keyword(text: str, table: Tuple[Tuple[str, Any], ...]) -> Any:
+    """Return the value of the first (keyword, value) pair whose keyword occurs in text"""
+    for keyword, value in table:
+        if keyword in text:
+            return value
+    return None
 
 class ExcelTheme:
     """
@@ -194,6 +382,71 @@ class ExcelBorders:
         thick = Side(style='medium', color=ExcelTheme.BORDER_DARK)
         return Border(left=thin, right=thin, top=thin, bottom=thick)
 
+# Shared style objects - assigned by reference inside per-cell loops.
+# openpyxl style objects are immutable once attached, so one instance is enough.
+THIN_BORDER = ExcelBorders.thin_border()
+HEADER_BORDER = ExcelBorders.header_border()
+
+HEADER_ALIGN = Alignment(horizontal='center', vertical='center', wrap_text=True)
+ALIGN_LEFT_NOWRAP = Alignment(horizontal='left', vertical='top', wrap_text=False)
+ALIGN_LEFT_WRAP = Alignment(horizontal='left', vertical='top', wrap_text=True)
+ALIGN_RIGHT = Alignment(horizontal='right', vertical='top', wrap_text=False)
+ALIGN_CENTER = Alignment(horizontal='center', vertical='top', wrap_text=False)
+
+# Summary sheet sections (banners, section titles, centred counts)
+ALIGN_SECTION = Alignment(horizontal='left', vertical='center')
+ALIGN_MIDDLE = Alignment(horizontal='center', vertical='center')
+ALIGN_HCENTER = Alignment(horizontal='center')
+
+HEADER_FONT = _font(name='Calibri', size=11, bold=True, color=ExcelTheme.HEADER_TEXT)
+HEADER_FILL = _solid_fill(ExcelTheme.HEADER_BG)
+EVEN_FILL = _solid_fill(ExcelTheme.ROW_EVEN)
+ODD_FILL = _solid_fill(ExcelTheme.ROW_ODD)
+
+# (horizontal, wrap_text) as returned by CellAlignmentManager._get_alignment
+_ALIGNMENTS = {
+    ('left', False): ALIGN_LEFT_NOWRAP,
+    ('left', True): ALIGN_LEFT_WRAP,
+    ('right', False): ALIGN_RIGHT,
+    ('center', False): ALIGN_CENTER,
+}
+
+@dataclass
+class HeaderMeta:
+    """
+     Per-column header classification
+
+    Built once per sheet by HeaderMeta.from_worksheet and shared by the
+    formatters, so the header row is read and classified only once.
+    """
+    idx: int                    # 1-based column index
+    letter: str                 # Column letter
+    raw: str                    # Header text as written
+    lower: str                  # Lowercased header (classifier input)
+    col_type: str               # IntelligentColumnSizer type ("" if unknown)
+    number_format: str          # NumberFormatter format ("" if none)
+    is_percentage: bool         # Percentage column (0-100 values get scaled)
+
+    @staticmethod
+    def from_worksheet(worksheet, header_row: int = 1) -> List['HeaderMeta']:
+        """Classify every non-empty header cell of a worksheet"""
+        metas = []
+        for col_idx, cell in enumerate(worksheet[header_row], 1):
+            if not cell.value:
+                continue
+            raw = str(cell.value)
+            lower = raw.lower()
+            metas.append(HeaderMeta(
+                idx=col_idx,
+                letter=_col_letter(col_idx),
+                raw=raw,
+                lower=lower,
+                col_type=IntelligentColumnSizer._detect_column_type(raw),
+                number_format=NumberFormatter._detect_format(lower),
+                is_percentage=NumberFormatter._is_percentage_header(lower)
+            ))
+        return metas
+
 class IntelligentColumnSizer:
     """
      INTELLIGENT COLUMN WIDTH CALCULATOR
@@ -219,6 +472,32 @@ class IntelligentColumnSizer:
     WIDTH_PERCENTAGE = 10      # Percentages
     WIDTH_DATE = 20            # Dates/timestamps
 
+    # Values up to this length are never affected by the URL/SQL/JSON caps
+    SHORT_TEXT_CAP = min(WIDTH_URL, WIDTH_SQL, WIDTH_DESCRIPTION)
+
+    # Column types whose width does not depend on content
+    FIXED_WIDTH_TYPES = frozenset(('count', 'percentage', 'status'))
+
+    # Ordered (keyword, type) lookups - first hit wins, same priority as before
+    _TYPE_KEYWORDS_PRIMARY = (
+        ('status', 'status'), ('state', 'status'), ('type', 'status'),
+        ('level', 'status'), ('severity', 'status'), ('impact', 'status'),
+        ('count', 'count'), ('total', 'count'), ('number', 'count'),
+        ('depth', 'count'), ('sequence', 'count'),
+        ('percentage', 'percentage'),
+    )
+    _TYPE_KEYWORDS_SECONDARY = (
+        ('date', 'date'), ('time', 'date'), ('timestamp', 'date'),
+        ('created', 'date'), ('modified', 'date'),
+        ('name', 'name'), ('pipeline', 'name'), ('dataset', 'name'),
+        ('activity', 'name'), ('trigger', 'name'),
+        ('description', 'description'), ('details', 'description'),
+        ('message', 'description'), ('reason', 'description'),
+        ('sql', 'sql'), ('query', 'sql'), ('script', 'sql'), ('command', 'sql'),
+        ('url', 'url'), ('path', 'url'), ('file', 'url'),
+        ('location', 'url'), ('link', 'url'),
+    )
+
     @classmethod
     def calculate_column_width(cls, column_cells, header_name: str = "") -> int:
         """
@@ -234,38 +513,72 @@ class IntelligentColumnSizer:
 
         col_type = cls._detect_column_type(header_name)
 
-        if col_type:
-            base_width = cls._get_type_width(col_type)
+        if col_type in cls.FIXED_WIDTH_TYPES:
+            return cls._get_type_width(col_type)
 
-            if col_type in ['count', 'percentage', 'status']:
-                return base_width
-        else:
-            base_width = cls.DEFAULT_WIDTH
+        max_length, has_multiline = cls.scan_values(cell.value for cell in column_cells)
+
+        return cls._width_from_length(col_type, max_length, has_multiline)
+
+    @classmethod
+    def scan_values(cls, values) -> Tuple[int, bool]:
+        """
+         Longest display length and multiline flag for a column of values
+
+        Args:
+            values: Iterable of raw cell values (None is skipped)
 
+        Returns:
+            Tuple of (max_length, has_multiline)
+        """
+        short_cap = cls.SHORT_TEXT_CAP
+        measure = cls._measure_value
         max_length = 0
         has_multiline = False
 
-        for cell in column_cells:
-            if cell.value is None:
+        for value in values:
+            if value is None:
                 continue
+            if type(value) is str and len(value) <= short_cap and '\n' not in value:
+                length = len(value)
+            else:
+                length, multiline = measure(value)
+                if multiline:
+                    has_multiline = True
+            if length > max_length:
+                max_length = length
 
-            cell_value = str(cell.value)
+        return max_length, has_multiline
 
-            if '\n' in cell_value:
-                has_multiline = True
-                lines = cell_value.split('\n')
-                cell_length = max(len(line) for line in lines)
-            else:
-                cell_length = len(cell_value)
+    @classmethod
+    def _measure_value(cls, value) -> Tuple[int, bool]:
+        """Display length of a single value and whether it spans multiple lines"""
+        cell_value = value if type(value) is str else str(value)
+
+        if '\n' in cell_value:
+            multiline = True
+            cell_length = max(map(len, cell_value.split('\n')))
+        else:
+            multiline = False
+            cell_length = len(cell_value)
 
-            if cls._is_url(cell_value):
-                cell_length = min(cell_length, cls.WIDTH_URL)
-            elif cls._is_sql(cell_value):
-                cell_length = min(cell_length, cls.WIDTH_SQL)
-            elif cls._is_json(cell_value):
-                cell_length = min(cell_length, cls.WIDTH_DESCRIPTION)
+        # URL/SQL/JSON caps can only shorten values longer than the smallest cap
+        if cell_length <= cls.SHORT_TEXT_CAP:
+            return cell_length, multiline
 
-            max_length = max(max_length, cell_length)
+        if cls._is_url(cell_value):
+            cell_length = min(cell_length, cls.WIDTH_URL)
+        elif cls._is_sql(cell_value):
+            cell_length = min(cell_length, cls.WIDTH_SQL)
+        elif cls._is_json(cell_value):
+            cell_length = min(cell_length, cls.WIDTH_DESCRIPTION)
+
+        return cell_length, multiline
+
+    @classmethod
+    def _width_from_length(cls, col_type: str, max_length: int, has_multiline: bool) -> int:
+        """Turn the longest measured value of a column into its final width"""
+        base_width = cls._get_type_width(col_type) if col_type else cls.DEFAULT_WIDTH
 
         calculated_width = max_length + 2
 
@@ -280,6 +593,7 @@ class IntelligentColumnSizer:
         return final_width
 
     @classmethod
+    @functools.lru_cache(maxsize=1024)
     def _detect_column_type(cls, header: str) -> str:
         """Detect column type from header name"""
         if not header:
@@ -287,31 +601,14 @@ class IntelligentColumnSizer:
 
         header_lower = header.lower()
 
-        if any(x in header_lower for x in ['status', 'state', 'type', 'level', 'severity', 'impact']):
-            return 'status'
-
-        if any(x in header_lower for x in ['count', 'total', 'number', 'depth', 'sequence']):
-            return 'count'
+        col_type = _first_keyword(header_lower, cls._TYPE_KEYWORDS_PRIMARY)
+        if col_type:
+            return col_type
 
-        if 'percentage' in header_lower or header_lower.endswith('%'):
+        if header_lower.endswith('%'):
             return 'percentage'
 
-        if any(x in header_lower for x in ['date', 'time', 'timestamp', 'created', 'modified']):
-            return 'date'
-
-        if any(x in header_lower for x in ['name', 'pipeline', 'dataset', 'activity', 'trigger']):
-            return 'name'
-
-        if any(x in header_lower for x in ['description', 'details', 'message', 'reason']):
-            return 'description'
-
-        if any(x in header_lower for x in ['sql', 'query', 'script', 'command']):
-            return 'sql'
-
-        if any(x in header_lower for x in ['url', 'path', 'file', 'location', 'link']):
-            return 'url'
-
-        return ""
+        return _first_keyword(header_lower, cls._TYPE_KEYWORDS_SECONDARY) or ""
 
     @classmethod
     def _get_type_width(cls, col_type: str) -> int:
@@ -328,23 +625,24 @@ class IntelligentColumnSizer:
         }
         return type_widths.get(col_type, cls.DEFAULT_WIDTH)
 
+    # Case-insensitive prefix match; avoids upper() on whole (often long) SQL strings
+    _SQL_RE = re.compile(r'(?:SELECT|INSERT|UPDATE|DELETE|CREATE|ALTER|DROP|EXEC)', re.IGNORECASE)
+    _URL_PREFIXES = ('http://', 'https://', 'ftp://', '//')
+
     @staticmethod
     def _is_url(text: str) -> bool:
         """Check if text is a URL"""
-        return text.startswith(('http://', 'https://', 'ftp://', '//'))
+        return text.startswith(IntelligentColumnSizer._URL_PREFIXES)
 
     @staticmethod
     def _is_sql(text: str) -> bool:
         """Check if text is SQL"""
-        sql_keywords = ['SELECT', 'INSERT', 'UPDATE', 'DELETE', 'CREATE', 'ALTER', 'DROP', 'EXEC']
-        text_upper = text.upper()
-        return any(text_upper.startswith(kw) for kw in sql_keywords)
+        return IntelligentColumnSizer._SQL_RE.match(text, 0, 8) is not None
 
     @staticmethod
     def _is_json(text: str) -> bool:
         """Check if text is JSON"""
-        return (text.startswith('{') and text.endswith('}')) or \
-               (text.startswith('[') and text.endswith(']'))
+        return text[:1] + text[-1:] in ('{}', '[]')
 
 class NumberFormatter:
     """
@@ -362,65 +660,96 @@ class NumberFormatter:
     FORMAT_DATETIME = 'yyyy-mm-dd hh:mm:ss'     # 2024-01-15 14:30:00
     FORMAT_TIME = 'hh:mm:ss'                    # 14:30:00
 
+    # Ordered (keyword, excluded_keyword, format) lookups - first hit wins
+    _FORMAT_KEYWORDS = (
+        ('count', None, FORMAT_INTEGER), ('total', None, FORMAT_INTEGER),
+        ('number', None, FORMAT_INTEGER), ('depth', None, FORMAT_INTEGER),
+        ('sequence', None, FORMAT_INTEGER),
+        ('cost', None, FORMAT_CURRENCY), ('price', None, FORMAT_CURRENCY),
+        ('amount', None, FORMAT_CURRENCY), ('fee', None, FORMAT_CURRENCY),
+        ('date', 'update', FORMAT_DATE),
+        ('timestamp', None, FORMAT_DATETIME), ('datetime', None, FORMAT_DATETIME),
+        ('created', None, FORMAT_DATETIME), ('modified', None, FORMAT_DATETIME),
+        ('time', 'runtime', FORMAT_TIME),
+        ('score', None, FORMAT_DECIMAL), ('rating', None, FORMAT_DECIMAL),
+        ('average', None, FORMAT_DECIMAL), ('mean', None, FORMAT_DECIMAL),
+    )
+
     @classmethod
-    def apply_number_format(cls, worksheet, header_row: int = 1):
+    def apply_number_format(cls, worksheet, header_row: int = 1,
+                            metas: Optional[List[HeaderMeta]] = None):
         """
          Apply number formatting to entire worksheet
 
         Args:
             worksheet: openpyxl worksheet
             header_row: Row number of headers (1-based)
+            metas: Pre-built header metadata (read from the sheet if omitted)
         """
 
-        headers = {}
-        for col_idx, cell in enumerate(worksheet[header_row], 1):
-            if cell.value:
-                headers[col_idx] = str(cell.value).lower()
+        if metas is None:
+            metas = HeaderMeta.from_worksheet(worksheet, header_row)
+
+        max_row = worksheet.max_row
 
-        for col_idx, header in headers.items():
-            col_letter = get_column_letter(col_idx)
+        for meta in metas:
 
-            number_format = cls._detect_format(header)
+            number_format = meta.number_format
+            col_idx = meta.idx
 
             if number_format:
 
-                for row in range(header_row + 1, worksheet.max_row + 1):
-                    cell = worksheet[f'{col_letter}{row}']
+                scale = (meta.is_percentage
+                         and cls._needs_pct_scaling(worksheet, col_idx, header_row + 1))
 
-                    if cell.value is not None:
+                for (cell,) in worksheet.iter_rows(min_row=header_row + 1, max_row=max_row,
+                                                   min_col=col_idx, max_col=col_idx):
 
-                        if 'percentage' in header or header.endswith('%'):
-                            if isinstance(cell.value, (int, float)):
+                    value = cell.value
+                    if value is not None:
 
-                                if cell.value > 1:
-                                    cell.value = cell.value / 100
+                        if scale and isinstance(value, (int, float)) and value > 1:
+                            cell.value = value / 100
 
                         cell.number_format = number_format
 
+    PCT_SAMPLE_SIZE = 20
+
+    @staticmethod
+    def _is_percentage_header(header: str) -> bool:
+        """Check if a (lowercased) header names a percentage column"""
+        return 'percentage' in header or header.endswith('%')
+
     @classmethod
+    def _needs_pct_scaling(cls, worksheet, col_idx: int, first_row: int) -> bool:
+        """
+        Check whether a percentage column holds 0-100 values that need /100
+
+        Samples the first PCT_SAMPLE_SIZE numeric values; if none of them is
+        above 1 the column is treated as already normalized and left alone.
+        """
+        sampled = 0
+        for (value,) in worksheet.iter_rows(min_row=first_row, max_row=worksheet.max_row,
+                                            min_col=col_idx, max_col=col_idx, values_only=True):
+            if isinstance(value, (int, float)):
+                if value > 1:
+                    return True
+                sampled += 1
+                if sampled >= cls.PCT_SAMPLE_SIZE:
+                    return False
+        return False
+
+    @classmethod
+    @functools.lru_cache(maxsize=1024)
     def _detect_format(cls, header: str) -> str:
         """Detect appropriate number format from header"""
 
         if 'percentage' in header or header.endswith('%'):
             return cls.FORMAT_PERCENTAGE
 
-        if any(x in header for x in ['count', 'total', 'number', 'depth', 'sequence']):
-            return cls.FORMAT_INTEGER
-
-        if any(x in header for x in ['cost', 'price', 'amount', 'fee']):
-            return cls.FORMAT_CURRENCY
-
-        if 'date' in header and 'update' not in header:
-            return cls.FORMAT_DATE
-
-        if any(x in header for x in ['timestamp', 'datetime', 'created', 'modified']):
-            return cls.FORMAT_DATETIME
-
-        if 'time' in header and 'runtime' not in header:
-            return cls.FORMAT_TIME
-
-        if any(x in header for x in ['score', 'rating', 'average', 'mean']):
-            return cls.FORMAT_DECIMAL
+        for keyword, excluded, number_format in cls._FORMAT_KEYWORDS:
+            if keyword in header and (excluded is None or excluded not in header):
+                return number_format
 
         return ""
 
@@ -431,8 +760,21 @@ class CellAlignmentManager:
     Applies professional alignment based on content type
     """
 
+    _RIGHT_KEYWORDS = ('count', 'total', 'number', 'percentage', '%')
+
+    # Ordered (keyword, (horizontal, wrap)) lookups for text values
+    _TEXT_KEYWORDS = (
+        ('sql', ('left', True)), ('query', ('left', True)),
+        ('description', ('left', True)), ('details', ('left', True)),
+        ('reason', ('left', True)), ('message', ('left', True)),
+        ('status', ('center', False)), ('state', ('center', False)),
+        ('type', ('center', False)), ('impact', ('center', False)),
+        ('severity', ('center', False)), ('level', ('center', False)),
+    )
+
     @staticmethod
-    def apply_alignment(worksheet, header_row: int = 1):
+    def apply_alignment(worksheet, header_row: int = 1,
+                        metas: Optional[List[HeaderMeta]] = None):
         """
          Apply intelligent alignment to worksheet
 
@@ -445,32 +787,24 @@ class CellAlignmentManager:
 
         for cell in worksheet[header_row]:
             if cell.value:
-                cell.alignment = Alignment(
-                    horizontal='center',
-                    vertical='center',
-                    wrap_text=True
-                )
+                cell.alignment = HEADER_ALIGN
 
-        headers = {}
-        for col_idx, cell in enumerate(worksheet[header_row], 1):
-            if cell.value:
-                headers[col_idx] = str(cell.value).lower()
+        if metas is None:
+            metas = HeaderMeta.from_worksheet(worksheet, header_row)
 
-        for row_idx in range(header_row + 1, worksheet.max_row + 1):
-            for col_idx, header in headers.items():
-                col_letter = get_column_letter(col_idx)
-                cell = worksheet[f'{col_letter}{row_idx}']
+        if not metas:
+            return
+
+        max_col = metas[-1].idx
+        for row in worksheet.iter_rows(min_row=header_row + 1, max_row=worksheet.max_row,
+                                       min_col=1, max_col=max_col):
+            for meta in metas:
+                cell = row[meta.idx - 1]
 
                 if cell.value is None:
                     continue
 
-                h_align, wrap = CellAlignmentManager._get_alignment(header, cell.value)
-
-                cell.alignment = Alignment(
-                    horizontal=h_align,
-                    vertical='top',
-                    wrap_text=wrap
-                )
+                cell.alignment = _ALIGNMENTS[CellAlignmentManager._get_alignment(meta.lower, cell.value)]
 
     @staticmethod
     def _get_alignment(header: str, value: Any) -> Tuple[str, bool]:
@@ -484,21 +818,25 @@ class CellAlignmentManager:
         if isinstance(value, (int, float)):
             return ('right', False)
 
-        if any(x in header for x in ['count', 'total', 'number', 'percentage', '%']):
-            return ('right', False)
+        header_default = CellAlignmentManager._header_alignment(header)
 
-        value_str = str(value)
+        if header_default == ('right', False):
+            return header_default
 
-        if len(value_str) > 50:
+        if len(str(value)) > 50:
             return ('left', True)
 
-        if any(x in header for x in ['sql', 'query', 'description', 'details', 'reason', 'message']):
-            return ('left', True)
+        return header_default
 
-        if any(x in header for x in ['status', 'state', 'type', 'impact', 'severity', 'level']):
-            return ('center', False)
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _header_alignment(header: str) -> Tuple[str, bool]:
+        """Alignment implied by the header alone (cached per header)"""
+
+        if any(x in header for x in CellAlignmentManager._RIGHT_KEYWORDS):
+            return ('right', False)
 
-        return ('left', False)
+        return _first_keyword(header, CellAlignmentManager._TEXT_KEYWORDS) or ('left', False)
 
 class BorderApplier:
     """
@@ -518,12 +856,15 @@ class BorderApplier:
         """
 
         for cell in worksheet[header_row]:
-            cell.border = ExcelBorders.header_border()
+            cell.border = HEADER_BORDER
 
-        for row in worksheet.iter_rows(min_row=header_row + 1, max_row=worksheet.max_row,
-                                       min_col=1, max_col=worksheet.max_column):
+        max_row = worksheet.max_row
+        max_col = worksheet.max_column
+
+        for row in worksheet.iter_rows(min_row=header_row + 1, max_row=max_row,
+                                       min_col=1, max_col=max_col):
             for cell in row:
-                cell.border = ExcelBorders.thin_border()
+                cell.border = THIN_BORDER
 
 class AlternatingRowShader:
     """
@@ -533,35 +874,42 @@ class AlternatingRowShader:
     """
 
     @staticmethod
-    def apply_shading(worksheet, header_row: int = 1):
+    def apply_shading(worksheet, header_row: int = 1, force: bool = True):
         """
          Apply alternating row colors
 
         Even rows: White
         Odd rows: Light gray
-        """
 
-        even_fill = PatternFill(
-            start_color=ExcelTheme.ROW_EVEN,
-            end_color=ExcelTheme.ROW_EVEN,
-            fill_type='solid'
-        )
-
-        odd_fill = PatternFill(
-            start_color=ExcelTheme.ROW_ODD,
-            end_color=ExcelTheme.ROW_ODD,
-            fill_type='solid'
-        )
+        Args:
+            worksheet: openpyxl worksheet
+            header_row: Row number of headers
+            force: Overwrite every cell fill; pass False to keep fills
+                   that were already set on the sheet
+        """
 
-        for row_idx in range(header_row + 1, worksheet.max_row + 1):
+        max_row = worksheet.max_row
+        max_col = worksheet.max_column
 
-            fill = even_fill if (row_idx - header_row) % 2 == 0 else odd_fill
+        for row_idx, row in enumerate(worksheet.iter_rows(min_row=header_row + 1,
+                                                          max_row=max_row,
+                                                          min_col=1, max_col=max_col),
+                                      start=header_row + 1):
 
-            for col_idx in range(1, worksheet.max_column + 1):
-                cell = worksheet.cell(row_idx, col_idx)
+            fill = EVEN_FILL if (row_idx - header_row) & 1 == 0 else ODD_FILL
 
-                if not cell.fill or cell.fill.start_color.rgb == '00000000':
+            if force:
+                for cell in row:
                     cell.fill = fill
+            else:
+                for cell in row:
+                    if AlternatingRowShader._has_no_fill(cell):
+                        cell.fill = fill
+
+    @staticmethod
+    def _has_no_fill(cell) -> bool:
+        """True if the cell carries no fill (unstyled cells skip the style lookup)"""
+        return not cell.has_style or cell.fill.start_color.rgb == '00000000'
 
 class MasterFormatter:
     """
@@ -570,6 +918,10 @@ class MasterFormatter:
     Orchestrates all formatting operations in optimal order
     """
 
+    # Above this many cells, row shading and borders come from an Excel table
+    # style instead of per-cell fills/borders
+    BIG_SHEET_CELLS = 250_000
+
     @staticmethod
     def format_worksheet(worksheet, sheet_name: str = "", header_row: int = 1,
                         enable_features: Dict[str, bool] = None):
@@ -603,20 +955,37 @@ class MasterFormatter:
 
         try:
 
-            if enable_features.get('column_sizing', True):
-                MasterFormatter._apply_column_sizing(worksheet, header_row)
-
-            if enable_features.get('number_format', True):
-                NumberFormatter.apply_number_format(worksheet, header_row)
+            max_row, max_col = _sheet_bounds(worksheet)
 
-            if enable_features.get('alignment', True):
-                CellAlignmentManager.apply_alignment(worksheet, header_row)
+            # Nothing below the header: size the columns, style the header row and stop
+            if max_row <= header_row or max_col == 0:
+                if max_col and enable_features.get('column_sizing', True):
+                    MasterFormatter._apply_column_sizing(
+                        worksheet, header_row, HeaderMeta.from_worksheet(worksheet, header_row))
+                if enable_features.get('header_style', True):
+                    MasterFormatter._apply_header_style(worksheet, header_row)
+                return
 
-            if enable_features.get('row_shading', True):
-                AlternatingRowShader.apply_shading(worksheet, header_row)
+            metas = HeaderMeta.from_worksheet(worksheet, header_row)
 
-            if enable_features.get('borders', True):
-                BorderApplier.apply_borders(worksheet, header_row)
+            if enable_features.get('column_sizing', True):
+                MasterFormatter._apply_column_sizing(worksheet, header_row, metas)
+
+            row_shading = enable_features.get('row_shading', True)
+            borders = enable_features.get('borders', True)
+
+            if ((row_shading or borders)
+                    and (max_row - header_row) * max_col > MasterFormatter.BIG_SHEET_CELLS
+                    and MasterFormatter._apply_big_sheet_table(worksheet, header_row, metas)):
+                row_shading = borders = False
+
+            MasterFormatter._apply_cell_styles(
+                worksheet, header_row, metas,
+                number_format=enable_features.get('number_format', True),
+                alignment=enable_features.get('alignment', True),
+                row_shading=row_shading,
+                borders=borders
+            )
 
             if enable_features.get('header_style', True):
                 MasterFormatter._apply_header_style(worksheet, header_row)
@@ -625,41 +994,173 @@ class MasterFormatter:
             print(f"  Warning: Formatting failed for {sheet_name}: {e}")
 
     @staticmethod
-    def _apply_column_sizing(worksheet, header_row: int):
-        """Apply intelligent column sizing"""
-        for column in worksheet.columns:
-            col_letter = get_column_letter(column[0].column)
+    def _apply_big_sheet_table(worksheet, header_row: int, metas: List[HeaderMeta]) -> bool:
+        """
+         Big-sheet fast path: let an Excel table style draw stripes and borders
 
-            header_cell = worksheet[f'{col_letter}{header_row}']
-            header_name = str(header_cell.value) if header_cell.value else ""
+        Only used when the header row is a valid table header (every column
+        named, names unique). Returns True if the table was added.
+        """
 
-            width = IntelligentColumnSizer.calculate_column_width(column, header_name)
+        max_col = worksheet.max_column
+        names = [meta.lower for meta in metas]
+        if len(metas) != max_col or len(set(names)) != len(names):
+            return False
 
-            worksheet.column_dimensions[col_letter].width = width
+        base = "Table_" + re.sub(r'[^A-Za-z0-9_]', '_', worksheet.title)
+        existing = {name for ws in worksheet.parent.worksheets for name in ws.tables}
+        table_name = base
+        suffix = 1
+        while table_name in existing:
+            suffix += 1
+            table_name = f"{base}_{suffix}"
+
+        ref = f"A{header_row}:{_col_letter(max_col)}{worksheet.max_row}"
+        sheet_filter = worksheet.auto_filter.ref
+        try:
+            # The table carries its own filter; a sheet autoFilter over the same range
+            # (set by the analyzer's _format_sheet) makes Excel repair the file
+            worksheet.auto_filter.ref = None
+            # Light style keeps big sheets close to the plain white look of the others
+            ExcelTableFormatter.create_table(worksheet, table_name, ref,
+                                             style=ExcelTableFormatter.STYLE_LIGHT)
+        except Exception as e:
+            worksheet.auto_filter.ref = sheet_filter
+            print(f"  Warning: Table fast path failed for {worksheet.title}: {e}")
+            return False
+        return True
 
     @staticmethod
-    def _apply_header_style(worksheet, header_row: int):
-        """Apply professional header styling"""
+    def _apply_cell_styles(worksheet, header_row: int, metas: Optional[List[HeaderMeta]] = None,
+                           number_format: bool = True, alignment: bool = True,
+                           row_shading: bool = True, borders: bool = True):
+        """
+         Apply number formats, alignment, shading and borders in one pass
 
-        header_font = Font(
-            name='Calibri',
-            size=11,
-            bold=True,
-            color=ExcelTheme.HEADER_TEXT
-        )
+        Same result as running NumberFormatter, CellAlignmentManager,
+        AlternatingRowShader and BorderApplier one after another, but every
+        cell is visited once and style objects are shared instead of rebuilt.
+        """
 
-        header_fill = PatternFill(
-            start_color=ExcelTheme.HEADER_BG,
-            end_color=ExcelTheme.HEADER_BG,
-            fill_type='solid'
-        )
+        if not (number_format or alignment or row_shading or borders):
+            return
+
+        max_row = worksheet.max_row
+        max_col = worksheet.max_column
+
+        # Header row: centered alignment + thick bottom border
+        for cell in worksheet[header_row]:
+            if alignment and cell.value:
+                cell.alignment = HEADER_ALIGN
+            if borders:
+                cell.border = HEADER_BORDER
+
+        if metas is None:
+            metas = HeaderMeta.from_worksheet(worksheet, header_row)
+
+        # Per-column metadata, indexed 0..max_col-1
+        headers: List[Optional[str]] = [None] * max_col
+        formats: List[str] = [""] * max_col
+        scale_pct: List[bool] = [False] * max_col
+        for meta in metas:
+            col = meta.idx - 1
+            if col < max_col:
+                headers[col] = meta.lower
+                if number_format:
+                    formats[col] = meta.number_format
+                    scale_pct[col] = (meta.is_percentage
+                                      and NumberFormatter._needs_pct_scaling(worksheet, meta.idx,
+                                                                             header_row + 1))
+
+        has_no_fill = AlternatingRowShader._has_no_fill
+
+        for row_idx, row in enumerate(worksheet.iter_rows(min_row=header_row + 1, max_row=max_row,
+                                                          min_col=1, max_col=max_col),
+                                      start=header_row + 1):
+            fill = EVEN_FILL if (row_idx - header_row) & 1 == 0 else ODD_FILL
+
+            for col, cell in enumerate(row):
+                header = headers[col]
+                value = cell.value
+
+                if header is not None and value is not None:
+                    fmt = formats[col]
+                    if fmt:
+                        if scale_pct[col] and isinstance(value, (int, float)) and value > 1:
+                            value = value / 100
+                            cell.value = value
+                        cell.number_format = fmt
+
+                    if alignment:
+                        cell.alignment = _ALIGNMENTS[CellAlignmentManager._get_alignment(header, value)]
+
+                # Preserve fills already on the sheet (e.g. the styled Summary sheet)
+                if row_shading and has_no_fill(cell):
+                    cell.fill = fill
+
+                if borders:
+                    cell.border = THIN_BORDER
+
+    @staticmethod
+    def _apply_column_sizing(worksheet, header_row: int, metas: Optional[List[HeaderMeta]] = None):
+        """Apply intelligent column sizing (single values-only pass over the sheet)"""
+        sizer = IntelligentColumnSizer
+        max_row = worksheet.max_row
+        max_col = worksheet.max_column
+        column_dimensions = worksheet.column_dimensions
+
+        if metas is None:
+            metas = HeaderMeta.from_worksheet(worksheet, header_row)
+
+        col_types = [""] * max_col
+        for meta in metas:
+            if meta.idx <= max_col:
+                col_types[meta.idx - 1] = meta.col_type
+
+        measure = [t not in sizer.FIXED_WIDTH_TYPES for t in col_types]
+        max_len = [0] * max_col
+        has_multiline = [False] * max_col
+
+        # Only content-sized columns are read, and only up to the last of them
+        measured = [i for i, flag in enumerate(measure) if flag]
+
+        if measured:
+            short_cap = sizer.SHORT_TEXT_CAP
+            measure_value = sizer._measure_value
+            for row in worksheet.iter_rows(min_row=1, max_row=max_row,
+                                           max_col=measured[-1] + 1, values_only=True):
+                for i in measured:
+                    value = row[i]
+                    if value is None:
+                        continue
+                    # Fast path: short single-line strings need no classification
+                    if type(value) is str and len(value) <= short_cap and '\n' not in value:
+                        length = len(value)
+                    else:
+                        length, multiline = measure_value(value)
+                        if multiline:
+                            has_multiline[i] = True
+                    if length > max_len[i]:
+                        max_len[i] = length
+
+        for i, col_type in enumerate(col_types):
+            if measure[i]:
+                width = sizer._width_from_length(col_type, max_len[i], has_multiline[i])
+            else:
+                width = sizer._get_type_width(col_type)
+            column_dimensions[_col_letter(i + 1)].width = width
+
+    @staticmethod
+    def _apply_header_style(worksheet, header_row: int):
+        """Apply professional header styling"""
 
         for cell in worksheet[header_row]:
             if cell.value:
-                cell.font = header_font
-                cell.fill = header_fill
+                cell.font = HEADER_FONT
+                cell.fill = HEADER_FILL
 
-print(" Part 1/6 loaded: Core Enhancement Framework")
+if _DEBUG:
+    print(" Part 1/6 loaded: Core Enhancement Framework")
 """Excel Enhancement Module - Professional Excel formatting and styling capabilities"""
 
 class DataBarFormatter:
@@ -690,9 +1191,25 @@ class DataBarFormatter:
         'border_color': "C0392B"
     }
 
+    _DATA_BAR_KEYWORDS = (
+        'count', 'total', 'usage', 'number', 'activities',
+        'references', 'consumers', 'depth', 'blastradius'
+    )
+
+    # Ordered (keyword, scheme) lookups - first hit wins
+    _SCHEME_KEYWORDS = (
+        ('error', RED_GRADIENT), ('warning', RED_GRADIENT),
+        ('orphaned', RED_GRADIENT), ('broken', RED_GRADIENT),
+        ('usage', GREEN_GRADIENT), ('used', GREEN_GRADIENT),
+        ('success', GREEN_GRADIENT), ('complete', GREEN_GRADIENT),
+        ('pending', ORANGE_GRADIENT), ('medium', ORANGE_GRADIENT),
+        ('depth', ORANGE_GRADIENT),
+    )
+
     @staticmethod
     def add_data_bars(worksheet, column_letter: str, start_row: int, end_row: int,
-                     color_scheme: Dict = None, show_value: bool = True):
+                     color_scheme: Dict = None, show_value: bool = True,
+                     sink: Optional[list] = None):
         """
          Add data bars to a column
 
@@ -703,6 +1220,7 @@ class DataBarFormatter:
             end_row: Last data row
             color_scheme: Color scheme dict (default: blue)
             show_value: Show numeric value alongside bar
+            sink: Collect (range, rule) pairs here instead of adding them to the sheet
         """
 
         if color_scheme is None:
@@ -721,10 +1239,17 @@ class DataBarFormatter:
             maxLength=100
         )
 
-        worksheet.conditional_formatting.add(cell_range, data_bar)
+        if sink is not None:
+            sink.append((cell_range, data_bar))
+        else:
+            worksheet.conditional_formatting.add(cell_range, data_bar)
 
     @staticmethod
-    def auto_add_data_bars(worksheet, header_row: int = 1):
+    def auto_add_data_bars(worksheet, header_row: int = 1,
+                           metas: Optional[List[HeaderMeta]] = None,
+                           max_row: Optional[int] = None,
+                           sink: Optional[list] = None,
+                           plan: Optional['WorksheetPlan'] = None):
         """
          Automatically add data bars to appropriate columns
 
@@ -734,58 +1259,37 @@ class DataBarFormatter:
         - Numeric metrics
         """
 
-        headers = {}
-        for col_idx, cell in enumerate(worksheet[header_row], 1):
-            if cell.value:
-                headers[col_idx] = str(cell.value).lower()
-
-        for col_idx, header in headers.items():
-
-            if DataBarFormatter._should_have_data_bar(header):
+        if plan is None:
+            plan = WorksheetPlanner.plan(worksheet, header_row, metas, max_row)
 
-                col_letter = get_column_letter(col_idx)
-                start_row = header_row + 1
-                end_row = worksheet.max_row
+        for column in plan.columns:
 
-                if end_row < start_row:
-                    continue
-
-                color_scheme = DataBarFormatter._get_color_scheme(header)
+            if column.data_bar_scheme:
 
                 DataBarFormatter.add_data_bars(
-                    worksheet, col_letter, start_row, end_row,
-                    color_scheme=color_scheme,
-                    show_value=True
+                    worksheet, column.letter, plan.start_row, plan.end_row,
+                    color_scheme=column.data_bar_scheme,
+                    show_value=True,
+                    sink=sink
                 )
 
     @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def _should_have_data_bar(header: str) -> bool:
         """Check if column should have data bars"""
 
-        data_bar_keywords = [
-            'count', 'total', 'usage', 'number', 'activities',
-            'references', 'consumers', 'depth', 'blastradius'
-        ]
-
         if 'percentage' in header or header.endswith('%'):
             return False
 
-        return any(keyword in header for keyword in data_bar_keywords)
+        return any(keyword in header for keyword in DataBarFormatter._DATA_BAR_KEYWORDS)
 
     @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def _get_color_scheme(header: str) -> Dict:
         """Get appropriate color scheme for column"""
 
-        if any(x in header for x in ['error', 'warning', 'orphaned', 'broken']):
-            return DataBarFormatter.RED_GRADIENT
-
-        if any(x in header for x in ['usage', 'used', 'success', 'complete']):
-            return DataBarFormatter.GREEN_GRADIENT
-
-        if any(x in header for x in ['pending', 'medium', 'depth']):
-            return DataBarFormatter.ORANGE_GRADIENT
-
-        return DataBarFormatter.BLUE_GRADIENT
+        return (_first_keyword(header, DataBarFormatter._SCHEME_KEYWORDS)
+                or DataBarFormatter.BLUE_GRADIENT)
 
 class IconSetFormatter:
     """
@@ -802,9 +1306,24 @@ class IconSetFormatter:
     STARS = "3Stars"                         # ☆★★
     TRIANGLES = "3Triangles"                 # ▽△▲
 
+    # Read-only icon configs, shared by the cached _get_icon_config
+    _ICON_COMPLEXITY = MappingProxyType({'style': TRIANGLES, 'reverse': True})       # Green for low complexity
+    _ICON_IMPACT = MappingProxyType({'style': TRAFFIC_LIGHTS, 'reverse': False})     # Red for high impact
+    _ICON_STATUS = MappingProxyType({'style': SYMBOLS, 'reverse': False})
+    _ICON_DEPTH = MappingProxyType({'style': ARROWS, 'reverse': False})              # Up arrow for high depth
+
+    # Ordered (keyword, icon config) lookups - first hit wins
+    _ICON_KEYWORDS = (
+        ('complexity', _ICON_COMPLEXITY),
+        ('impact', _ICON_IMPACT), ('severity', _ICON_IMPACT), ('priority', _ICON_IMPACT),
+        ('status', _ICON_STATUS), ('state', _ICON_STATUS),
+        ('depth', _ICON_DEPTH), ('level', _ICON_DEPTH),
+    )
+
     @staticmethod
     def add_icon_set(worksheet, column_letter: str, start_row: int, end_row: int,
-                    icon_style: str = None, reverse: bool = False):
+                    icon_style: str = None, reverse: bool = False,
+                    sink: Optional[list] = None):
         """
          Add icon set to a column
 
@@ -815,6 +1334,7 @@ class IconSetFormatter:
             end_row: Last data row
             icon_style: Icon set style (default: traffic lights)
             reverse: Reverse icon order (green=low, red=high)
+            sink: Collect (range, rule) pairs here instead of adding them to the sheet
         """
 
         if icon_style is None:
@@ -830,10 +1350,17 @@ class IconSetFormatter:
             reverse=reverse
         )
 
-        worksheet.conditional_formatting.add(cell_range, icon_set)
+        if sink is not None:
+            sink.append((cell_range, icon_set))
+        else:
+            worksheet.conditional_formatting.add(cell_range, icon_set)
 
     @staticmethod
-    def auto_add_icon_sets(worksheet, header_row: int = 1):
+    def auto_add_icon_sets(worksheet, header_row: int = 1,
+                           metas: Optional[List[HeaderMeta]] = None,
+                           max_row: Optional[int] = None,
+                           sink: Optional[list] = None,
+                           plan: Optional['WorksheetPlan'] = None):
         """
          Automatically add icon sets to appropriate columns
 
@@ -843,58 +1370,28 @@ class IconSetFormatter:
         - Complexity columns
         """
 
-        headers = {}
-        for col_idx, cell in enumerate(worksheet[header_row], 1):
-            if cell.value:
-                headers[col_idx] = str(cell.value).lower()
+        if plan is None:
+            plan = WorksheetPlanner.plan(worksheet, header_row, metas, max_row)
 
-        for col_idx, header in headers.items():
+        for column in plan.columns:
 
-            icon_config = IconSetFormatter._get_icon_config(header)
+            icon_config = column.icon_config
 
             if icon_config:
-                col_letter = get_column_letter(col_idx)
-                start_row = header_row + 1
-                end_row = worksheet.max_row
-
-                if end_row < start_row:
-                    continue
 
                 IconSetFormatter.add_icon_set(
-                    worksheet, col_letter, start_row, end_row,
+                    worksheet, column.letter, plan.start_row, plan.end_row,
                     icon_style=icon_config['style'],
-                    reverse=icon_config['reverse']
+                    reverse=icon_config['reverse'],
+                    sink=sink
                 )
 
     @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def _get_icon_config(header: str) -> Optional[Dict]:
-        """Get icon configuration for column"""
-
-        if 'complexity' in header:
-            return {
-                'style': IconSetFormatter.TRIANGLES,
-                'reverse': True  # Green for low complexity
-            }
-
-        if any(x in header for x in ['impact', 'severity', 'priority']):
-            return {
-                'style': IconSetFormatter.TRAFFIC_LIGHTS,
-                'reverse': False  # Red for high impact
-            }
-
-        if 'status' in header or 'state' in header:
-            return {
-                'style': IconSetFormatter.SYMBOLS,
-                'reverse': False
-            }
-
-        if 'depth' in header or 'level' in header:
-            return {
-                'style': IconSetFormatter.ARROWS,
-                'reverse': False  # Up arrow for high depth
-            }
+        """Get icon configuration for column (shared read-only mapping)"""
 
-        return None
+        return _first_keyword(header, IconSetFormatter._ICON_KEYWORDS)
 
 class ColorScaleFormatter:
     """
@@ -926,9 +1423,18 @@ class ColorScaleFormatter:
         'max_color': "F8696B"    # Red
     }
 
+    _SCALE_PERCENT = MappingProxyType({'colors': WHITE_BLUE, 'use_midpoint': False})
+    _SCALE_COMPLEXITY = MappingProxyType({'colors': GREEN_YELLOW_RED, 'use_midpoint': True})
+    _SCALE_QUALITY = MappingProxyType({'colors': RED_YELLOW_GREEN, 'use_midpoint': True})
+
+    _SCALE_KEYWORDS = (
+        ('performance', _SCALE_QUALITY), ('efficiency', _SCALE_QUALITY), ('quality', _SCALE_QUALITY),
+    )
+
     @staticmethod
     def add_color_scale(worksheet, column_letter: str, start_row: int, end_row: int,
-                       color_scale: Dict = None, use_midpoint: bool = True):
+                       color_scale: Dict = None, use_midpoint: bool = True,
+                       sink: Optional[list] = None):
         """
          Add color scale to a column
 
@@ -939,6 +1445,7 @@ class ColorScaleFormatter:
             end_row: Last data row
             color_scale: Color scale dict
             use_midpoint: Use 3-color scale (True) or 2-color (False)
+            sink: Collect (range, rule) pairs here instead of adding them to the sheet
         """
 
         if color_scale is None:
@@ -966,10 +1473,17 @@ class ColorScaleFormatter:
                 end_color=color_scale['max_color']
             )
 
-        worksheet.conditional_formatting.add(cell_range, rule)
+        if sink is not None:
+            sink.append((cell_range, rule))
+        else:
+            worksheet.conditional_formatting.add(cell_range, rule)
 
     @staticmethod
-    def auto_add_color_scales(worksheet, header_row: int = 1):
+    def auto_add_color_scales(worksheet, header_row: int = 1,
+                              metas: Optional[List[HeaderMeta]] = None,
+                              max_row: Optional[int] = None,
+                              sink: Optional[list] = None,
+                              plan: Optional['WorksheetPlan'] = None):
         """
          Automatically add color scales to appropriate columns
 
@@ -979,52 +1493,34 @@ class ColorScaleFormatter:
         - Complexity columns
         """
 
-        headers = {}
-        for col_idx, cell in enumerate(worksheet[header_row], 1):
-            if cell.value:
-                headers[col_idx] = str(cell.value).lower()
+        if plan is None:
+            plan = WorksheetPlanner.plan(worksheet, header_row, metas, max_row)
 
-        for col_idx, header in headers.items():
+        for column in plan.columns:
 
-            scale_config = ColorScaleFormatter._get_scale_config(header)
+            scale_config = column.scale_config
 
             if scale_config:
-                col_letter = get_column_letter(col_idx)
-                start_row = header_row + 1
-                end_row = worksheet.max_row
-
-                if end_row < start_row:
-                    continue
 
                 ColorScaleFormatter.add_color_scale(
-                    worksheet, col_letter, start_row, end_row,
+                    worksheet, column.letter, plan.start_row, plan.end_row,
                     color_scale=scale_config['colors'],
-                    use_midpoint=scale_config['use_midpoint']
+                    use_midpoint=scale_config['use_midpoint'],
+                    sink=sink
                 )
 
     @staticmethod
+    @functools.lru_cache(maxsize=512)
     def _get_scale_config(header: str) -> Optional[Dict]:
-        """Get color scale configuration for column"""
+        """Get color scale configuration for column (shared, read-only mapping)"""
 
         if 'percentage' in header or header.endswith('%'):
-            return {
-                'colors': ColorScaleFormatter.WHITE_BLUE,
-                'use_midpoint': False
-            }
+            return ColorScaleFormatter._SCALE_PERCENT
 
         if 'complexity' in header and 'score' in header:
-            return {
-                'colors': ColorScaleFormatter.GREEN_YELLOW_RED,
-                'use_midpoint': True
-            }
-
-        if any(x in header for x in ['performance', 'efficiency', 'quality']):
-            return {
-                'colors': ColorScaleFormatter.RED_YELLOW_GREEN,
-                'use_midpoint': True
-            }
+            return ColorScaleFormatter._SCALE_COMPLEXITY
 
-        return None
+        return _first_keyword(header, ColorScaleFormatter._SCALE_KEYWORDS)
 
 class StatusFormatter:
     """
@@ -1034,9 +1530,55 @@ class StatusFormatter:
     Perfect for: Impact levels, Severity, Status columns
     """
 
+    _STATUS_LEVELS = MappingProxyType({
+        'CRITICAL': ExcelTheme.CRITICAL,
+        'HIGH': ExcelTheme.HIGH,
+        'MEDIUM': ExcelTheme.MEDIUM,
+        'LOW': ExcelTheme.LOW
+    })
+
+    _STATUS_COMPLEXITY = MappingProxyType({
+        'Critical': ExcelTheme.CRITICAL,
+        'High': ExcelTheme.HIGH,
+        'Medium': ExcelTheme.MEDIUM,
+        'Low': ExcelTheme.LOW
+    })
+
+    _STATUS_RUN_STATE = MappingProxyType({
+        'Started': ExcelTheme.SUCCESS,
+        'Stopped': ExcelTheme.WARNING,
+        'Running': ExcelTheme.SUCCESS,
+        'Failed': ExcelTheme.CRITICAL,
+        'Success': ExcelTheme.SUCCESS,
+        'Error': ExcelTheme.CRITICAL
+    })
+
+    _STATUS_ORPHANED = MappingProxyType({
+        'Yes': ExcelTheme.WARNING,
+        'No': ExcelTheme.SUCCESS
+    })
+
+    _STATUS_MULTI = MappingProxyType({
+        'Yes': ExcelTheme.INFO,
+        'No': ExcelTheme.ROW_ODD
+    })
+
+    # Ordered (keyword, status colors) lookups - first hit wins
+    _STATUS_KEYWORDS = (
+        ('impact', _STATUS_LEVELS), ('severity', _STATUS_LEVELS),
+        ('complexity', _STATUS_COMPLEXITY),
+        ('status', _STATUS_RUN_STATE), ('state', _STATUS_RUN_STATE),
+        ('orphaned', _STATUS_ORPHANED), ('broken', _STATUS_ORPHANED),
+        ('multi', _STATUS_MULTI),
+    )
+
+    # Rule text colour for dark / light status fills
+    LIGHT_TEXT_FONT = _font(color="FFFFFF", bold=True)
+    DARK_TEXT_FONT = _font(color="000000", bold=True)
+
     @staticmethod
     def add_status_highlighting(worksheet, column_letter: str, start_row: int, end_row: int,
-                               status_colors: Dict[str, str]):
+                               status_colors: Dict[str, str], sink: Optional[list] = None):
         """
          Add status-based highlighting
 
@@ -1047,34 +1589,47 @@ class StatusFormatter:
             end_row: Last data row
             status_colors: Dict mapping status values to colors
                 Example: {'CRITICAL': 'FF0000', 'HIGH': 'FFA500', ...}
+            sink: Collect (range, rule) pairs here instead of adding them to the sheet
         """
 
         cell_range = f"{column_letter}{start_row}:{column_letter}{end_row}"
 
-        for status_value, color in status_colors.items():
+        StatusFormatter._add_status_rules(worksheet, cell_range, status_colors, sink)
 
-            fill = PatternFill(
-                start_color=color,
-                end_color=color,
-                fill_type='solid'
-            )
+    @staticmethod
+    def _add_status_rules(worksheet, cell_range: str, status_colors: Dict[str, str],
+                          sink: Optional[list] = None):
+        """Add one CellIs rule per status value to a (possibly multi-column) range"""
 
-            if StatusFormatter._is_dark_color(color):
-                font = Font(color="FFFFFF", bold=True)
-            else:
-                font = Font(color="000000", bold=True)
+        light_font = StatusFormatter.LIGHT_TEXT_FONT
+        dark_font = StatusFormatter.DARK_TEXT_FONT
 
-            rule = CellIsRule(
+        rules = [
+            CellIsRule(
                 operator='equal',
                 formula=[f'"{status_value}"'],
-                fill=fill,
-                font=font
+                fill=_solid_fill(color),
+                font=light_font if StatusFormatter._is_dark_color(color) else dark_font
             )
+            for status_value, color in status_colors.items()
+        ]
 
-            worksheet.conditional_formatting.add(cell_range, rule)
+        if sink is not None:
+            sink.extend((cell_range, rule) for rule in rules)
+            return
+
+        # Parse the sqref once; every rule lands under the same <conditionalFormatting> block
+        cf_range = ConditionalFormatting(cell_range)
+        conditional_formatting = worksheet.conditional_formatting
+        for rule in rules:
+            conditional_formatting.add(cf_range, rule)
 
     @staticmethod
-    def auto_add_status_highlighting(worksheet, header_row: int = 1):
+    def auto_add_status_highlighting(worksheet, header_row: int = 1,
+                                     metas: Optional[List[HeaderMeta]] = None,
+                                     max_row: Optional[int] = None,
+                                     sink: Optional[list] = None,
+                                     plan: Optional['WorksheetPlan'] = None):
         """
          Automatically add status highlighting to appropriate columns
 
@@ -1085,93 +1640,123 @@ class StatusFormatter:
         - Yes/No columns
         """
 
-        headers = {}
-        for col_idx, cell in enumerate(worksheet[header_row], 1):
-            if cell.value:
-                headers[col_idx] = str(cell.value).lower()
+        if plan is None:
+            plan = WorksheetPlanner.plan(worksheet, header_row, metas, max_row)
 
-        for col_idx, header in headers.items():
+        # Equality rules are evaluated per cell, so columns sharing the same
+        # status map can share one multi-range sqref and one set of rules
+        buckets: Dict[Tuple[Tuple[str, str], ...], List[str]] = {}
+        for column in plan.columns:
 
-            status_colors = StatusFormatter._get_status_colors(header)
+            status_colors = column.status_colors
 
             if status_colors:
-                col_letter = get_column_letter(col_idx)
-                start_row = header_row + 1
-                end_row = worksheet.max_row
+                buckets.setdefault(tuple(status_colors.items()), []).append(column.cell_range)
 
-                if end_row < start_row:
-                    continue
-
-                StatusFormatter.add_status_highlighting(
-                    worksheet, col_letter, start_row, end_row,
-                    status_colors=status_colors
-                )
+        for status_items, ranges in buckets.items():
+            StatusFormatter._add_status_rules(worksheet, " ".join(ranges), dict(status_items), sink)
 
     @staticmethod
+    @functools.lru_cache(maxsize=512)
     def _get_status_colors(header: str) -> Optional[Dict[str, str]]:
-        """Get status-to-color mapping for column"""
-
-        if 'impact' in header:
-            return {
-                'CRITICAL': ExcelTheme.CRITICAL,
-                'HIGH': ExcelTheme.HIGH,
-                'MEDIUM': ExcelTheme.MEDIUM,
-                'LOW': ExcelTheme.LOW
-            }
+        """Get status-to-color mapping for column (shared, read-only mapping)"""
 
-        if 'severity' in header:
-            return {
-                'CRITICAL': ExcelTheme.CRITICAL,
-                'HIGH': ExcelTheme.HIGH,
-                'MEDIUM': ExcelTheme.MEDIUM,
-                'LOW': ExcelTheme.LOW
-            }
+        return _first_keyword(header, StatusFormatter._STATUS_KEYWORDS)
 
-        if 'complexity' in header:
-            return {
-                'Critical': ExcelTheme.CRITICAL,
-                'High': ExcelTheme.HIGH,
-                'Medium': ExcelTheme.MEDIUM,
-                'Low': ExcelTheme.LOW
-            }
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def _is_dark_color(hex_color: str) -> bool:
+        """Check if color is dark (needs white text)"""
 
-        if 'status' in header or 'state' in header:
-            return {
-                'Started': ExcelTheme.SUCCESS,
-                'Stopped': ExcelTheme.WARNING,
-                'Running': ExcelTheme.SUCCESS,
-                'Failed': ExcelTheme.CRITICAL,
-                'Success': ExcelTheme.SUCCESS,
-                'Error': ExcelTheme.CRITICAL
-            }
+        rgb = int(hex_color.lstrip('#')[:6], 16)
 
-        if 'orphaned' in header or 'broken' in header or 'isorphaned' in header:
-            return {
-                'Yes': ExcelTheme.WARNING,
-                'No': ExcelTheme.SUCCESS
-            }
+        r = (rgb >> 16) & 0xFF
+        g = (rgb >> 8) & 0xFF
+        b = rgb & 0xFF
 
-        if 'multi' in header or 'ismulti' in header:
-            return {
-                'Yes': ExcelTheme.INFO,
-                'No': ExcelTheme.ROW_ODD
-            }
+        # Fixed-point luminance: 0.299r + 0.587g + 0.114b < 128
+        return 299 * r + 587 * g + 114 * b < 128000
+
+def _warm_dark_color_cache() -> None:
+    """Warm the _is_dark_color cache with the theme palette (the status rules only use these)"""
+    for color in vars(ExcelTheme).values():
+        if isinstance(color, str) and len(color) == 6:
+            StatusFormatter._is_dark_color(color)
+
+_warm_dark_color_cache()
+
+@dataclass
+class ColumnPlan:
+    """
+     Conditional-formatting decisions for one column
 
-        return None
+    Every header classifier runs once per column in WorksheetPlanner.plan;
+    the auto_add_* passes only read these fields.
+    """
+    letter: str                             # Column letter
+    cell_range: str                         # Data range, e.g. "C2:C500"
+    status_colors: Optional[Dict]           # StatusFormatter map (None = no rule)
+    data_bar_scheme: Optional[Dict]         # DataBarFormatter scheme (None = no bar)
+    icon_config: Optional[Dict]             # IconSetFormatter config (None = no icons)
+    scale_config: Optional[Dict]            # ColorScaleFormatter config (None = no scale)
+
+@dataclass
+class WorksheetPlan:
+    """ Conditional-formatting plan for one worksheet"""
+    start_row: int
+    end_row: int
+    columns: List[ColumnPlan]
+
+class WorksheetPlanner:
+    """
+     WORKSHEET PLANNER
+
+    Classifies a sheet's headers for all conditional-formatting passes in
+    one go, so status highlighting, data bars, icon sets and color scales
+    share a single header scan and a single set of range strings.
+    """
 
     @staticmethod
-    def _is_dark_color(hex_color: str) -> bool:
-        """Check if color is dark (needs white text)"""
+    def plan(worksheet, header_row: int = 1, metas: Optional[List[HeaderMeta]] = None,
+             max_row: Optional[int] = None) -> WorksheetPlan:
+        """
+         Build the conditional-formatting plan for a worksheet
 
-        hex_color = hex_color.lstrip('#')
+        Args:
+            worksheet: openpyxl worksheet
+            header_row: Row number of headers
+            metas: Pre-built header metadata (read from the sheet if omitted)
+            max_row: Last data row (read from the sheet if omitted)
 
-        r = int(hex_color[0:2], 16)
-        g = int(hex_color[2:4], 16)
-        b = int(hex_color[4:6], 16)
+        Returns:
+            WorksheetPlan (no columns when there are no data rows)
+        """
 
-        luminance = (0.299 * r + 0.587 * g + 0.114 * b)
+        start_row = header_row + 1
+        end_row = worksheet.max_row if max_row is None else max_row
 
-        return luminance < 128
+        if end_row < start_row:
+            return WorksheetPlan(start_row, end_row, [])
+
+        if metas is None:
+            metas = HeaderMeta.from_worksheet(worksheet, header_row)
+
+        columns = []
+        for meta in metas:
+            header = meta.lower
+            letter = meta.letter
+
+            columns.append(ColumnPlan(
+                letter=letter,
+                cell_range=f"{letter}{start_row}:{letter}{end_row}",
+                status_colors=StatusFormatter._get_status_colors(header),
+                data_bar_scheme=(DataBarFormatter._get_color_scheme(header)
+                                 if DataBarFormatter._should_have_data_bar(header) else None),
+                icon_config=IconSetFormatter._get_icon_config(header),
+                scale_config=ColorScaleFormatter._get_scale_config(header)
+            ))
+
+        return WorksheetPlan(start_row, end_row, columns)
 
 class MasterConditionalFormatter:
     """
@@ -1180,6 +1765,21 @@ class MasterConditionalFormatter:
     Orchestrates all conditional formatting operations
     """
 
+    DEFAULT_FEATURES = MappingProxyType({
+        'data_bars': True,
+        'icon_sets': True,
+        'color_scales': True,
+        'status_highlighting': True
+    })
+
+    # (feature flag, pass) in application order
+    _PASSES = (
+        ('status_highlighting', StatusFormatter.auto_add_status_highlighting),
+        ('data_bars', DataBarFormatter.auto_add_data_bars),
+        ('icon_sets', IconSetFormatter.auto_add_icon_sets),
+        ('color_scales', ColorScaleFormatter.auto_add_color_scales),
+    )
+
     @staticmethod
     def apply_all_conditional_formatting(worksheet, sheet_name: str = "",
                                         header_row: int = 1,
@@ -1195,33 +1795,59 @@ class MasterConditionalFormatter:
         """
 
         if enable_features is None:
-            enable_features = {
-                'data_bars': True,
-                'icon_sets': True,
-                'color_scales': True,
-                'status_highlighting': True
-            }
+            enable_features = MasterConditionalFormatter.DEFAULT_FEATURES
+
+        passes = [apply for name, apply in MasterConditionalFormatter._PASSES
+                  if enable_features.get(name, True)]
+        if not passes:
+            return
+
+        # (range, rule) pairs from every pass, installed in one go at the end
+        sink = []
 
         try:
 
-            if worksheet.max_row <= header_row:
+            # max_row/max_column walk the cell store, so read them once for all passes
+            max_row, max_col = _sheet_bounds(worksheet)
+            if max_row <= header_row or max_col == 0:
                 return
 
-            if enable_features.get('status_highlighting', True):
-                StatusFormatter.auto_add_status_highlighting(worksheet, header_row)
+            # One header scan and classification shared by every pass
+            plan = WorksheetPlanner.plan(worksheet, header_row, max_row=max_row)
 
-            if enable_features.get('data_bars', True):
-                DataBarFormatter.auto_add_data_bars(worksheet, header_row)
+            # A failing pass (e.g. an icon style Excel rejects) must not cost the others
+            for apply in passes:
+                try:
+                    apply(worksheet, header_row, sink=sink, plan=plan)
+                except Exception as e:
+                    print(f"  Warning: {apply.__name__} failed for {sheet_name}: {e}")
 
-            if enable_features.get('icon_sets', True):
+        except Exception as e:
+            print(f"  Warning: Conditional formatting failed for {sheet_name}: {e}")
 
-                IconSetFormatter.auto_add_icon_sets(worksheet, header_row)
+        finally:
+            # Rules collected before a failure are kept, as when they were added directly
+            MasterConditionalFormatter._install_rules(worksheet, sink)
 
-            if enable_features.get('color_scales', True):
-                ColorScaleFormatter.auto_add_color_scales(worksheet, header_row)
+    @staticmethod
+    def _install_rules(worksheet, sink: List[Tuple[str, Rule]]):
+        """
+        Add collected (range, rule) pairs to the sheet
 
-        except Exception as e:
-            print(f"  Warning: Conditional formatting failed for {sheet_name}: {e}")
+        Each distinct range string is parsed into a ConditionalFormatting key
+        once and all of its rules are filed under it (one <conditionalFormatting>
+        block per range). Rules are added in collection order so priorities
+        match the order the passes produced them.
+        """
+
+        conditional_formatting = worksheet.conditional_formatting
+        cf_ranges: Dict[str, ConditionalFormatting] = {}
+
+        for cell_range, rule in sink:
+            cf_range = cf_ranges.get(cell_range)
+            if cf_range is None:
+                cf_range = cf_ranges[cell_range] = ConditionalFormatting(cell_range)
+            conditional_formatting.add(cf_range, rule)
 
 class SpecialSheetFormatters:
     """
@@ -1247,7 +1873,7 @@ class SpecialSheetFormatters:
                 break
 
         if value_col:
-            col_letter = get_column_letter(value_col)
+            col_letter = _col_letter(value_col)
 
             DataBarFormatter.add_data_bars(
                 worksheet, col_letter, header_row + 1, worksheet.max_row,
@@ -1284,21 +1910,35 @@ class SpecialSheetFormatters:
 
         if severity_col:
 
-            for row_idx in range(header_row + 1, worksheet.max_row + 1):
-                severity_cell = worksheet.cell(row_idx, severity_col)
+            max_row = worksheet.max_row
+            max_col = worksheet.max_column
+
+            # Find CRITICAL rows from the severity values alone, then style only those
+            critical_rows = [
+                row_idx
+                for row_idx, (severity,) in enumerate(
+                    worksheet.iter_rows(min_row=header_row + 1, max_row=max_row,
+                                        min_col=severity_col, max_col=severity_col,
+                                        values_only=True),
+                    header_row + 1)
+                if severity == 'CRITICAL'
+            ]
 
-                if severity_cell.value == 'CRITICAL':
+            if not critical_rows:
+                return
 
-                    for col_idx in range(1, worksheet.max_column + 1):
-                        cell = worksheet.cell(row_idx, col_idx)
-                        cell.fill = PatternFill(
-                            start_color=ExcelTheme.ERROR_BG,
-                            end_color=ExcelTheme.ERROR_BG,
-                            fill_type='solid'
-                        )
-                        cell.font = Font(bold=True)
+            # One shared fill/font for every highlighted cell
+            critical_fill = _solid_fill(ExcelTheme.ERROR_BG)
+            critical_font = _font(bold=True)
 
-print(" Part 2/6 loaded: Enhanced Conditional Formatting")
+            for row_idx in critical_rows:
+                for row in worksheet.iter_rows(min_row=row_idx, max_row=row_idx, max_col=max_col):
+                    for cell in row:
+                        cell.fill = critical_fill
+                        cell.font = critical_font
+
+if _DEBUG:
+    print(" Part 2/6 loaded: Enhanced Conditional Formatting")
 """Excel Enhancement Module - Professional Excel formatting and styling capabilities"""
 
 class HyperlinkManager:
@@ -1314,7 +1954,40 @@ class HyperlinkManager:
     - Professional link styling
     """
 
-    LINK_FONT = Font(
+    # Reference patterns in Details text, tried in order until one names a real sheet
+    _SHEET_REF_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+        r'See(?:\s*sheet)?:\s*([^,;\n]+)',
+        r'Sheet:\s*([^,;\n]+)',
+        r'→\s*([^,;\n]+)',
+    ))
+
+    # Cheap single-pass gate: a cell can only match the patterns above if this matches
+    _SHEET_REF_HINT = re.compile(r'see(?:\s*sheet)?:|sheet:|→', re.IGNORECASE)
+
+    _WHITESPACE_RE = re.compile(r'\s+')
+
+    # Sheet names containing any of these must be quoted in a link target
+    _SHEET_QUOTE_CHARS = frozenset(' !#$')
+
+    # Navigation section order
+    _SHEET_CATEGORIES = (
+        'Overview', 'Pipelines', 'Activities', 'DataFlows', 'Resources',
+        'Analysis', 'Orphaned Resources', 'Statistics', 'Other'
+    )
+
+    # Ordered (keyword, category) lookups - first hit wins
+    _SHEET_CATEGORY_KEYWORDS = (
+        ('pipeline', 'Pipelines'),
+        ('activity', 'Activities'), ('activities', 'Activities'),
+        ('dataflow', 'DataFlows'), ('lineage', 'DataFlows'), ('transformation', 'DataFlows'),
+        ('dataset', 'Resources'), ('linkedservice', 'Resources'), ('trigger', 'Resources'),
+        ('integration', 'Resources'),
+        ('impact', 'Analysis'), ('circular', 'Analysis'), ('dependency', 'Analysis'),
+        ('orphaned', 'Orphaned Resources'),
+        ('usage', 'Statistics'), ('count', 'Statistics'), ('statistics', 'Statistics'),
+    )
+
+    LINK_FONT = _font(
         name='Calibri',
         size=11,
         underline='single',
@@ -1336,14 +2009,7 @@ class HyperlinkManager:
         if display_text is None:
             display_text = str(cell.value) if cell.value else target_sheet
 
-        escaped_sheet = target_sheet.replace("'", "''")
-
-        if ' ' in target_sheet or any(c in target_sheet for c in ['!', '#', '$']):
-            link_formula = f"#'{escaped_sheet}'!A1"
-        else:
-            link_formula = f"#{escaped_sheet}!A1"
-
-        cell.hyperlink = link_formula
+        cell.hyperlink = HyperlinkManager._internal_link_target(target_sheet)
 
         cell.value = display_text
 
@@ -1426,39 +2092,39 @@ class HyperlinkManager:
         if not details_col:
             return
 
-        col_letter = get_column_letter(details_col)
-
         sheet_lookup = {sheet.lower(): sheet for sheet in available_sheets}
 
-        patterns = [
-            r'\s*See(?:\s*sheet)?:\s*([^,;\n]+)',
-            r'See(?:\s*sheet)?:\s*([^,;\n]+)',
-            r'Sheet:\s*([^,;\n]+)',
-            r'→\s*([^,;\n]+)',
-        ]
+        ref_hint = HyperlinkManager._SHEET_REF_HINT
+        ref_patterns = HyperlinkManager._SHEET_REF_PATTERNS
+        whitespace = HyperlinkManager._WHITESPACE_RE
 
-        for row_idx in range(header_row + 1, worksheet.max_row + 1):
-            cell = worksheet[f'{col_letter}{row_idx}']
+        for (cell,) in worksheet.iter_rows(min_row=header_row + 1, max_row=worksheet.max_row,
+                                           min_col=details_col, max_col=details_col):
 
-            if not cell.value:
+            value = cell.value
+            if not value:
                 continue
 
-            cell_text = str(cell.value)
+            cell_text = str(value)
+
+            # Most details cells carry no reference at all
+            if not ref_hint.search(cell_text):
+                continue
 
-            for pattern in patterns:
-                match = re.search(pattern, cell_text, re.IGNORECASE)
+            for pattern in ref_patterns:
+                match = pattern.search(cell_text)
 
                 if match:
 
                     mentioned_sheet = match.group(1).strip().strip('"\'').strip()
 
-                    mentioned_sheet = re.sub(r'\s+', ' ', mentioned_sheet)
+                    mentioned_sheet = whitespace.sub(' ', mentioned_sheet)
 
                     actual_sheet = sheet_lookup.get(mentioned_sheet.lower())
 
                     if actual_sheet:
 
-                        display_text = str(cell.value).strip()
+                        display_text = cell_text.strip()
                         HyperlinkManager.create_internal_link(
                             worksheet, cell, actual_sheet, display_text
                         )
@@ -1482,85 +2148,79 @@ class HyperlinkManager:
 
         header_cell = summary_worksheet.cell(nav_start_row, 1)
         header_cell.value = "QUICK NAVIGATION"
-        header_cell.font = Font(name='Calibri', size=14, bold=True, color=ExcelTheme.HEADER_TEXT)
-        header_cell.fill = PatternFill(
-            start_color=ExcelTheme.HEADER_BG,
-            end_color=ExcelTheme.HEADER_BG,
-            fill_type='solid'
-        )
+        header_cell.font = _font(name='Calibri', size=14, bold=True, color=ExcelTheme.HEADER_TEXT)
+        header_cell.fill = _solid_fill(ExcelTheme.HEADER_BG)
 
         desc_cell = summary_worksheet.cell(nav_start_row, 2)
         desc_cell.value = "Click links below to navigate to sheets"
-        desc_cell.font = Font(name='Calibri', size=10, italic=True)
+        desc_cell.font = _font(name='Calibri', size=10, italic=True)
 
-        current_row = nav_start_row + 2
+        cat_font = _font(bold=True, size=11)
+        link_font = HyperlinkManager.LINK_FONT
 
-        categorized_sheets = HyperlinkManager._categorize_sheets(all_sheets)
+        # Lay out the whole section first: (row, col, value, font, hyperlink)
+        entries = []
+        current_row = nav_start_row + 2
 
-        for category, sheets in categorized_sheets.items():
-            if not sheets:
-                continue
+        for category, sheets in HyperlinkManager._categorize_sheets(all_sheets).items():
 
-            cat_cell = summary_worksheet.cell(current_row, 1)
-            cat_cell.value = f"📁 {category}"
-            cat_cell.font = Font(bold=True, size=11)
+            entries.append((current_row, 1, f"📁 {category}", cat_font, None))
             current_row += 1
 
             for sheet_name in sheets:
+                entries.append((current_row, 1, f"  • {sheet_name}", None, None))
+                entries.append((current_row, 2, f"→ Open {sheet_name}", link_font,
+                                HyperlinkManager._internal_link_target(sheet_name)))
+                current_row += 1
 
-                name_cell = summary_worksheet.cell(current_row, 1)
-                name_cell.value = f"  • {sheet_name}"
+            current_row += 1
 
-                link_cell = summary_worksheet.cell(current_row, 2)
-                HyperlinkManager.create_internal_link(
-                    summary_worksheet, link_cell, sheet_name, f"→ Open {sheet_name}"
-                )
+        cell_at = summary_worksheet.cell
+        for row, col, value, font, hyperlink in entries:
+            cell = cell_at(row=row, column=col, value=value)
+            if hyperlink:
+                cell.hyperlink = hyperlink
+            if font is not None:
+                cell.font = font
 
-                current_row += 1
+    @staticmethod
+    @functools.lru_cache(maxsize=512)
+    def _internal_link_target(target_sheet: str) -> str:
+        """Hyperlink target for cell A1 of a sheet in the same workbook"""
 
-            current_row += 1
+        escaped_sheet = target_sheet.replace("'", "''")
+
+        if not HyperlinkManager._SHEET_QUOTE_CHARS.isdisjoint(target_sheet):
+            return f"#'{escaped_sheet}'!A1"
+
+        return f"#{escaped_sheet}!A1"
 
     @staticmethod
     def _categorize_sheets(sheets: List[str]) -> Dict[str, List[str]]:
         """Categorize sheets for better navigation"""
 
-        categories = {
-            'Overview': [],
-            'Pipelines': [],
-            'Activities': [],
-            'DataFlows': [],
-            'Resources': [],
-            'Analysis': [],
-            'Orphaned Resources': [],
-            'Statistics': [],
-            'Other': []
-        }
+        categories = {category: [] for category in HyperlinkManager._SHEET_CATEGORIES}
 
         for sheet in sheets:
-            sheet_lower = sheet.lower()
+            category = HyperlinkManager._sheet_category(sheet)
 
-            if sheet_lower == 'summary':
-                continue
-
-            if any(x in sheet_lower for x in ['pipeline']):
-                categories['Pipelines'].append(sheet)
-            elif any(x in sheet_lower for x in ['activity', 'activities']):
-                categories['Activities'].append(sheet)
-            elif any(x in sheet_lower for x in ['dataflow', 'lineage', 'transformation']):
-                categories['DataFlows'].append(sheet)
-            elif any(x in sheet_lower for x in ['dataset', 'linkedservice', 'trigger', 'integration']):
-                categories['Resources'].append(sheet)
-            elif any(x in sheet_lower for x in ['impact', 'circular', 'dependency']):
-                categories['Analysis'].append(sheet)
-            elif 'orphaned' in sheet_lower:
-                categories['Orphaned Resources'].append(sheet)
-            elif any(x in sheet_lower for x in ['usage', 'count', 'statistics']):
-                categories['Statistics'].append(sheet)
-            else:
-                categories['Other'].append(sheet)
+            if category:
+                categories[category].append(sheet)
 
         return {k: v for k, v in categories.items() if v}
 
+    @staticmethod
+    @functools.lru_cache(maxsize=512)
+    def _sheet_category(sheet: str) -> Optional[str]:
+        """Navigation category for a sheet name (None for the Summary sheet itself)"""
+
+        sheet_lower = sheet.lower()
+
+        if sheet_lower == 'summary':
+            return None
+
+        return _first_keyword(sheet_lower, HyperlinkManager._SHEET_CATEGORY_KEYWORDS) or 'Other'
+
 class ExcelTableFormatter:
     """
      EXCEL TABLE FORMATTER
@@ -1623,7 +2283,7 @@ class ExcelTableFormatter:
         if worksheet.max_row <= header_row:
             return
 
-        last_col = get_column_letter(worksheet.max_column)
+        last_col = _col_letter(worksheet.max_column)
         ref = f"A{header_row}:{last_col}{worksheet.max_row}"
 
         table_name = re.sub(r'[^a-zA-Z0-9_]', '_', sheet_name)
@@ -1685,7 +2345,23 @@ class SheetProtectionManager:
             allow_select_unlocked: Allow selecting unlocked cells
         """
 
-        protection = SheetProtection(
+        worksheet.protection = SheetProtectionManager._protection(
+            password, allow_filter, allow_sort, allow_select_locked, allow_select_unlocked
+        )
+
+    @staticmethod
+    @functools.lru_cache(maxsize=8)
+    def _protection(password: Optional[str], allow_filter: bool, allow_sort: bool,
+                    allow_select_locked: bool, allow_select_unlocked: bool) -> SheetProtection:
+        """
+        Shared SheetProtection per settings combination
+
+        Building one hashes the password, so protect_all_sheets reuses a single
+        instance for every sheet. Treat it as read-only: assign a new object to
+        worksheet.protection rather than mutating this one.
+        """
+
+        return SheetProtection(
             sheet=True,
             password=password,
             autoFilter=allow_filter,
@@ -1701,8 +2377,6 @@ class SheetProtectionManager:
             deleteRows=False
         )
 
-        worksheet.protection = protection
-
     @staticmethod
     def protect_all_sheets(workbook, sheets_to_protect: List[str] = None,
                           password: str = None):
@@ -1722,8 +2396,9 @@ class SheetProtectionManager:
                 if ws.title.lower() != 'summary'
             ]
 
+        existing = set(workbook.sheetnames)
         for sheet_name in sheets_to_protect:
-            if sheet_name in workbook.sheetnames:
+            if sheet_name in existing:
                 worksheet = workbook[sheet_name]
                 SheetProtectionManager.protect_sheet(
                     worksheet, password=password
@@ -1736,6 +2411,44 @@ class CellCommentManager:
     Adds helpful tooltips and documentation to cells
     """
 
+    STANDARD_DESCRIPTIONS = MappingProxyType({
+        'Impact': 'Impact level based on dependencies:\nCRITICAL = High upstream+downstream\nHIGH = Significant dependencies\nMEDIUM = Entry point\nLOW = Orphaned/standalone',
+        'BlastRadius': 'Total number of resources affected by changes to this resource',
+        'Complexity': 'Complexity assessment:\nCritical = 100+\nHigh = 50-99\nMedium = 20-49\nLow = <20',
+        'IsOrphaned': 'Yes = Not referenced by any trigger or active pipeline\nNo = Actively used',
+        'Sequence': 'Execution order within pipeline (lower numbers execute first)',
+        'Depth': 'Nesting level (0=root, higher=more nested)',
+        'IntegrationRuntime': 'Runtime used for execution:\nAutoResolveIR = Azure auto-managed\nOther = Self-hosted or custom IR',
+        'UsageCount': 'Number of times this resource is referenced',
+        'State': 'Trigger state:\nStarted = Active\nStopped = Inactive',
+        'Type': 'Resource type classification'
+    })
+
+    _IMPACT_DESCRIPTIONS = MappingProxyType({
+        'DirectUpstreamTriggers': 'Triggers that directly invoke this pipeline',
+        'TransitiveUpstreamPipelines': 'Pipelines in the dependency chain (up to 5 levels)',
+        'DirectDownstreamPipelines': 'Pipelines directly called by this pipeline',
+        'TransitiveDownstreamPipelines': 'All downstream pipelines in chain'
+    })
+
+    _CIRCULAR_DESCRIPTIONS = MappingProxyType({
+        'Cycle': 'Dependency cycle path (A→B→C→A)',
+        'Length': 'Number of resources in cycle',
+        'Severity': 'CRITICAL = Production blocker, must fix immediately'
+    })
+
+    _ORPHANED_DESCRIPTIONS = MappingProxyType({
+        'Reason': 'Why this resource is considered orphaned',
+        'Recommendation': 'Suggested action to resolve orphan status'
+    })
+
+    # Ordered (sheet-name keyword, descriptions) lookups - first hit wins
+    _SHEET_DESCRIPTION_KEYWORDS = (
+        ('impact', _IMPACT_DESCRIPTIONS),
+        ('circular', _CIRCULAR_DESCRIPTIONS),
+        ('orphaned', _ORPHANED_DESCRIPTIONS),
+    )
+
     @staticmethod
     def add_comment(worksheet, cell, text: str, author: str = "ADF Analyzer"):
         """
@@ -1763,14 +2476,19 @@ class CellCommentManager:
             header_row: Header row number
         """
 
-        for col_idx, cell in enumerate(worksheet[header_row], 1):
-            if cell.value:
-                header_name = str(cell.value)
+        if not header_descriptions:
+            return
 
-                if header_name in header_descriptions:
-                    CellCommentManager.add_comment(
-                        worksheet, cell, header_descriptions[header_name]
-                    )
+        for cell in worksheet[header_row]:
+            value = cell.value
+            if not value:
+                continue
+
+            # Headers are almost always strings already; only convert the rest
+            description = header_descriptions.get(value if isinstance(value, str) else str(value))
+
+            if description is not None:
+                CellCommentManager.add_comment(worksheet, cell, description)
 
     @staticmethod
     def auto_add_helpful_comments(worksheet, sheet_name: str, header_row: int = 1):
@@ -1783,10 +2501,7 @@ class CellCommentManager:
             header_row: Header row number
         """
 
-        descriptions = CellCommentManager._get_standard_descriptions()
-
-        sheet_descriptions = CellCommentManager._get_sheet_specific_descriptions(sheet_name)
-        descriptions.update(sheet_descriptions)
+        descriptions = CellCommentManager._descriptions_for_sheet(sheet_name)
 
         CellCommentManager.add_header_comments(worksheet, descriptions, header_row)
 
@@ -1794,47 +2509,25 @@ class CellCommentManager:
     def _get_standard_descriptions() -> Dict[str, str]:
         """Get standard column descriptions"""
 
-        return {
-            'Impact': 'Impact level based on dependencies:\nCRITICAL = High upstream+downstream\nHIGH = Significant dependencies\nMEDIUM = Entry point\nLOW = Orphaned/standalone',
-            'BlastRadius': 'Total number of resources affected by changes to this resource',
-            'Complexity': 'Complexity assessment:\nCritical = 100+\nHigh = 50-99\nMedium = 20-49\nLow = <20',
-            'IsOrphaned': 'Yes = Not referenced by any trigger or active pipeline\nNo = Actively used',
-            'Sequence': 'Execution order within pipeline (lower numbers execute first)',
-            'Depth': 'Nesting level (0=root, higher=more nested)',
-            'IntegrationRuntime': 'Runtime used for execution:\nAutoResolveIR = Azure auto-managed\nOther = Self-hosted or custom IR',
-            'UsageCount': 'Number of times this resource is referenced',
-            'State': 'Trigger state:\nStarted = Active\nStopped = Inactive',
-            'Type': 'Resource type classification'
-        }
+        return dict(CellCommentManager.STANDARD_DESCRIPTIONS)
 
     @staticmethod
     def _get_sheet_specific_descriptions(sheet_name: str) -> Dict[str, str]:
         """Get sheet-specific column descriptions"""
 
-        sheet_lower = sheet_name.lower()
-
-        if 'impact' in sheet_lower:
-            return {
-                'DirectUpstreamTriggers': 'Triggers that directly invoke this pipeline',
-                'TransitiveUpstreamPipelines': 'Pipelines in the dependency chain (up to 5 levels)',
-                'DirectDownstreamPipelines': 'Pipelines directly called by this pipeline',
-                'TransitiveDownstreamPipelines': 'All downstream pipelines in chain'
-            }
+        return dict(_first_keyword(sheet_name.lower(),
+                                   CellCommentManager._SHEET_DESCRIPTION_KEYWORDS) or {})
 
-        elif 'circular' in sheet_lower:
-            return {
-                'Cycle': 'Dependency cycle path (A→B→C→A)',
-                'Length': 'Number of resources in cycle',
-                'Severity': 'CRITICAL = Production blocker, must fix immediately'
-            }
-
-        elif 'orphaned' in sheet_lower:
-            return {
-                'Reason': 'Why this resource is considered orphaned',
-                'Recommendation': 'Suggested action to resolve orphan status'
-            }
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def _descriptions_for_sheet(sheet_name: str) -> Dict[str, str]:
+        """Standard + sheet-specific descriptions, merged once per sheet name (read-only)"""
 
-        return {}
+        descriptions = dict(CellCommentManager.STANDARD_DESCRIPTIONS)
+        descriptions.update(
+            _first_keyword(sheet_name.lower(), CellCommentManager._SHEET_DESCRIPTION_KEYWORDS) or {}
+        )
+        return MappingProxyType(descriptions)
 
 class PageSetupManager:
     """
@@ -1909,7 +2602,8 @@ class PageSetupManager:
             except Exception as e:
                 print(f"  Page setup failed for {worksheet.title}: {e}")
 
-print(" Part 3/6 loaded: Hyperlinks, Protection & Advanced Features")
+if _DEBUG:
+    print(" Part 3/6 loaded: Hyperlinks, Protection & Advanced Features")
 
 """Excel Enhancement Module - Professional Excel formatting and styling capabilities"""
 
@@ -1938,8 +2632,10 @@ def create_enhanced_export_function(analyzer_class):
 
         # Respect runtime config: if excel enhancements are disabled, call original export
         try:
-            master_enabled = ENHANCEMENT_CONFIG.get('excel_enhancements', {}).get('enabled', True)
+            export_cfg = get_enhancement_config().get('excel_enhancements', {})
+            master_enabled = export_cfg.get('enabled', True)
         except Exception:
+            export_cfg = {}
             master_enabled = True
 
         if not master_enabled:
@@ -1949,73 +2645,88 @@ def create_enhanced_export_function(analyzer_class):
                 pass
             return original_export(self)
 
-        from datetime import datetime
-        import shutil
-        from pathlib import Path
-        import pandas as pd
+        # A copy from the previous export may still be reading adf_analysis_latest.xlsx
+        _wait_for_background_copies()
 
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         output_dir = Path('output')
         output_dir.mkdir(exist_ok=True)
 
         excel_file = output_dir / 'adf_analysis_latest.xlsx'
+        partial_file = output_dir / 'adf_analysis_latest.partial.xlsx'
         archive_file = output_dir / f'adf_analysis_{timestamp}.xlsx'
 
         self.logger.info(f" Exporting to Excel with ENHANCED BEAUTIFICATION: {excel_file}")
 
+        # openpyxl serialises through lxml when it is importable; the stdlib fallback is much slower
+        if not LXML:
+            self.logger.info("  lxml not installed - openpyxl will use the slower stdlib XML writer "
+                             "(pip install lxml to speed up large exports)")
+
         try:
-            with pd.ExcelWriter(excel_file, engine='openpyxl') as writer:
+            with pd.ExcelWriter(partial_file, engine='openpyxl') as writer:
 
                 self._used_sheet_names = set()
 
                 self._write_summary_sheet(writer, timestamp)
 
                 # Normalize activity result records: ensure new columns exist before writing sheets
+                # (records stay dicts: _write_core_data_sheets sorts/filters them before the DataFrame is built)
                 try:
                     for a in self.results.get('activities', []):
+                        deps = a.get('Dependencies')
                         # Preserve backwards-compatibility while adding clearer names
-                        a['ParseSequence'] = a.get('Sequence', '')
-                        a['HasDependsOn'] = 'Yes' if a.get('Dependencies') else 'No'
-                        a['DependsOnCount'] = len(a.get('Dependencies') or [])
-                        a['CycleFlag'] = 'Yes' if a.get('ExecutionStage') == 'CYCLE' else 'No'
+                        a.update(
+                            ParseSequence=a.get('Sequence', ''),
+                            HasDependsOn='Yes' if deps else 'No',
+                            DependsOnCount=len(deps) if deps else 0,
+                            CycleFlag='Yes' if a.get('ExecutionStage') == 'CYCLE' else 'No',
+                        )
                 except Exception:
                     pass
 
-                # Dump small debug sample of results before writing core sheets
+                # Dump small debug sample of results before writing core sheets (opt-in: debug.dump_stage_samples)
                 try:
-                    import json, os
-                    os.makedirs('output', exist_ok=True)
-                    sample = {
-                        'activities_sample': self.results.get('activities', [])[:5],
-                        'activity_execution_order_sample': self.results.get('activity_execution_order', [])[:5]
-                    }
-                    with open('output/debug_stage_samples.json', 'w', encoding='utf-8') as fh:
-                        json.dump(sample, fh, default=str, indent=2)
+                    if get_enhancement_config().get('debug', {}).get('dump_stage_samples', False):
+                        os.makedirs('output', exist_ok=True)
+                        sample = {
+                            'activities_sample': self.results.get('activities', [])[:5],
+                            'activity_execution_order_sample': self.results.get('activity_execution_order', [])[:5]
+                        }
+                        with open('output/debug_stage_samples.json', 'wb') as fh:
+                            fh.write(_json_dumps(sample))
                 except Exception:
                     pass
 
                 self._write_core_data_sheets(writer)
 
                 # Ensure ExecutionStage headers exist in the in-memory workbook
+                # (columns hide_config dropped from the data must not come back as empty headers)
                 try:
                     wb = writer.book
-                    if 'Activities' in wb.sheetnames:
+                    existing = set(wb.sheetnames)
+                    removed_columns = getattr(self, '_removed_hidden_columns', None) or {}
+                    if 'Activities' in existing:
                         ws = wb['Activities']
-                        headers = [c.value for c in next(ws.iter_rows(min_row=1, max_row=1))]
+                        headers = _header_index(ws)
+                        removed = removed_columns.get('Activities', ())
+                        next_col = ws.max_column + 1
                         # Ensure activity-level new columns exist
                         for col in ('ParseSequence','ExecutionStage','HasDependsOn','DependsOnCount','CycleFlag'):
-                            if col not in headers:
-                                ws.cell(row=1, column=len(headers) + 1, value=col)
-                                headers.append(col)
-                    if 'ActivityExecutionOrder' in wb.sheetnames:
+                            if col not in headers and col not in removed:
+                                ws.cell(row=1, column=next_col, value=col)
+                                headers[col] = next_col
+                                next_col += 1
+                    if 'ActivityExecutionOrder' in existing:
                         ws2 = wb['ActivityExecutionOrder']
-                        headers2 = [c.value for c in next(ws2.iter_rows(min_row=1, max_row=1))]
-                        if 'FromExecutionStage' not in headers2:
-                            ws2.cell(row=1, column=len(headers2) + 1, value='FromExecutionStage')
-                            headers2.append('FromExecutionStage')
-                        if 'ToExecutionStage' not in headers2:
-                            ws2.cell(row=1, column=len(headers2) + 1, value='ToExecutionStage')
-                            headers2.append('ToExecutionStage')
+                        headers2 = _header_index(ws2)
+                        removed2 = removed_columns.get('ActivityExecutionOrder', ())
+                        next_col = ws2.max_column + 1
+                        for col in ('FromExecutionStage', 'ToExecutionStage'):
+                            if col not in headers2 and col not in removed2:
+                                ws2.cell(row=1, column=next_col, value=col)
+                                headers2[col] = next_col
+                                next_col += 1
                 except Exception:
                     # non-critical; continue with normal flow
                     pass
@@ -2033,209 +2744,35 @@ def create_enhanced_export_function(analyzer_class):
                 self.logger.info(" Applying enhanced beautification...")
                 self._apply_enhanced_beautification(writer)
 
-            self.logger.info(f" Export complete with BEAUTIFICATION: {excel_file}")
+            # Replace the previous workbook only once the new one is complete. A new
+            # directory entry also leaves the previous archive hard link untouched.
+            os.replace(partial_file, excel_file)
 
-            # Post-process: rewrite Activities and ActivityExecutionOrder from in-memory results
-            try:
-                import pandas as pd
-                from openpyxl import load_workbook
-                from pathlib import Path
-
-                act_df = pd.DataFrame(self.results.get('activities', []))
-                order_df = pd.DataFrame(self.results.get('activity_execution_order', []))
-
-                # Load hide_config to remove hidden columns before writing
-                hidden_columns = {}
-                try:
-                    for cfg_path in ['enhancement_config.json', 'config/enhancement_config.json']:
-                        if Path(cfg_path).exists():
-                            with open(cfg_path, 'r') as f:
-                                hide_cfg = json.load(f).get('hide_config', {})
-                                if hide_cfg.get('enabled', False):
-                                    hidden_columns = hide_cfg.get('hidden_columns', {})
-                                break
-                except Exception:
-                    pass
-                
-                # Remove hidden columns from DataFrames
-                activities_hidden = hidden_columns.get('Activities', [])
-                if activities_hidden and not act_df.empty:
-                    act_df = act_df.drop(columns=[c for c in activities_hidden if c in act_df.columns], errors='ignore')
-                
-                aeo_hidden = hidden_columns.get('ActivityExecutionOrder', [])
-                if aeo_hidden and not order_df.empty:
-                    order_df = order_df.drop(columns=[c for c in aeo_hidden if c in order_df.columns], errors='ignore')
-
-                # Sort DataFrames for clean Excel output
-                # Activities: sort by Pipeline name A-Z, then ExecutionStage smallest to largest
-                if not act_df.empty and 'Pipeline' in act_df.columns:
-                    sort_cols_act = ['Pipeline']
-                    if 'ExecutionStage' in act_df.columns:
-                        sort_cols_act.append('ExecutionStage')
-                    act_df = act_df.sort_values(by=sort_cols_act, ascending=True, na_position='last').reset_index(drop=True)
-                
-                # ActivityExecutionOrder: sort by Pipeline A-Z, then by FromExecutionStage smallest to largest
-                if not order_df.empty:
-                    sort_cols = []
-                    if 'Pipeline' in order_df.columns:
-                        sort_cols.append('Pipeline')
-                    if 'FromExecutionStage' in order_df.columns:
-                        sort_cols.append('FromExecutionStage')
-                    if sort_cols:
-                        order_df = order_df.sort_values(by=sort_cols, ascending=True, na_position='last').reset_index(drop=True)
-
-                # Only replace if we have dataframes; this guarantees all keys become columns on-disk
-                if not act_df.empty or not order_df.empty:
-                    try:
-                        with pd.ExcelWriter(excel_file, engine='openpyxl', mode='a', if_sheet_exists='replace') as w2:
-                            if not act_df.empty:
-                                act_df.to_excel(w2, sheet_name='Activities', index=False)
-                            if not order_df.empty:
-                                order_df.to_excel(w2, sheet_name='ActivityExecutionOrder', index=False)
-                        
-                        # Apply formatting to match other sheets (header style, auto-filter, freeze panes)
-                        try:
-                            from openpyxl.utils import get_column_letter
-                            from openpyxl.styles import Font, PatternFill
-                            
-                            wb_tbl = load_workbook(excel_file)
-                            for sheet_name in ['Activities', 'ActivityExecutionOrder']:
-                                if sheet_name in wb_tbl.sheetnames:
-                                    ws_tbl = wb_tbl[sheet_name]
-                                    if ws_tbl.max_row > 1:
-                                        # Bold headers with gray fill (same as _format_sheet)
-                                        for cell in ws_tbl[1]:
-                                            cell.font = Font(bold=True)
-                                            cell.fill = PatternFill(start_color='D3D3D3', end_color='D3D3D3', fill_type='solid')
-                                        # Auto-filter
-                                        ws_tbl.auto_filter.ref = f"A1:{get_column_letter(ws_tbl.max_column)}{ws_tbl.max_row}"
-                                        # Freeze panes
-                                        ws_tbl.freeze_panes = 'A2'
-                            
-                            # Apply column hiding from config (after pandas rewrite)
-                            try:
-                                import json
-                                config_path = getattr(self, '_enhancement_config_path', 'enhancement_config.json')
-                                with open(config_path, 'r') as f:
-                                    hide_cfg = json.load(f).get('hide_config', {})
-                                if hide_cfg.get('enabled', False):
-                                    hidden_columns = hide_cfg.get('hidden_columns', {})
-                                    for sheet_name, cols_to_hide in hidden_columns.items():
-                                        if sheet_name in wb_tbl.sheetnames and cols_to_hide:
-                                            ws = wb_tbl[sheet_name]
-                                            headers = {cell.value: cell.column for cell in ws[1] if cell.value}
-                                            for col_name in cols_to_hide:
-                                                if col_name in headers:
-                                                    col_letter = get_column_letter(headers[col_name])
-                                                    ws.column_dimensions[col_letter].hidden = True
-                                                    ws.column_dimensions[col_letter].width = 0
-                            except Exception:
-                                pass
-                            
-                            wb_tbl.save(excel_file)
-                        except Exception:
-                            pass
-                    except Exception:
-                        # Fallback: append missing headers and populate values row-wise from self.lookup
-                        wb = load_workbook(excel_file)
-                        headers_changed = False
-                        if 'Activities' in wb.sheetnames:
-                            ws = wb['Activities']
-                            headers = [c.value for c in next(ws.iter_rows(min_row=1, max_row=1))]
-                            for col in ('ParseSequence','ExecutionStage','HasDependsOn','DependsOnCount','CycleFlag'):
-                                if col not in headers:
-                                    ws.cell(row=1, column=len(headers) + 1, value=col)
-                                    headers.append(col)
-                                    headers_changed = True
-                            # populate activity-level values using lookup mapping if available
-                            if hasattr(self, 'lookup') and isinstance(self.lookup.get('activities', None), dict):
-                                lookup = self.lookup.get('activities')
-                                header_index = {h: i+1 for i, h in enumerate(headers)}
-                                max_row = ws.max_row
-                                for r in range(2, max_row+1):
-                                    try:
-                                        p = ws.cell(row=r, column=1).value
-                                        a = ws.cell(row=r, column=5).value
-                                        key = (p, a)
-                                        info = lookup.get(key, {})
-                                        if 'ParseSequence' in header_index:
-                                            ws.cell(row=r, column=header_index['ParseSequence'], value=info.get('Sequence') if info else '')
-                                        if 'ExecutionStage' in header_index:
-                                            ws.cell(row=r, column=header_index['ExecutionStage'], value=info.get('ExecutionStage') if info else '')
-                                        if 'HasDependsOn' in header_index:
-                                            ws.cell(row=r, column=header_index['HasDependsOn'], value='Yes' if info and info.get('Dependencies') else 'No')
-                                        if 'DependsOnCount' in header_index:
-                                            deps = info.get('Dependencies') if info else []
-                                            ws.cell(row=r, column=header_index['DependsOnCount'], value=len(deps) if deps else 0)
-                                        if 'CycleFlag' in header_index:
-                                            ws.cell(row=r, column=header_index['CycleFlag'], value='Yes' if info and info.get('ExecutionStage') == 'CYCLE' else 'No')
-                                    except Exception:
-                                        continue
-                        if 'ActivityExecutionOrder' in wb.sheetnames:
-                            ws2 = wb['ActivityExecutionOrder']
-                            headers2 = [c.value for c in next(ws2.iter_rows(min_row=1, max_row=1))]
-                            if 'FromExecutionStage' not in headers2:
-                                ws2.cell(row=1, column=len(headers2) + 1, value='FromExecutionStage')
-                                headers2.append('FromExecutionStage')
-                            if 'ToExecutionStage' not in headers2:
-                                ws2.cell(row=1, column=len(headers2) + 1, value='ToExecutionStage')
-                                headers2.append('ToExecutionStage')
-                            if hasattr(self, 'lookup') and isinstance(self.lookup.get('activities', None), dict):
-                                lookup = self.lookup.get('activities')
-                                header_index2 = {h: i+1 for i, h in enumerate(headers2)}
-                                max_row2 = ws2.max_row
-                                for r in range(2, max_row2+1):
-                                    try:
-                                        p = ws2.cell(row=r, column=1).value
-                                        from_act = ws2.cell(row=r, column=2).value
-                                        to_act = ws2.cell(row=r, column=5).value
-                                        from_stage = lookup.get((p, from_act), {}).get('ExecutionStage', '')
-                                        to_stage = lookup.get((p, to_act), {}).get('ExecutionStage', '')
-                                        if 'FromExecutionStage' in header_index2:
-                                            ws2.cell(row=r, column=header_index2['FromExecutionStage'], value=from_stage)
-                                        if 'ToExecutionStage' in header_index2:
-                                            ws2.cell(row=r, column=header_index2['ToExecutionStage'], value=to_stage)
-                                    except Exception:
-                                        continue
-                        # Save workbook if we changed headers or populated values
-                        try:
-                            if headers_changed:
-                                wb.save(excel_file)
-                                self.logger.info("  ✓ Injected missing ExecutionStage headers/values into workbook")
-                        except Exception:
-                            pass
-                        
-                        # Apply formatting to match other sheets (header style, auto-filter, freeze panes)
-                        try:
-                            from openpyxl import load_workbook
-                            from openpyxl.utils import get_column_letter
-                            from openpyxl.styles import Font, PatternFill
-                            
-                            wb2 = load_workbook(excel_file)
-                            for sheet_name in ['Activities', 'ActivityExecutionOrder']:
-                                if sheet_name in wb2.sheetnames:
-                                    ws = wb2[sheet_name]
-                                    if ws.max_row > 1:
-                                        # Bold headers with gray fill
-                                        for cell in ws[1]:
-                                            cell.font = Font(bold=True)
-                                            cell.fill = PatternFill(start_color='D3D3D3', end_color='D3D3D3', fill_type='solid')
-                                        # Auto-filter
-                                        ws.auto_filter.ref = f"A1:{get_column_letter(ws.max_column)}{ws.max_row}"
-                                        # Freeze panes
-                                        ws.freeze_panes = 'A2'
-                            wb2.save(excel_file)
-                        except Exception:
-                            pass
-            except Exception:
-                pass
+            self.logger.info(f" Export complete with BEAUTIFICATION: {excel_file}")
 
-            shutil.copy(excel_file, archive_file)
-            self.logger.info(f" Archive saved: {archive_file}")
+            async_archive = export_cfg.get('async_archive', False)
 
-            self._auto_copy_to_streamlit(excel_file)
+            # Archive as a hard link (no second copy of the workbook); copy only where links are unsupported
+            try:
+                os.link(excel_file, archive_file)
+                self.logger.info(f" Archive saved: {archive_file}")
+            except OSError:
+                if async_archive:
+                    _copy_in_background(self.logger, 'Archive copy', shutil.copy, excel_file, archive_file)
+                    self.logger.info(f" Archive copy started: {archive_file}")
+                else:
+                    shutil.copy(excel_file, archive_file)
+                    self.logger.info(f" Archive saved: {archive_file}")
+
+            # Background copies are joined at the start of the next export
+            if async_archive:
+                _copy_in_background(self.logger, 'Streamlit copy', self._auto_copy_to_streamlit, excel_file)
+            else:
+                self._auto_copy_to_streamlit(excel_file)
 
         except Exception as e:
+            with contextlib.suppress(OSError):
+                partial_file.unlink()
             self.logger.error(f"Excel export failed: {e}")
             traceback.print_exc()
             raise
@@ -2269,7 +2806,7 @@ def create_enhanced_beautification_method(analyzer_class):
 
         # Load runtime enhancement config (respects dashboard toggle granularity)
         try:
-            _cfg = ENHANCEMENT_CONFIG.get('excel_enhancements', {})
+            _cfg = get_enhancement_config().get('excel_enhancements', {})
         except Exception:
             _cfg = {}
 
@@ -2279,112 +2816,127 @@ def create_enhanced_beautification_method(analyzer_class):
         prot_cfg = _cfg.get('protection', {}) if isinstance(_cfg.get('protection'), dict) else {}
         page_cfg = _cfg.get('page_setup', {}) if isinstance(_cfg.get('page_setup'), dict) else {}
 
-        # PHASE 1: Core formatting
-        if core_cfg.get('enabled', True):
+        core_enabled = core_cfg.get('enabled', True)
+        cond_enabled = cond_cfg.get('enabled', True)
+        link_enabled = link_cfg.get('enabled', True)
+
+        core_features = {
+            'column_sizing': core_cfg.get('column_sizing', True),
+            'number_format': core_cfg.get('number_format', True),
+            'alignment': core_cfg.get('alignment', True),
+            'borders': core_cfg.get('borders', True),
+            'row_shading': core_cfg.get('row_shading', True),
+            'header_style': core_cfg.get('header_style', True)
+        }
+        cond_features = {
+            'data_bars': cond_cfg.get('data_bars', True),
+            'icon_sets': cond_cfg.get('icon_sets', True),
+            'color_scales': cond_cfg.get('color_scales', True),
+            'status_highlighting': cond_cfg.get('status_highlighting', True)
+        }
+
+        # PHASES 1-3 run as one pass: every step for a sheet before moving to the next sheet
+        if core_enabled:
             self.logger.info("  Phase 1/5: Basic formatting (columns, borders, alignment)...")
-            for worksheet in workbook.worksheets:
+        else:
+            self.logger.info("  Phase 1/5: Basic formatting skipped (disabled)")
+        if cond_enabled:
+            self.logger.info("  Phase 2/5: Conditional formatting (data bars, icons, colors)...")
+        else:
+            self.logger.info("  Phase 2/5: Conditional formatting skipped (disabled)")
+        if link_enabled:
+            self.logger.info("  Phase 3/5: Adding hyperlinks and navigation...")
+        else:
+            self.logger.info("  Phase 3/5: Hyperlinks skipped (disabled)")
+
+        formatted = conditioned = 0
+
+        for worksheet in workbook.worksheets:
+            title = worksheet.title
+            sheet_name = title.lower()
+
+            # max_row walks the cell store; header-only sheets (e.g. placeholders) still get
+            # header styling and comments, but there are no data rows to filter or highlight
+            max_row = worksheet.max_row
+            has_data = max_row > 1 and worksheet.max_column > 0
+
+            # PHASE 1: Core formatting
+            if core_enabled:
                 try:
                     MasterFormatter.format_worksheet(
                         worksheet,
-                        sheet_name=worksheet.title,
+                        sheet_name=title,
                         header_row=1,
-                        enable_features={
-                            'column_sizing': core_cfg.get('column_sizing', True),
-                            'number_format': core_cfg.get('number_format', True),
-                            'alignment': core_cfg.get('alignment', True),
-                            'borders': core_cfg.get('borders', True),
-                            'row_shading': core_cfg.get('row_shading', True),
-                            'header_style': core_cfg.get('header_style', True)
-                        }
+                        enable_features=core_features
                     )
+                    formatted += 1
                 except Exception as e:
-                    self.logger.warning(f"Basic formatting failed for {worksheet.title}: {e}")
-        else:
-            self.logger.info("  Phase 1/5: Basic formatting skipped (disabled)")
+                    self.logger.warning(f"Basic formatting failed for {title}: {e}")
 
-        # PHASE 2: Conditional formatting
-        if cond_cfg.get('enabled', True):
-            self.logger.info("  Phase 2/5: Conditional formatting (data bars, icons, colors)...")
-            for worksheet in workbook.worksheets:
+            # PHASE 2: Conditional formatting
+            if cond_enabled and has_data:
                 try:
                     MasterConditionalFormatter.apply_all_conditional_formatting(
                         worksheet,
-                        sheet_name=worksheet.title,
+                        sheet_name=title,
                         header_row=1,
-                        enable_features={
-                            'data_bars': cond_cfg.get('data_bars', True),
-                            'icon_sets': cond_cfg.get('icon_sets', True),
-                            'color_scales': cond_cfg.get('color_scales', True),
-                            'status_highlighting': cond_cfg.get('status_highlighting', True)
-                        }
+                        enable_features=cond_features
                     )
+                    conditioned += 1
                 except Exception as e:
-                    self.logger.warning(f"Conditional formatting failed for {worksheet.title}: {e}")
-        else:
-            self.logger.info("  Phase 2/5: Conditional formatting skipped (disabled)")
-
-        for worksheet in workbook.worksheets:
-            sheet_name = worksheet.title.lower()
+                    self.logger.warning(f"Conditional formatting failed for {title}: {e}")
 
             try:
                 if sheet_name == 'summary':
                     SpecialSheetFormatters.format_summary_sheet(worksheet)
+                elif not has_data:
+                    pass
                 elif 'impact' in sheet_name:
                     SpecialSheetFormatters.format_impact_analysis_sheet(worksheet)
                 elif 'circular' in sheet_name:
                     SpecialSheetFormatters.format_circular_dependencies_sheet(worksheet)
             except Exception as e:
-                self.logger.warning(f"Special formatting failed for {worksheet.title}: {e}")
+                self.logger.warning(f"Special formatting failed for {title}: {e}")
 
-        # PHASE 3: Hyperlinks
-        if link_cfg.get('enabled', True):
-            self.logger.info("  Phase 3/5: Adding hyperlinks and navigation...")
-            
-            # Skip table formatting - use plain filters instead for minimal white appearance
-            # Apply auto-filter to all data sheets for plain appearance
-            for worksheet in workbook.worksheets:
-                sheet_name = worksheet.title
-                # Skip Summary sheet (has custom layout)
-                if 'Summary' in sheet_name:
-                    continue
-                
-                # Apply auto-filter only (no table formatting for plain white look)
-                if worksheet.max_row > 1:
+            # PHASE 3: Hyperlinks
+            if link_enabled:
+                if title == 'Summary':
+                    try:
+                        if link_cfg.get('auto_convert_references', True):
+                            HyperlinkManager.auto_convert_sheet_references(
+                                worksheet,
+                                available_sheets=all_sheet_names,
+                                header_row=1
+                            )
+                        if link_cfg.get('summary_navigation', True):
+                            HyperlinkManager.add_navigation_links_to_summary(
+                                worksheet,
+                                all_sheets=all_sheet_names
+                            )
+                        self.logger.info("   Hyperlinks added to Summary sheet")
+                    except Exception as e:
+                        self.logger.warning(f"Hyperlink creation failed: {e}")
+
+                # Skip table formatting - use plain filters instead for minimal white appearance.
+                # Summary has a custom layout; big sheets formatted as tables carry their own filter.
+                elif has_data and 'Summary' not in title and not worksheet.tables:
                     try:
-                        worksheet.auto_filter.ref = f"A1:{get_column_letter(worksheet.max_column)}{worksheet.max_row}"
+                        worksheet.auto_filter.ref = f"A1:{get_column_letter(worksheet.max_column)}{max_row}"
                     except Exception:
                         pass
-            
-            if 'Summary' in workbook.sheetnames:
-                summary_ws = workbook['Summary']
-                try:
-                    if link_cfg.get('auto_convert_references', True):
-                        HyperlinkManager.auto_convert_sheet_references(
-                            summary_ws,
-                            available_sheets=all_sheet_names,
-                            header_row=1
-                        )
-                    if link_cfg.get('summary_navigation', True):
-                        HyperlinkManager.add_navigation_links_to_summary(
-                            summary_ws,
-                            all_sheets=all_sheet_names
-                        )
-                    self.logger.info("   Hyperlinks added to Summary sheet")
-                except Exception as e:
-                    self.logger.warning(f"Hyperlink creation failed: {e}")
-        else:
-            self.logger.info("  Phase 3/5: Hyperlinks skipped (disabled)")
 
-        for worksheet in workbook.worksheets:
             try:
                 CellCommentManager.auto_add_helpful_comments(
                     worksheet,
-                    sheet_name=worksheet.title,
+                    sheet_name=title,
                     header_row=1
                 )
-            except Exception as e:
+            except Exception:
                 pass  # Comments are optional
 
+        if core_enabled or cond_enabled:
+            self.logger.info(f"   Formatted {formatted} sheets, conditional formatting on {conditioned}")
+
         # PHASE 4: Sheet Protection
         if prot_cfg.get('enabled', False):
             self.logger.info("  Phase 4/5: Applying sheet protection...")
@@ -2416,28 +2968,30 @@ def create_enhanced_beautification_method(analyzer_class):
             self.logger.info("  Phase 5/5: Page setup skipped (disabled)")
 
         # PHASE 6: Hide sheets and columns (config-based)
-        hide_cfg = ENHANCEMENT_CONFIG.get('hide_config', {})
+        hide_cfg = get_enhancement_config().get('hide_config', {})
         if hide_cfg.get('enabled', False):
             self.logger.info("  Phase 6: Applying hide configuration...")
+            existing = set(workbook.sheetnames)
             
             # Hide specified sheets
             hidden_sheets = hide_cfg.get('hidden_sheets', [])
             for sheet_name in hidden_sheets:
-                if sheet_name in workbook.sheetnames:
+                if sheet_name in existing:
                     try:
                         workbook[sheet_name].sheet_state = 'hidden'
                         self.logger.info(f"    Hidden sheet: {sheet_name}")
                     except Exception as e:
                         self.logger.warning(f"Failed to hide sheet {sheet_name}: {e}")
             
-            # Hide specified columns per sheet
+            # Hide specified columns per sheet; the header row decides what is present
+            # (columns dropped from the data by _write_core_data_sheets are simply not found)
             hidden_columns = hide_cfg.get('hidden_columns', {})
             for sheet_name, columns_to_hide in hidden_columns.items():
-                if sheet_name in workbook.sheetnames and columns_to_hide:
+                if sheet_name in existing and columns_to_hide:
                     ws = workbook[sheet_name]
                     try:
                         # Get header row to find column positions
-                        headers = {cell.value: cell.column for cell in ws[1] if cell.value}
+                        headers = _header_index(ws)
                         for col_name in columns_to_hide:
                             if col_name in headers:
                                 col_letter = get_column_letter(headers[col_name])
@@ -2449,9 +3003,23 @@ def create_enhanced_beautification_method(analyzer_class):
 
         self.logger.info(" Enhanced beautification complete!")
 
-    analyzer_class._apply_enhanced_beautification = _apply_enhanced_beautification
+    analyzer_class._apply_enhanced_beautification = _apply_enhanced_beautification
+
+    print("   Enhanced beautification method applied")
+
+@functools.lru_cache(maxsize=1)
+def _resolve_default_class():
+    """Import the analyzer class patched when no class is passed (ImportError is not cached)"""
+    from adf_analyzer_v10_complete import UltimateEnterpriseADFAnalyzer
+    return UltimateEnterpriseADFAnalyzer
+
+def _already_patched(analyzer_class, flag: str) -> bool:
+    """True when ``analyzer_class`` itself (not a base class) was patched at this level"""
+    return bool(vars(analyzer_class).get(flag, False))
 
-    print("   Enhanced beautification method applied")
+def _mark_patched(analyzer_class, *flags: str) -> None:
+    for flag in flags:
+        setattr(analyzer_class, flag, True)
 
 def apply_excel_enhancements(analyzer_class=None, verbose: bool = True):
     """
@@ -2481,55 +3049,56 @@ def apply_excel_enhancements(analyzer_class=None, verbose: bool = True):
 
     if analyzer_class is None:
         try:
-            from adf_analyzer_v10_complete import UltimateEnterpriseADFAnalyzer
-            analyzer_class = UltimateEnterpriseADFAnalyzer
+            analyzer_class = _resolve_default_class()
         except ImportError:
             print(" ERROR: Could not import UltimateEnterpriseADFAnalyzer")
             print("   Make sure adf_analyzer_v10_complete.py is in the same directory")
             return False
 
+    if _already_patched(analyzer_class, '_adf_excel_enhanced'):
+        return True
+
     if verbose:
-        print("\n" + "="*80)
-        print(" APPLYING EXCEL BEAUTIFICATION ENHANCEMENTS")
-        print("="*80 + "\n")
+        print("\n".join((
+            "\n" + "="*80,
+            " APPLYING EXCEL BEAUTIFICATION ENHANCEMENTS",
+            "="*80 + "\n",
+        )))
 
     try:
 
         if verbose:
-            print("📦 Part 1/4: Core Enhancement Framework...")
-
-        if verbose:
-            print("📦 Part 2/4: Conditional Formatting...")
-
-        if verbose:
-            print("📦 Part 3/4: Hyperlinks & Advanced Features...")
-
-        if verbose:
-            print("📦 Part 4/4: Master Integration...")
+            print("📦 Part 1/4: Core Enhancement Framework...\n"
+                  "📦 Part 2/4: Conditional Formatting...\n"
+                  "📦 Part 3/4: Hyperlinks & Advanced Features...\n"
+                  "📦 Part 4/4: Master Integration...")
 
         create_enhanced_export_function(analyzer_class)
         create_enhanced_beautification_method(analyzer_class)
+        _mark_patched(analyzer_class, '_adf_excel_enhanced')
 
         if verbose:
-            print("\n" + "="*80)
-            print(" EXCEL ENHANCEMENTS APPLIED SUCCESSFULLY")
-            print("="*80)
-            print("\n New Features Added:")
-            print("   Intelligent column sizing (content-aware)")
-            print("   Professional cell borders & styling")
-            print("   Alternating row colors")
-            print("   Advanced number formatting (%, thousand separators)")
-            print("   Smart text alignment & wrapping")
-            print("   Data bars (visual progress indicators)")
-            print("   Icon sets (traffic lights, arrows)")
-            print("   Color scales (heat maps)")
-            print("   Status-based highlighting (CRITICAL=red, etc.)")
-            print("    CLICKABLE HYPERLINKS in Summary sheet (CRITICAL FIX!)")
-            print("   Navigation section with all sheets")
-            print("   Sheet protection (allow filtering)")
-            print("   Cell comments/tooltips")
-            print("   Professional print settings")
-            print("="*80 + "\n")
+            print("\n".join((
+                "\n" + "="*80,
+                " EXCEL ENHANCEMENTS APPLIED SUCCESSFULLY",
+                "="*80,
+                "\n New Features Added:",
+                "   Intelligent column sizing (content-aware)",
+                "   Professional cell borders & styling",
+                "   Alternating row colors",
+                "   Advanced number formatting (%, thousand separators)",
+                "   Smart text alignment & wrapping",
+                "   Data bars (visual progress indicators)",
+                "   Icon sets (traffic lights, arrows)",
+                "   Color scales (heat maps)",
+                "   Status-based highlighting (CRITICAL=red, etc.)",
+                "    CLICKABLE HYPERLINKS in Summary sheet (CRITICAL FIX!)",
+                "   Navigation section with all sheets",
+                "   Sheet protection (allow filtering)",
+                "   Cell comments/tooltips",
+                "   Professional print settings",
+                "="*80 + "\n",
+            )))
 
         return True
 
@@ -2546,6 +3115,13 @@ class EnhancementValidator:
     Validates that all enhancements are working correctly
     """
 
+    # Worksheet XML markers (the optional prefix covers writers that qualify the main namespace)
+    _HYPERLINK_TAG = re.compile(rb'<(?:\w+:)?hyperlink\b')
+    _CONDITIONAL_FORMAT_TAG = re.compile(rb'<(?:\w+:)?conditionalFormatting\b')
+    _SHEET_PROTECTION_TAG = re.compile(rb'<(?:\w+:)?sheetProtection\b[^>]*\bsheet="(?:1|true)"')
+    _COLUMN_TAG = re.compile(rb'<(?:\w+:)?col\b[^>]*>')
+    _COLUMN_ATTR = re.compile(rb'\b(min|max|width)="([0-9.]+)"')
+
     @staticmethod
     def validate_enhancements(excel_file: Path) -> Dict[str, bool]:
         """
@@ -2558,8 +3134,6 @@ class EnhancementValidator:
             Dict of validation results
         """
 
-        from openpyxl import load_workbook
-
         results = {
             'file_exists': False,
             'has_multiple_sheets': False,
@@ -2579,50 +3153,65 @@ class EnhancementValidator:
 
             results['file_exists'] = True
 
-            wb = load_workbook(excel_file)
+            # Read-only: cells are only materialised for the two Summary rows inspected below.
+            # Hyperlinks, conditional formats, protection and widths are checked in the sheet XML.
+            wb = load_workbook(excel_file, read_only=True, keep_links=False, data_only=True)
+            archive = zipfile.ZipFile(excel_file)
+
+            try:
+                sheet_parts = {
+                    ws.title: ws._worksheet_path.lstrip('/') for ws in wb.worksheets
+                }
 
-            if len(wb.sheetnames) > 1:
-                results['has_multiple_sheets'] = True
+                def sheet_xml(title: str) -> bytes:
+                    return archive.read(sheet_parts[title])
 
-            if 'Summary' in wb.sheetnames:
-                results['has_summary_sheet'] = True
+                if len(sheet_parts) > 1:
+                    results['has_multiple_sheets'] = True
 
-                summary_ws = wb['Summary']
+                if 'Summary' in sheet_parts:
+                    results['has_summary_sheet'] = True
 
-                for row in summary_ws.iter_rows(min_row=1, max_row=summary_ws.max_row):
-                    for cell in row:
-                        if cell.hyperlink:
-                            results['has_hyperlinks'] = True
+                    summary_ws = wb['Summary']
+                    summary_xml = sheet_xml('Summary')
+
+                    if EnhancementValidator._HYPERLINK_TAG.search(summary_xml):
+                        results['has_hyperlinks'] = True
+
+                    first_row = next(summary_ws.iter_rows(min_row=1, max_row=1), ())
+                    for cell in first_row:
+                        if cell.font and cell.font.bold:
+                            results['has_formatted_headers'] = True
                             break
-                    if results['has_hyperlinks']:
-                        break
 
-                first_row = summary_ws[1]
-                for cell in first_row:
-                    if cell.font and cell.font.bold:
-                        results['has_formatted_headers'] = True
-                        break
+                    second_row = next(summary_ws.iter_rows(min_row=2, max_row=2, max_col=1), ())
+                    if second_row:
+                        test_cell = second_row[0]
+                        if test_cell.border and test_cell.border.left:
+                            results['has_borders'] = True
+
+                    for col_tag in EnhancementValidator._COLUMN_TAG.findall(summary_xml):
+                        attrs = dict(EnhancementValidator._COLUMN_ATTR.findall(col_tag))
+                        if attrs.get(b'min') == b'1':
+                            if float(attrs.get(b'width', 0)) > 8:
+                                results['columns_sized'] = True
+                            break
 
-                if summary_ws.max_row > 1:
-                    test_cell = summary_ws.cell(2, 1)
-                    if test_cell.border and test_cell.border.left:
-                        results['has_borders'] = True
+                for title in sheet_parts:
+                    xml = sheet_xml(title)
 
-                col_width = summary_ws.column_dimensions['A'].width
-                if col_width and col_width > 8:
-                    results['columns_sized'] = True
+                    if EnhancementValidator._CONDITIONAL_FORMAT_TAG.search(xml):
+                        results['has_conditional_formatting'] = True
 
-            for ws in wb.worksheets:
-                if ws.conditional_formatting:
-                    results['has_conditional_formatting'] = True
-                    break
+                    if EnhancementValidator._SHEET_PROTECTION_TAG.search(xml):
+                        results['has_protection'] = True
 
-            for ws in wb.worksheets:
-                if ws.protection.sheet:
-                    results['has_protection'] = True
-                    break
+                    if results['has_conditional_formatting'] and results['has_protection']:
+                        break
 
-            wb.close()
+            finally:
+                archive.close()
+                wb.close()
 
         except Exception as e:
             print(f"  Validation error: {e}")
@@ -2681,9 +3270,167 @@ Usage Guide:
 3. Save the enhanced Excel file
     """)
 
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-from openpyxl.utils import get_column_letter
-from datetime import datetime
+def _summary_named_styles() -> Tuple[NamedStyle, ...]:
+    """
+    Style bundles shared by the repeated Summary rows
+
+    Built fresh for every workbook: a NamedStyle records the style-table
+    indices of the workbook it was added to.
+    """
+    return (
+        NamedStyle(name='adf_summary_header', font=_font(bold=True, size=11), fill=_solid_fill('D3D3D3'),
+                   alignment=ALIGN_MIDDLE, border=THIN_BORDER),
+        NamedStyle(name='adf_summary_category', font=_font(bold=True), border=THIN_BORDER),
+        NamedStyle(name='adf_summary_cell', font=DEFAULT_FONT, border=THIN_BORDER),
+        NamedStyle(name='adf_summary_count', font=_font(bold=True, color='0066CC'), border=THIN_BORDER),
+        NamedStyle(name='adf_summary_link', font=_font(color='0563C1', underline='single'), border=THIN_BORDER),
+        NamedStyle(name='adf_metric_label', font=_font(bold=True, size=10), fill=_solid_fill('E7F3FF'),
+                   alignment=ALIGN_MIDDLE, border=THIN_BORDER),
+        NamedStyle(name='adf_metric_value', font=_font(size=16, bold=True, color='0066CC'),
+                   alignment=ALIGN_MIDDLE, border=THIN_BORDER),
+        NamedStyle(name='adf_recommendation', font=_font(size=10), fill=_solid_fill('FFE6E6'),
+                   alignment=ALIGN_LEFT_WRAP),
+    )
+
+# Fonts/fills repeated across the Summary section rows
+SECTION_FONT = _font(size=14, bold=True, color='FFFFFF')
+LABEL_FONT = _font(bold=True, size=10)
+BOLD_11_FONT = _font(bold=True, size=11)
+WHITE_BOLD_FONT = _font(bold=True, color='FFFFFF')
+SMALL_FONT = _font(size=9)
+NOTE_FONT = _font(size=9, italic=True)
+TABLE_HEADER_FONT = _font(bold=True, size=9)
+TABLE_HEADER_FILL = _solid_fill('E7E6E6')
+GREY_FILL = _solid_fill('D3D3D3')
+
+# Complexity heat map bucket -> (bar font, percentage fill)
+_HEAT_LEVEL_STYLES = MappingProxyType({
+    level: (_font(size=14, color=color), _solid_fill(color))
+    for level, color in (
+        ('Critical (100+)', 'C00000'),
+        ('High (50-99)', 'FF6600'),
+        ('Medium (20-49)', 'FFC000'),
+        ('Low (<20)', '92D050'),
+    )
+})
+
+# Lower bounds of Medium / High / Critical; np.digitize maps scores to bucket 0-3 (Low first)
+_COMPLEXITY_EDGES = np.array([20, 50, 100], dtype=np.float64)
+
+def _complexity_distribution(scores: Iterable[float]) -> Dict[str, int]:
+    """Count scores per heat-map level in display order (Critical first); NaN counts as 0"""
+    values = np.nan_to_num(np.fromiter(scores, dtype=np.float64))
+    counts = np.bincount(np.digitize(values, _COMPLEXITY_EDGES), minlength=4).tolist()
+    return dict(zip(_HEAT_LEVEL_STYLES, reversed(counts)))
+
+# Key for pipeline_analysis rows; the analyzer writes ComplexityScore on every record
+_COMPLEXITY_SCORE = itemgetter('ComplexityScore')
+
+# Bar strings for the Summary charts; 50 blocks is the widest (activity share at 100%)
+_BARS = tuple("█" * length for length in range(51))
+
+def _bar(length: int) -> str:
+    """Bar of ``length`` blocks, served from _BARS when in range"""
+    return _BARS[length] if 0 <= length <= 50 else "█" * length
+
+def _float_score(value) -> float:
+    """Score as float; unparsable values count as 0"""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+# (font, fill) for the severity column of Critical Alerts; unknown severities use the INFO entry
+_SEVERITY_STYLES = MappingProxyType({
+    'CRITICAL': (WHITE_BOLD_FONT, _solid_fill('FF0000')),
+    'HIGH': (WHITE_BOLD_FONT, _solid_fill('FFA500')),
+    'MEDIUM': (_font(bold=True), _solid_fill('FFFF00')),
+    'INFO': (_font(bold=True), None),
+})
+
+# Named style per resource overview column; continuation rows have no category label
+_RESOURCE_ROW_STYLES = ('adf_summary_category', 'adf_summary_cell', 'adf_summary_count', 'adf_summary_link')
+_RESOURCE_CONTINUATION_STYLES = ('adf_summary_cell',) + _RESOURCE_ROW_STYLES[1:]
+
+def _register_summary_styles(workbook) -> None:
+    """Add the Summary named styles to ``workbook`` once"""
+    if 'adf_summary_header' in workbook.named_styles:
+        return
+    for style in _summary_named_styles():
+        workbook.add_named_style(style)
+
+def _display_time(timestamp: str) -> str:
+    """Report timestamp ('%Y%m%d_%H%M%S') in the banner's display format"""
+    try:
+        return datetime.strptime(timestamp, '%Y%m%d_%H%M%S').strftime('%Y-%m-%d %H:%M:%S')
+    except (TypeError, ValueError):
+        return datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+def _emit_alert(ws, row: int, icon: str, severity: str, issue: str, action: str, sheet: str) -> int:
+    """Write one Critical Alerts row and return the next free row"""
+    severity_font, severity_fill = _SEVERITY_STYLES.get(severity, _SEVERITY_STYLES['INFO'])
+
+    _put(ws, row, 1, f"{icon} {issue}", font=BOLD_11_FONT)
+    _put(ws, row, 2, severity, font=severity_font, fill=severity_fill)
+    _put(ws, row, 3, action, font=_font(size=10))
+    _put(ws, row, 4, f" See {sheet}", font=_font(size=10, color='0563C1', underline='single'))
+
+    return row + 1
+
+def _put(ws, row: int, col: int, value, font=None, fill=None, alignment=None, border=None,
+         style: Optional[str] = None):
+    """
+    Write one Summary cell and its styles through a single cell lookup
+
+    ``ws.cell(row, col)`` resolves the coordinate every call; the section
+    writers used to repeat it for the value and for each style attribute.
+    ``style`` names a registered NamedStyle and replaces all four at once.
+    """
+    cell = ws.cell(row, col, value)
+    if style is not None:
+        cell.style = style
+    if font is not None:
+        cell.font = font
+    if fill is not None:
+        cell.fill = fill
+    if alignment is not None:
+        cell.alignment = alignment
+    if border is not None:
+        cell.border = border
+    return cell
+
+@functools.lru_cache(maxsize=4096)
+def _row_span(row: int, first: str = 'A', last: str = 'D') -> str:
+    """'A{row}:D{row}' merge range for one Summary row (the section writers merge the same rows every report)"""
+    return f'{first}{row}:{last}{row}'
+
+def _section_header(ws, row: int, title: str, color: str, font: Font = SECTION_FONT) -> None:
+    """Coloured A:D section banner used by every Summary section"""
+    _put(ws, row, 1, title, font=font, fill=_solid_fill(color), alignment=ALIGN_SECTION)
+    ws.merge_cells(_row_span(row))
+
+def _write_heat_map(ws, start_row: int, title: str, color: str, scores: Iterable[float],
+                    font: Font = SECTION_FONT) -> int:
+    """Complexity heat map section: banner, then one row per level with count, bar and share"""
+    _section_header(ws, start_row, title, color, font=font)
+    start_row += 1
+
+    distribution = _complexity_distribution(scores)
+    total = sum(distribution.values())
+
+    for level, count in distribution.items():
+        percentage = (count / total * 100) if total > 0 else 0
+        bar_font, level_fill = _HEAT_LEVEL_STYLES[level]
+
+        _put(ws, start_row, 1, level, font=LABEL_FONT)
+        _put(ws, start_row, 2, count, font=BOLD_11_FONT, alignment=ALIGN_HCENTER)
+        _put(ws, start_row, 3, _bar(int(percentage / 5)), font=bar_font)  # Scale to fit
+        _put(ws, start_row, 4, f"{percentage:.1f}%",
+             font=WHITE_BOLD_FONT, fill=level_fill, alignment=ALIGN_HCENTER)
+
+        start_row += 1
+
+    return start_row + 1
 
 def create_enhanced_summary_sheet_writer(analyzer_class):
     """
@@ -2698,6 +3445,33 @@ def create_enhanced_summary_sheet_writer(analyzer_class):
     - Navigation links
     """
 
+    def _summary_stats(self) -> SimpleNamespace:
+        """
+         Counts shared by the Summary sections, computed once per sheet
+        """
+
+        resources = self.resources
+        results = self.results
+        by_impact = Counter(p.get('Impact') for p in results['impact_analysis'])
+
+        return SimpleNamespace(
+            resources=len(resources['all']),
+            pipelines=len(resources['pipelines']),
+            activities=len(results['activities']),
+            dataflows=len(resources['dataflows']),
+            datasets=len(resources['datasets']),
+            linked_services=len(resources['linkedServices']),
+            triggers=len(resources['triggers']),
+            integration_runtimes=len(resources['integrationRuntimes']),
+            circular=len(results['circular_dependencies']),
+            orphaned_pipelines=len(results['orphaned_pipelines']),
+            orphaned_datasets=len(results['orphaned_datasets']),
+            orphaned_linked_services=len(results['orphaned_linked_services']),
+            broken_triggers=sum(1 for t in results['orphaned_triggers'] if t.get('Type') == 'BrokenReference'),
+            stopped_triggers=sum(1 for t in results['triggers'] if t.get('State') == 'Stopped'),
+            critical_pipelines=by_impact['CRITICAL'],
+        )
+
     def _write_enhanced_summary_sheet(self, writer, timestamp: str):
         """
          ENHANCED SUMMARY SHEET
@@ -2711,46 +3485,45 @@ def create_enhanced_summary_sheet_writer(analyzer_class):
         6. Navigation Links (bottom)
         """
 
-        import pandas as pd
-
         workbook = writer.book
 
-        df_init = pd.DataFrame({'_': ['']})
-        sheet_name = self._get_unique_sheet_name('Summary')
-        df_init.to_excel(writer, sheet_name=sheet_name, index=False, header=False)
-
-        ws = writer.sheets[sheet_name]
+        ws = workbook.create_sheet(title=self._get_unique_sheet_name('Summary'))
+        _register_summary_styles(workbook)
 
         ws.column_dimensions['A'].width = 25
         ws.column_dimensions['B'].width = 35
         ws.column_dimensions['C'].width = 15
         ws.column_dimensions['D'].width = 50
 
+        stats = self._summary_stats()
+        now_str = _display_time(timestamp)
+        src_str = str(self.json_path)
+
         current_row = 1
 
-        current_row = self._write_project_banner(ws, current_row, timestamp)
+        current_row = self._write_project_banner(ws, current_row, timestamp, now_str, src_str)
 
         current_row += 2
-        current_row = self._write_executive_summary(ws, current_row)
+        current_row = self._write_executive_summary(ws, current_row, stats)
 
         current_row += 2
-        current_row = self._write_critical_alerts(ws, current_row)
+        current_row = self._write_critical_alerts(ws, current_row, stats)
 
         current_row += 2
-        current_row = self._write_metrics_dashboard(ws, current_row)
+        current_row = self._write_metrics_dashboard(ws, current_row, stats)
 
         current_row += 2
-        current_row = self._write_resource_overview(ws, current_row)
+        current_row = self._write_resource_overview(ws, current_row, stats)
 
         current_row += 2
-        current_row = self._write_recommendations(ws, current_row)
+        current_row = self._write_recommendations(ws, current_row, stats)
 
         current_row += 2
         current_row = self._write_detailed_statistics(ws, current_row, timestamp)
 
         self.logger.info(f"  ✓ Enhanced Summary")
 
-    def _write_project_banner(self, ws, start_row: int, timestamp: str) -> int:
+    def _write_project_banner(self, ws, start_row: int, timestamp: str, now_str: str, src_str: str) -> int:
         """
          Write beautiful project banner
 
@@ -2761,409 +3534,204 @@ def create_enhanced_summary_sheet_writer(analyzer_class):
         └─────────────────────────────────────────────────────────────────┘
         """
 
-        title_cell = ws.cell(start_row, 1)
-        title_cell.value = "🏭 AZURE DATA FACTORY - ARM TEMPLATE ANALYSIS REPORT"
-
-        ws.merge_cells(f'A{start_row}:D{start_row}')
-
-        title_cell.font = Font(
-            name='Calibri',
-            size=18,
-            bold=True,
-            color='FFFFFF'
-        )
-        title_cell.fill = PatternFill(
-            start_color='0066CC',
-            end_color='0066CC',
-            fill_type='solid'
-        )
-        title_cell.alignment = Alignment(
-            horizontal='center',
-            vertical='center'
-        )
-
-        start_row += 1
-        subtitle_cell = ws.cell(start_row, 1)
-        subtitle_cell.value = "Enterprise-Grade Architecture Assessment & Comprehensive Analysis"
-        ws.merge_cells(f'A{start_row}:D{start_row}')
-
-        subtitle_cell.font = Font(
-            name='Calibri',
-            size=12,
-            italic=True,
-            color='FFFFFF'
-        )
-        subtitle_cell.fill = PatternFill(
-            start_color='0099FF',
-            end_color='0099FF',
-            fill_type='solid'
-        )
-        subtitle_cell.alignment = Alignment(
-            horizontal='center',
-            vertical='center'
-        )
-
-        start_row += 1
-
-        ws.cell(start_row, 1).value = "📄 Source Template:"
-        ws.cell(start_row, 2).value = str(self.json_path)
-        ws.cell(start_row, 1).font = Font(bold=True)
+        _put(ws, start_row, 1, "🏭 AZURE DATA FACTORY - ARM TEMPLATE ANALYSIS REPORT",
+             font=_font(name='Calibri', size=18, bold=True, color='FFFFFF'),
+             fill=_solid_fill('0066CC'),
+             alignment=ALIGN_MIDDLE)
+        ws.merge_cells(_row_span(start_row))
 
         start_row += 1
-
-        ws.cell(start_row, 1).value = "📅 Analysis Date:"
-        ws.cell(start_row, 2).value = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        ws.cell(start_row, 1).font = Font(bold=True)
+        _put(ws, start_row, 1, "Enterprise-Grade Architecture Assessment & Comprehensive Analysis",
+             font=_font(name='Calibri', size=12, italic=True, color='FFFFFF'),
+             fill=_solid_fill('0099FF'),
+             alignment=ALIGN_MIDDLE)
+        ws.merge_cells(_row_span(start_row))
 
         start_row += 1
 
-        ws.cell(start_row, 1).value = "🔧 Analyzer Version:"
-        ws.cell(start_row, 2).value = "v10.0 - Production Ready (Enhanced Edition)"
-        ws.cell(start_row, 1).font = Font(bold=True)
-
-        start_row += 1
+        details = [
+            ("📄 Source Template:", src_str),
+            ("📅 Analysis Date:", now_str),
+            ("🔧 Analyzer Version:", "v10.0 - Production Ready (Enhanced Edition)"),
+            ("👤 Generated By:", "Ultimate Enterprise ADF Analyzer"),
+        ]
 
-        ws.cell(start_row, 1).value = "👤 Generated By:"
-        ws.cell(start_row, 2).value = "Ultimate Enterprise ADF Analyzer"
-        ws.cell(start_row, 1).font = Font(bold=True)
+        for label, value in details:
+            _put(ws, start_row, 1, label, font=_font(bold=True))
+            _put(ws, start_row, 2, value)
+            start_row += 1
 
-        return start_row + 1
+        return start_row
 
-    def _write_executive_summary(self, ws, start_row: int) -> int:
+    def _write_executive_summary(self, ws, start_row: int, stats: SimpleNamespace) -> int:
         """
          Write executive summary section
         """
 
-        header_cell = ws.cell(start_row, 1)
-        header_cell.value = " EXECUTIVE SUMMARY"
-        ws.merge_cells(f'A{start_row}:D{start_row}')
-
-        header_cell.font = Font(
-            name='Calibri',
-            size=14,
-            bold=True,
-            color='FFFFFF'
-        )
-        header_cell.fill = PatternFill(
-            start_color='2F5496',
-            end_color='2F5496',
-            fill_type='solid'
-        )
-        header_cell.alignment = Alignment(
-            horizontal='left',
-            vertical='center'
-        )
+        _section_header(ws, start_row, " EXECUTIVE SUMMARY",
+                        '2F5496', font=_font(name='Calibri', size=14, bold=True, color='FFFFFF'))
 
         start_row += 1
 
-        total_resources = len(self.resources['all'])
-        total_pipelines = len(self.resources['pipelines'])
-        total_activities = len(self.results['activities'])
-        total_dataflows = len(self.resources['dataflows'])
-
-        orphaned_count = (
-            len(self.results['orphaned_pipelines']) +
-            len(self.results['orphaned_dataflows']) +
-            len(self.results['orphaned_datasets']) +
-            len(self.results['orphaned_linked_services'])
-        )
-
-        circular_deps = len(self.results['circular_dependencies'])
-
         summary_items = [
-            (" Total Resources Analyzed", total_resources, "All ARM template resources"),
-            ("🔄 Active Pipelines", total_pipelines, "Data orchestration workflows"),
-            ("⚡ Total Activities", total_activities, "Execution steps across all pipelines"),
-            ("🌊 Data Flows", total_dataflows, "ETL transformation flows"),
+            (" Total Resources Analyzed", stats.resources, "All ARM template resources"),
+            ("🔄 Active Pipelines", stats.pipelines, "Data orchestration workflows"),
+            ("⚡ Total Activities", stats.activities, "Execution steps across all pipelines"),
+            ("🌊 Data Flows", stats.dataflows, "ETL transformation flows"),
         ]
 
-        for label, value, description in summary_items:
-            ws.cell(start_row, 1).value = label
-            ws.cell(start_row, 2).value = value
-            ws.cell(start_row, 3).value = description
-
-            ws.cell(start_row, 1).font = Font(bold=True, size=11)
-            ws.cell(start_row, 2).font = Font(size=11, bold=True, color='0066CC')
-            ws.cell(start_row, 3).font = Font(size=10, italic=True)
+        value_font = _font(size=11, bold=True, color='0066CC')
+        description_font = _font(size=10, italic=True)
 
+        for label, value, description in summary_items:
+            _put(ws, start_row, 1, label, font=BOLD_11_FONT)
+            _put(ws, start_row, 2, value, font=value_font)
+            _put(ws, start_row, 3, description, font=description_font)
             start_row += 1
 
         return start_row
 
-    def _write_critical_alerts(self, ws, start_row: int) -> int:
+    def _write_critical_alerts(self, ws, start_row: int, stats: SimpleNamespace) -> int:
         """
          Write critical alerts section
         """
 
-        header_cell = ws.cell(start_row, 1)
-        header_cell.value = "🚨 CRITICAL ALERTS & ACTION ITEMS"
-        ws.merge_cells(f'A{start_row}:D{start_row}')
-
-        header_cell.font = Font(
-            name='Calibri',
-            size=14,
-            bold=True,
-            color='FFFFFF'
-        )
-        header_cell.fill = PatternFill(
-            start_color='C00000',
-            end_color='C00000',
-            fill_type='solid'
-        )
-        header_cell.alignment = Alignment(
-            horizontal='left',
-            vertical='center'
-        )
+        _section_header(ws, start_row, "🚨 CRITICAL ALERTS & ACTION ITEMS",
+                        'C00000', font=_font(name='Calibri', size=14, bold=True, color='FFFFFF'))
 
         start_row += 1
 
-        circular_deps = len(self.results['circular_dependencies'])
-        orphaned_pipelines = len(self.results['orphaned_pipelines'])
-        broken_triggers = len([t for t in self.results['orphaned_triggers'] if t.get('Type') == 'BrokenReference'])
-
-        critical_impact_pipelines = len([
-            p for p in self.results['impact_analysis']
-            if p.get('Impact') == 'CRITICAL'
-        ])
-
-        alerts = []
-
-        if circular_deps > 0:
-            alerts.append({
-                'icon': '',
-                'severity': 'CRITICAL',
-                'issue': f'{circular_deps} Circular Dependencies Detected',
-                'action': 'Fix immediately - can cause infinite loops',
-                'sheet': 'CircularDependencies'
-            })
-
-        if broken_triggers > 0:
-            alerts.append({
-                'icon': '',
-                'severity': 'HIGH',
-                'issue': f'{broken_triggers} Broken Trigger References',
-                'action': 'Update trigger pipeline references',
-                'sheet': 'OrphanedTriggers'
-            })
-
-        if orphaned_pipelines > 10:
-            alerts.append({
-                'icon': '',
-                'severity': 'MEDIUM',
-                'issue': f'{orphaned_pipelines} Orphaned Pipelines',
-                'action': 'Review and clean up unused pipelines',
-                'sheet': 'OrphanedPipelines'
-            })
-
-        if critical_impact_pipelines > 0:
-            alerts.append({
-                'icon': 'ℹ',
-                'severity': 'INFO',
-                'issue': f'{critical_impact_pipelines} High-Impact Pipelines',
-                'action': 'Review dependencies carefully before changes',
-                'sheet': 'ImpactAnalysis'
-            })
-
-        if alerts:
-            for alert in alerts:
-
-                issue_cell = ws.cell(start_row, 1)
-                issue_cell.value = f"{alert['icon']} {alert['issue']}"
-                issue_cell.font = Font(bold=True, size=11)
-
-                severity_cell = ws.cell(start_row, 2)
-                severity_cell.value = alert['severity']
-                severity_cell.font = Font(bold=True)
+        first_alert_row = start_row
 
-                if alert['severity'] == 'CRITICAL':
-                    severity_cell.fill = PatternFill(start_color='FF0000', end_color='FF0000', fill_type='solid')
-                    severity_cell.font = Font(bold=True, color='FFFFFF')
-                elif alert['severity'] == 'HIGH':
-                    severity_cell.fill = PatternFill(start_color='FFA500', end_color='FFA500', fill_type='solid')
-                    severity_cell.font = Font(bold=True, color='FFFFFF')
-                elif alert['severity'] == 'MEDIUM':
-                    severity_cell.fill = PatternFill(start_color='FFFF00', end_color='FFFF00', fill_type='solid')
+        if stats.circular > 0:
+            start_row = _emit_alert(ws, start_row, '', 'CRITICAL',
+                                    f'{stats.circular} Circular Dependencies Detected',
+                                    'Fix immediately - can cause infinite loops', 'CircularDependencies')
 
-                ws.cell(start_row, 3).value = alert['action']
-                ws.cell(start_row, 3).font = Font(size=10)
+        if stats.broken_triggers > 0:
+            start_row = _emit_alert(ws, start_row, '', 'HIGH',
+                                    f'{stats.broken_triggers} Broken Trigger References',
+                                    'Update trigger pipeline references', 'OrphanedTriggers')
 
-                ws.cell(start_row, 4).value = f" See {alert['sheet']}"
-                ws.cell(start_row, 4).font = Font(size=10, color='0563C1', underline='single')
+        if stats.orphaned_pipelines > 10:
+            start_row = _emit_alert(ws, start_row, '', 'MEDIUM',
+                                    f'{stats.orphaned_pipelines} Orphaned Pipelines',
+                                    'Review and clean up unused pipelines', 'OrphanedPipelines')
 
-                start_row += 1
-        else:
+        if stats.critical_pipelines > 0:
+            start_row = _emit_alert(ws, start_row, 'ℹ', 'INFO',
+                                    f'{stats.critical_pipelines} High-Impact Pipelines',
+                                    'Review dependencies carefully before changes', 'ImpactAnalysis')
 
-            ws.cell(start_row, 1).value = " No critical issues detected"
-            ws.cell(start_row, 1).font = Font(bold=True, color='00B050', size=11)
-            ws.merge_cells(f'A{start_row}:D{start_row}')
+        if start_row == first_alert_row:
+            _put(ws, start_row, 1, " No critical issues detected", font=_font(bold=True, color='00B050', size=11))
+            ws.merge_cells(_row_span(start_row))
             start_row += 1
 
         return start_row
 
-    def _write_metrics_dashboard(self, ws, start_row: int) -> int:
+    def _write_metrics_dashboard(self, ws, start_row: int, stats: SimpleNamespace) -> int:
         """
          Write key metrics dashboard
         """
 
-        header_cell = ws.cell(start_row, 1)
-        header_cell.value = " KEY METRICS DASHBOARD"
-        ws.merge_cells(f'A{start_row}:D{start_row}')
-
-        header_cell.font = Font(size=14, bold=True, color='FFFFFF')
-        header_cell.fill = PatternFill(start_color='2F5496', end_color='2F5496', fill_type='solid')
-        header_cell.alignment = Alignment(horizontal='left', vertical='center')
+        _section_header(ws, start_row, " KEY METRICS DASHBOARD", '2F5496')
 
         start_row += 2
 
         metrics = [
 
             [
-                ("Total Pipelines", len(self.resources['pipelines']), "🔄"),
-                ("Total Activities", len(self.results['activities']), "⚡"),
-                ("Data Flows", len(self.resources['dataflows']), "🌊")
+                ("Total Pipelines", stats.pipelines, "🔄"),
+                ("Total Activities", stats.activities, "⚡"),
+                ("Data Flows", stats.dataflows, "🌊")
             ],
 
             [
-                ("Datasets", len(self.resources['datasets']), ""),
-                ("Linked Services", len(self.resources['linkedServices']), "🔗"),
-                ("Triggers", len(self.resources['triggers']), "⏰")
+                ("Datasets", stats.datasets, ""),
+                ("Linked Services", stats.linked_services, "🔗"),
+                ("Triggers", stats.triggers, "⏰")
             ]
         ]
 
-        col_offset = 0
         for row_metrics in metrics:
-            col = 1
-            for label, value, icon in row_metrics:
-
-                metric_cell = ws.cell(start_row, col)
-                metric_cell.value = f"{icon} {label}"
-                metric_cell.font = Font(bold=True, size=10)
-                metric_cell.fill = PatternFill(start_color='E7F3FF', end_color='E7F3FF', fill_type='solid')
-                metric_cell.alignment = Alignment(horizontal='center', vertical='center')
-                metric_cell.border = ExcelBorders.thin_border()
-
-                value_cell = ws.cell(start_row + 1, col)
-                value_cell.value = value
-                value_cell.font = Font(size=16, bold=True, color='0066CC')
-                value_cell.alignment = Alignment(horizontal='center', vertical='center')
-                value_cell.border = ExcelBorders.thin_border()
-
-                col += 1
+            for col, (label, value, icon) in enumerate(row_metrics, 1):
+                _put(ws, start_row, col, f"{icon} {label}", style='adf_metric_label')
+                _put(ws, start_row + 1, col, value, style='adf_metric_value')
 
             start_row += 2
 
         return start_row + 1
 
-    def _write_resource_overview(self, ws, start_row: int) -> int:
+    def _write_resource_overview(self, ws, start_row: int, stats: SimpleNamespace) -> int:
         """
          Write resource overview section
         """
 
-        header_cell = ws.cell(start_row, 1)
-        header_cell.value = "📦 RESOURCE OVERVIEW"
-        ws.merge_cells(f'A{start_row}:D{start_row}')
-
-        header_cell.font = Font(size=14, bold=True, color='FFFFFF')
-        header_cell.fill = PatternFill(start_color='2F5496', end_color='2F5496', fill_type='solid')
-        header_cell.alignment = Alignment(horizontal='left', vertical='center')
+        _section_header(ws, start_row, "📦 RESOURCE OVERVIEW", '2F5496')
 
         start_row += 1
 
         headers = ['Category', 'Resource Type', 'Count', 'Details']
         for col, header in enumerate(headers, 1):
-            cell = ws.cell(start_row, col)
-            cell.value = header
-            cell.font = Font(bold=True, size=11)
-            cell.fill = PatternFill(start_color='D3D3D3', end_color='D3D3D3', fill_type='solid')
-            cell.alignment = Alignment(horizontal='center', vertical='center')
-            cell.border = ExcelBorders.thin_border()
+            _put(ws, start_row, col, header, style='adf_summary_header')
 
         start_row += 1
 
         resources_data = [
-            ('CORE RESOURCES', 'Pipelines', len(self.resources['pipelines']), ' PipelineAnalysis'),
-            ('', 'DataFlows', len(self.resources['dataflows']), ' DataFlows'),
-            ('', 'Datasets', len(self.resources['datasets']), ' Datasets'),
-            ('', 'Linked Services', len(self.resources['linkedServices']), ' LinkedServices'),
-            ('', 'Triggers', len(self.resources['triggers']), ' Triggers'),
-            ('', 'Integration Runtimes', len(self.resources['integrationRuntimes']), ' IntegrationRuntimes'),
+            ('CORE RESOURCES', 'Pipelines', stats.pipelines, ' PipelineAnalysis'),
+            ('', 'DataFlows', stats.dataflows, ' DataFlows'),
+            ('', 'Datasets', stats.datasets, ' Datasets'),
+            ('', 'Linked Services', stats.linked_services, ' LinkedServices'),
+            ('', 'Triggers', stats.triggers, ' Triggers'),
+            ('', 'Integration Runtimes', stats.integration_runtimes, ' IntegrationRuntimes'),
             ('ANALYSIS', 'Activity Dependencies', len(self.results['activity_execution_order']), ' ActivityExecutionOrder'),
             ('', 'Data Lineage Records', len(self.results['data_lineage']), ' DataLineage'),
-            ('', 'Circular Dependencies', len(self.results['circular_dependencies']), ' CircularDependencies'),
-            ('QUALITY', 'Orphaned Pipelines', len(self.results['orphaned_pipelines']), ' OrphanedPipelines'),
-            ('', 'Orphaned Datasets', len(self.results['orphaned_datasets']), ' OrphanedDatasets'),
+            ('', 'Circular Dependencies', stats.circular, ' CircularDependencies'),
+            ('QUALITY', 'Orphaned Pipelines', stats.orphaned_pipelines, ' OrphanedPipelines'),
+            ('', 'Orphaned Datasets', stats.orphaned_datasets, ' OrphanedDatasets'),
         ]
 
-        for category, resource_type, count, link in resources_data:
-            ws.cell(start_row, 1).value = category
-            ws.cell(start_row, 2).value = resource_type
-            ws.cell(start_row, 3).value = count
-            ws.cell(start_row, 4).value = link
-
-            if category:
-                ws.cell(start_row, 1).font = Font(bold=True)
-
-            ws.cell(start_row, 3).font = Font(bold=True, color='0066CC')
-            ws.cell(start_row, 4).font = Font(color='0563C1', underline='single')
-
-            for col in range(1, 5):
-                ws.cell(start_row, col).border = ExcelBorders.thin_border()
+        for row in resources_data:
+            styles = _RESOURCE_ROW_STYLES if row[0] else _RESOURCE_CONTINUATION_STYLES
+            for col, (value, style) in enumerate(zip(row, styles), 1):
+                _put(ws, start_row, col, value, style=style)
 
             start_row += 1
 
         return start_row
 
-    def _write_recommendations(self, ws, start_row: int) -> int:
+    def _write_recommendations(self, ws, start_row: int, stats: SimpleNamespace) -> int:
         """
          Write recommendations section
         """
 
-        header_cell = ws.cell(start_row, 1)
-        header_cell.value = " RECOMMENDATIONS & NEXT STEPS"
-        ws.merge_cells(f'A{start_row}:D{start_row}')
-
-        header_cell.font = Font(size=14, bold=True, color='FFFFFF')
-        header_cell.fill = PatternFill(start_color='00B050', end_color='00B050', fill_type='solid')
-        header_cell.alignment = Alignment(horizontal='left', vertical='center')
+        _section_header(ws, start_row, " RECOMMENDATIONS & NEXT STEPS", '00B050')
 
         start_row += 1
 
         recommendations = []
 
-        if self.results['circular_dependencies']:
+        if stats.circular:
             recommendations.append(
                 "1.  URGENT: Fix circular dependencies immediately - they can cause infinite execution loops"
             )
 
-        total_orphaned = (
-            len(self.results['orphaned_pipelines']) +
-            len(self.results['orphaned_datasets']) +
-            len(self.results['orphaned_linked_services'])
-        )
+        total_orphaned = stats.orphaned_pipelines + stats.orphaned_datasets + stats.orphaned_linked_services
 
         if total_orphaned > 20:
             recommendations.append(
                 f"2. 🧹 Clean up {total_orphaned} orphaned resources to reduce maintenance overhead"
             )
 
-        critical_pipelines = [
-            p for p in self.results['impact_analysis']
-            if p.get('Impact') == 'CRITICAL'
-        ]
-
-        if critical_pipelines:
+        if stats.critical_pipelines:
             recommendations.append(
-                f"3.   Review {len(critical_pipelines)} critical-impact pipelines before making changes"
+                f"3.   Review {stats.critical_pipelines} critical-impact pipelines before making changes"
             )
 
-        stopped_triggers = [
-            t for t in self.results['triggers']
-            if t.get('State') == 'Stopped'
-        ]
-
-        if stopped_triggers:
+        if stats.stopped_triggers:
             recommendations.append(
-                f"4. ⏸  Investigate {len(stopped_triggers)} stopped triggers - are they intentional?"
+                f"4. ⏸  Investigate {stats.stopped_triggers} stopped triggers - are they intentional?"
             )
 
         recommendations.append(
@@ -3179,15 +3747,8 @@ def create_enhanced_summary_sheet_writer(analyzer_class):
         )
 
         for rec in recommendations:
-            ws.cell(start_row, 1).value = rec
-            ws.merge_cells(f'A{start_row}:D{start_row}')
-            ws.cell(start_row, 1).alignment = Alignment(horizontal='left', vertical='top', wrap_text=True)
-            ws.cell(start_row, 1).font = Font(size=10)
-
-            if '' in rec:
-                ws.cell(start_row, 1).fill = PatternFill(start_color='FFE6E6', end_color='FFE6E6', fill_type='solid')
-            elif '' in rec:
-                ws.cell(start_row, 1).fill = PatternFill(start_color='FFF2CC', end_color='FFF2CC', fill_type='solid')
+            _put(ws, start_row, 1, rec, style='adf_recommendation')
+            ws.merge_cells(_row_span(start_row))
 
             ws.row_dimensions[start_row].height = 25
             start_row += 1
@@ -3199,18 +3760,13 @@ def create_enhanced_summary_sheet_writer(analyzer_class):
          Write detailed statistics (original content)
         """
 
-        header_cell = ws.cell(start_row, 1)
-        header_cell.value = " DETAILED STATISTICS"
-        ws.merge_cells(f'A{start_row}:D{start_row}')
-
-        header_cell.font = Font(size=14, bold=True, color='FFFFFF')
-        header_cell.fill = PatternFill(start_color='2F5496', end_color='2F5496', fill_type='solid')
-        header_cell.alignment = Alignment(horizontal='left', vertical='center')
+        _section_header(ws, start_row, " DETAILED STATISTICS", '2F5496')
 
         start_row += 1
 
         return start_row
 
+    analyzer_class._summary_stats = _summary_stats
     analyzer_class._write_summary_sheet = _write_enhanced_summary_sheet
     analyzer_class._write_project_banner = _write_project_banner
     analyzer_class._write_executive_summary = _write_executive_summary
@@ -3229,16 +3785,20 @@ def apply_excel_enhancements_with_summary(analyzer_class=None, verbose: bool = T
 
     if analyzer_class is None:
         try:
-            from adf_analyzer_v10_complete import UltimateEnterpriseADFAnalyzer
-            analyzer_class = UltimateEnterpriseADFAnalyzer
+            analyzer_class = _resolve_default_class()
         except ImportError:
             print(" ERROR: Could not import UltimateEnterpriseADFAnalyzer")
             return False
 
+    if _already_patched(analyzer_class, '_adf_excel_enhanced_with_summary'):
+        return True
+
     if verbose:
-        print("\n" + "="*80)
-        print(" APPLYING EXCEL BEAUTIFICATION ENHANCEMENTS (WITH ENHANCED SUMMARY)")
-        print("="*80 + "\n")
+        print("\n".join((
+            "\n" + "="*80,
+            " APPLYING EXCEL BEAUTIFICATION ENHANCEMENTS (WITH ENHANCED SUMMARY)",
+            "="*80 + "\n",
+        )))
 
     try:
 
@@ -3248,29 +3808,33 @@ def apply_excel_enhancements_with_summary(analyzer_class=None, verbose: bool = T
         if verbose:
             print("📦 Part 4: Master integration...")
 
-        create_enhanced_export_function(analyzer_class)
-        create_enhanced_beautification_method(analyzer_class)
+        if not _already_patched(analyzer_class, '_adf_excel_enhanced'):
+            create_enhanced_export_function(analyzer_class)
+            create_enhanced_beautification_method(analyzer_class)
 
         if verbose:
             print("📦 Part 5: Enhanced Summary Sheet...")
 
         create_enhanced_summary_sheet_writer(analyzer_class)
+        _mark_patched(analyzer_class, '_adf_excel_enhanced', '_adf_excel_enhanced_with_summary')
 
         if verbose:
-            print("\n" + "="*80)
-            print(" ALL EXCEL ENHANCEMENTS APPLIED SUCCESSFULLY")
-            print("="*80)
-            print("\n New Features Added:")
-            print("   Beautiful project banner in Summary sheet")
-            print("   Executive summary section")
-            print("   Critical alerts dashboard")
-            print("   Key metrics visualization")
-            print("   Automated recommendations")
-            print("   Professional formatting throughout")
-            print("   Clickable hyperlinks")
-            print("   Data bars, icon sets, color scales")
-            print("   Sheet protection")
-            print("="*80 + "\n")
+            print("\n".join((
+                "\n" + "="*80,
+                " ALL EXCEL ENHANCEMENTS APPLIED SUCCESSFULLY",
+                "="*80,
+                "\n New Features Added:",
+                "   Beautiful project banner in Summary sheet",
+                "   Executive summary section",
+                "   Critical alerts dashboard",
+                "   Key metrics visualization",
+                "   Automated recommendations",
+                "   Professional formatting throughout",
+                "   Clickable hyperlinks",
+                "   Data bars, icon sets, color scales",
+                "   Sheet protection",
+                "="*80 + "\n",
+            )))
 
         return True
 
@@ -3280,14 +3844,10 @@ def apply_excel_enhancements_with_summary(analyzer_class=None, verbose: bool = T
             traceback.print_exc()
         return False
 
-print(" Part 5/6 loaded: Enhanced Summary Sheet module loaded")
+if _DEBUG:
+    print(" Part 5/6 loaded: Enhanced Summary Sheet module loaded")
 """Excel Enhancement Module - Professional Excel formatting and styling capabilities"""
 
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-from openpyxl.utils import get_column_letter
-from collections import Counter
-import math
-
 def add_advanced_summary_sections(analyzer_class):
     """
      ADD ADVANCED SUMMARY SECTIONS
@@ -3305,7 +3865,7 @@ def add_advanced_summary_sections(analyzer_class):
     10. Quick Action Buttons
     """
 
-    def _write_health_score_dashboard(self, ws, start_row: int) -> int:
+    def _write_health_score_dashboard(self, ws, start_row: int, stats: SimpleNamespace) -> int:
         """
          HEALTH SCORE DASHBOARD
 
@@ -3317,42 +3877,28 @@ def add_advanced_summary_sections(analyzer_class):
         - Maintainability Score
         """
 
-        header_cell = ws.cell(start_row, 1)
-        header_cell.value = "🏥 FACTORY HEALTH SCORE DASHBOARD"
-        ws.merge_cells(f'A{start_row}:D{start_row}')
-
-        header_cell.font = Font(size=14, bold=True, color='FFFFFF')
-        header_cell.fill = PatternFill(start_color='00B050', end_color='00B050', fill_type='solid')
-        header_cell.alignment = Alignment(horizontal='left', vertical='center')
+        _section_header(ws, start_row, "🏥 FACTORY HEALTH SCORE DASHBOARD", '00B050')
 
         start_row += 1
 
-        quality_score = self._calculate_quality_score()
-        performance_score = self._calculate_performance_score()
-        security_score = self._calculate_security_score()
-        maintainability_score = self._calculate_maintainability_score()
-
-        overall_health = int(
-            quality_score * 0.3 +
-            performance_score * 0.2 +
-            security_score * 0.3 +
-            maintainability_score * 0.2
-        )
+        health = stats.health
+        quality_score = health.quality
+        performance_score = health.performance
+        security_score = health.security
+        maintainability_score = health.maintainability
+        overall_health = health.overall
 
-        ws.cell(start_row, 1).value = "OVERALL HEALTH"
-        ws.cell(start_row, 1).font = Font(bold=True, size=12)
-        ws.merge_cells(f'A{start_row}:B{start_row}')
+        _put(ws, start_row, 1, "OVERALL HEALTH", font=_font(bold=True, size=12))
+        ws.merge_cells(_row_span(start_row, 'A', 'B'))
 
-        health_cell = ws.cell(start_row, 3)
-        health_cell.value = f"{overall_health}/100"
-        health_cell.font = Font(size=24, bold=True, color=self._get_health_color(overall_health))
-        health_cell.alignment = Alignment(horizontal='center', vertical='center')
-        ws.merge_cells(f'C{start_row}:D{start_row}')
+        _put(ws, start_row, 3, f"{overall_health}/100",
+             font=_font(size=24, bold=True, color=self._get_health_color(overall_health)),
+             alignment=ALIGN_MIDDLE)
+        ws.merge_cells(_row_span(start_row, 'C', 'D'))
 
-        ws.cell(start_row + 1, 3).value = self._get_health_status(overall_health)
-        ws.cell(start_row + 1, 3).font = Font(bold=True, size=11)
-        ws.merge_cells(f'C{start_row + 1}:D{start_row + 1}')
-        ws.cell(start_row + 1, 3).alignment = Alignment(horizontal='center')
+        _put(ws, start_row + 1, 3, self._get_health_status(overall_health),
+             font=BOLD_11_FONT, alignment=ALIGN_HCENTER)
+        ws.merge_cells(_row_span(start_row + 1, 'C', 'D'))
 
         start_row += 3
 
@@ -3365,20 +3911,14 @@ def add_advanced_summary_sections(analyzer_class):
 
         for label, score, description in scores:
 
-            ws.cell(start_row, 1).value = label
-            ws.cell(start_row, 1).font = Font(bold=True, size=10)
+            _put(ws, start_row, 1, label, font=LABEL_FONT)
 
-            score_cell = ws.cell(start_row, 2)
-            score_cell.value = f"{score}/100"
-            score_cell.font = Font(size=11, bold=True, color=self._get_health_color(score))
-            score_cell.alignment = Alignment(horizontal='center')
+            score_color = self._get_health_color(score)
+            _put(ws, start_row, 2, f"{score}/100", font=_font(size=11, bold=True, color=score_color), alignment=ALIGN_HCENTER)
 
-            progress_cell = ws.cell(start_row, 3)
-            progress_cell.value = "█" * int(score / 10)
-            progress_cell.font = Font(size=14, color=self._get_health_color(score))
+            _put(ws, start_row, 3, _bar(int(score / 10)), font=_font(size=14, color=score_color))
 
-            ws.cell(start_row, 4).value = description
-            ws.cell(start_row, 4).font = Font(size=9, italic=True)
+            _put(ws, start_row, 4, description, font=NOTE_FONT)
 
             start_row += 1
 
@@ -3395,33 +3935,22 @@ def add_advanced_summary_sections(analyzer_class):
         - Cost-saving recommendations
         """
 
-        header_cell = ws.cell(start_row, 1)
-        header_cell.value = "💰 COST ANALYSIS & OPTIMIZATION OPPORTUNITIES"
-        ws.merge_cells(f'A{start_row}:D{start_row}')
-
-        header_cell.font = Font(size=14, bold=True, color='FFFFFF')
-        header_cell.fill = PatternFill(start_color='FF6600', end_color='FF6600', fill_type='solid')
-        header_cell.alignment = Alignment(horizontal='left', vertical='center')
+        _section_header(ws, start_row, "💰 COST ANALYSIS & OPTIMIZATION OPPORTUNITIES", 'FF6600')
 
         start_row += 1
 
         total_pipelines = len(self.resources['pipelines'])
-        total_copy_activities = len([a for a in self.results['activities'] if a.get('ActivityType') == 'Copy'])
+        total_copy_activities = sum(
+            1 for a in self.results['activities'] if a.get('ActivityType') == 'Copy'
+        )
         total_dataflows = len(self.resources['dataflows'])
 
         estimated_diu_hours = total_copy_activities * 2  # Avg 2 DIU hours per copy
         estimated_monthly_cost = estimated_diu_hours * 0.25  # $0.25 per DIU-hour (example)
 
-        ws.cell(start_row, 1).value = "Resource Type"
-        ws.cell(start_row, 2).value = "Count"
-        ws.cell(start_row, 3).value = "Est. Monthly Cost"
-        ws.cell(start_row, 4).value = "Optimization Potential"
-
-        for col in range(1, 5):
-            cell = ws.cell(start_row, col)
-            cell.font = Font(bold=True, size=10)
-            cell.fill = PatternFill(start_color='D3D3D3', end_color='D3D3D3', fill_type='solid')
-            cell.border = ExcelBorders.thin_border()
+        headers = ['Resource Type', 'Count', 'Est. Monthly Cost', 'Optimization Potential']
+        for col, header in enumerate(headers, 1):
+            _put(ws, start_row, col, header, font=LABEL_FONT, fill=GREY_FILL, border=THIN_BORDER)
 
         start_row += 1
 
@@ -3433,22 +3962,16 @@ def add_advanced_summary_sections(analyzer_class):
         ]
 
         for resource_type, count, cost, optimization in cost_items:
-            ws.cell(start_row, 1).value = resource_type
-            ws.cell(start_row, 2).value = count
-            ws.cell(start_row, 2).font = Font(bold=True, color='0066CC')
-            ws.cell(start_row, 3).value = cost
-            ws.cell(start_row, 4).value = optimization
-            ws.cell(start_row, 4).font = Font(size=9, italic=True)
-
-            for col in range(1, 5):
-                ws.cell(start_row, col).border = ExcelBorders.thin_border()
+            _put(ws, start_row, 1, resource_type, border=THIN_BORDER)
+            _put(ws, start_row, 2, count, font=_font(bold=True, color='0066CC'), border=THIN_BORDER)
+            _put(ws, start_row, 3, cost, border=THIN_BORDER)
+            _put(ws, start_row, 4, optimization, font=NOTE_FONT, border=THIN_BORDER)
 
             start_row += 1
 
         start_row += 1
-        ws.cell(start_row, 1).value = " Cost Optimization Opportunities:"
-        ws.cell(start_row, 1).font = Font(bold=True, size=11, color='FF6600')
-        ws.merge_cells(f'A{start_row}:D{start_row}')
+        _put(ws, start_row, 1, " Cost Optimization Opportunities:", font=_font(bold=True, size=11, color='FF6600'))
+        ws.merge_cells(_row_span(start_row))
         start_row += 1
 
         orphaned_count = len(self.results['orphaned_pipelines']) + len(self.results['orphaned_datasets'])
@@ -3463,9 +3986,8 @@ def add_advanced_summary_sections(analyzer_class):
         ]
 
         for opp in opportunities:
-            ws.cell(start_row, 1).value = opp
-            ws.merge_cells(f'A{start_row}:D{start_row}')
-            ws.cell(start_row, 1).font = Font(size=10)
+            _put(ws, start_row, 1, opp, font=_font(size=10))
+            ws.merge_cells(_row_span(start_row))
             start_row += 1
 
         return start_row + 1
@@ -3477,72 +3999,8 @@ def add_advanced_summary_sections(analyzer_class):
         Visual representation of pipeline complexity distribution
         """
 
-        header_cell = ws.cell(start_row, 1)
-        header_cell.value = "🌡 COMPLEXITY HEAT MAP"
-        ws.merge_cells(f'A{start_row}:D{start_row}')
-
-        header_cell.font = Font(size=14, bold=True, color='FFFFFF')
-        header_cell.fill = PatternFill(start_color='8B4513', end_color='8B4513', fill_type='solid')
-        header_cell.alignment = Alignment(horizontal='left', vertical='center')
-
-        start_row += 1
-
-        complexity_distribution = {
-            'Critical (100+)': 0,
-            'High (50-99)': 0,
-            'Medium (20-49)': 0,
-            'Low (<20)': 0
-        }
-
-        for pipeline in self.results['pipeline_analysis']:
-            score = pipeline.get('ComplexityScore', 0)
-
-            if score >= 100:
-                complexity_distribution['Critical (100+)'] += 1
-            elif score >= 50:
-                complexity_distribution['High (50-99)'] += 1
-            elif score >= 20:
-                complexity_distribution['Medium (20-49)'] += 1
-            else:
-                complexity_distribution['Low (<20)'] += 1
-
-        total_pipelines = sum(complexity_distribution.values())
-
-        colors = {
-            'Critical (100+)': 'C00000',
-            'High (50-99)': 'FF6600',
-            'Medium (20-49)': 'FFC000',
-            'Low (<20)': '92D050'
-        }
-
-        for level, count in complexity_distribution.items():
-            percentage = (count / total_pipelines * 100) if total_pipelines > 0 else 0
-
-            ws.cell(start_row, 1).value = level
-            ws.cell(start_row, 1).font = Font(bold=True, size=10)
-
-            ws.cell(start_row, 2).value = count
-            ws.cell(start_row, 2).font = Font(bold=True, size=11)
-            ws.cell(start_row, 2).alignment = Alignment(horizontal='center')
-
-            bar_length = int(percentage / 5)  # Scale to fit
-            bar_cell = ws.cell(start_row, 3)
-            bar_cell.value = "█" * bar_length
-            bar_cell.font = Font(size=14, color=colors[level])
-
-            ws.cell(start_row, 4).value = f"{percentage:.1f}%"
-            ws.cell(start_row, 4).font = Font(size=10)
-            ws.cell(start_row, 4).fill = PatternFill(
-                start_color=colors[level],
-                end_color=colors[level],
-                fill_type='solid'
-            )
-            ws.cell(start_row, 4).font = Font(bold=True, color='FFFFFF')
-            ws.cell(start_row, 4).alignment = Alignment(horizontal='center')
-
-            start_row += 1
-
-        return start_row + 1
+        return _write_heat_map(ws, start_row, "🌡 COMPLEXITY HEAT MAP", '8B4513',
+                               map(_COMPLEXITY_SCORE, self.results['pipeline_analysis']))
 
     def _write_dataflow_complexity_heat_map(self, ws, start_row: int) -> int:
         """
@@ -3551,123 +4009,55 @@ def add_advanced_summary_sections(analyzer_class):
         Visual representation of dataflow transformation complexity distribution
         """
 
-        header_cell = ws.cell(start_row, 1)
-        header_cell.value = "🔬 DATAFLOW COMPLEXITY HEAT MAP"
-        ws.merge_cells(f'A{start_row}:D{start_row}')
-
-        header_cell.font = Font(size=12, bold=True, color='FFFFFF')
-        header_cell.fill = PatternFill(start_color='4B0082', end_color='4B0082', fill_type='solid')
-        header_cell.alignment = Alignment(horizontal='left', vertical='center')
-
-        start_row += 1
-
-        complexity_distribution = {
-            'Critical (100+)': 0,
-            'High (50-99)': 0,
-            'Medium (20-49)': 0,
-            'Low (<20)': 0
-        }
-
-        for df in self.results.get('dataflows', []):
-            score = df.get('TransformationScore', 0)
-            try:
-                score = float(score)
-            except:
-                score = 0
-
-            if score >= 100:
-                complexity_distribution['Critical (100+)'] += 1
-            elif score >= 50:
-                complexity_distribution['High (50-99)'] += 1
-            elif score >= 20:
-                complexity_distribution['Medium (20-49)'] += 1
-            else:
-                complexity_distribution['Low (<20)'] += 1
-
-        total = sum(complexity_distribution.values())
-
-        colors = {
-            'Critical (100+)': 'C00000',
-            'High (50-99)': 'FF6600',
-            'Medium (20-49)': 'FFC000',
-            'Low (<20)': '92D050'
-        }
-
-        for level, count in complexity_distribution.items():
-            pct = (count / total * 100) if total > 0 else 0
-
-            ws.cell(start_row, 1).value = level
-            ws.cell(start_row, 1).font = Font(bold=True, size=10)
-
-            ws.cell(start_row, 2).value = count
-            ws.cell(start_row, 2).font = Font(bold=True, size=11)
-            ws.cell(start_row, 2).alignment = Alignment(horizontal='center')
-
-            bar_length = int(pct / 5)
-            bar_cell = ws.cell(start_row, 3)
-            bar_cell.value = "█" * bar_length
-            bar_cell.font = Font(size=14, color=colors[level])
-
-            ws.cell(start_row, 4).value = f"{pct:.1f}%"
-            ws.cell(start_row, 4).font = Font(size=10)
-            ws.cell(start_row, 4).fill = PatternFill(start_color=colors[level], end_color=colors[level], fill_type='solid')
-            ws.cell(start_row, 4).font = Font(bold=True, color='FFFFFF')
-            ws.cell(start_row, 4).alignment = Alignment(horizontal='center')
-
-            start_row += 1
-
-        return start_row + 1
+        return _write_heat_map(ws, start_row, "🔬 DATAFLOW COMPLEXITY HEAT MAP", '4B0082',
+                               (_float_score(df.get('TransformationScore', 0))
+                                for df in self.results.get('dataflows', [])),
+                               font=_font(size=12, bold=True, color='FFFFFF'))
 
     def _write_performance_insights(self, ws, start_row: int) -> int:
         """
          PERFORMANCE INSIGHTS & BOTTLENECK DETECTION
         """
 
-        header_cell = ws.cell(start_row, 1)
-        header_cell.value = "⚡ PERFORMANCE INSIGHTS & BOTTLENECK DETECTION"
-        ws.merge_cells(f'A{start_row}:D{start_row}')
-
-        header_cell.font = Font(size=14, bold=True, color='FFFFFF')
-        header_cell.fill = PatternFill(start_color='9900CC', end_color='9900CC', fill_type='solid')
-        header_cell.alignment = Alignment(horizontal='left', vertical='center')
+        _section_header(ws, start_row, "⚡ PERFORMANCE INSIGHTS & BOTTLENECK DETECTION", '9900CC')
 
         start_row += 1
 
         bottlenecks = []
 
-        large_pipelines = [
-            p for p in self.results['pipeline_analysis']
-            if p.get('TotalActivities', 0) > 50
-        ]
+        large_pipelines = deep_nesting = sequential_pipelines = 0
+        for p in self.results['pipeline_analysis']:
+            total_activities = p.get('TotalActivities', 0)
+            if total_activities > 50:
+                large_pipelines += 1
+            if p.get('MaxNestingDepth', 0) > 5:
+                deep_nesting += 1
+            if p.get('LoopActivities', 0) > 0 and total_activities > 20:
+                sequential_pipelines += 1
+
+        auto_resolve_count = sum(
+            1 for a in self.results['activities']
+            if a.get('IntegrationRuntime') == 'AutoResolveIR'
+        )
 
         if large_pipelines:
             bottlenecks.append({
                 'type': ' Large Pipelines',
-                'count': len(large_pipelines),
-                'description': f'{len(large_pipelines)} pipelines with >50 activities',
+                'count': large_pipelines,
+                'description': f'{large_pipelines} pipelines with >50 activities',
                 'impact': 'Long execution times',
                 'recommendation': 'Consider splitting into smaller pipelines'
             })
 
-        deep_nesting = [
-            p for p in self.results['pipeline_analysis']
-            if p.get('MaxNestingDepth', 0) > 5
-        ]
-
         if deep_nesting:
             bottlenecks.append({
                 'type': '🔄 Deep Nesting',
-                'count': len(deep_nesting),
-                'description': f'{len(deep_nesting)} pipelines with nesting depth >5',
+                'count': deep_nesting,
+                'description': f'{deep_nesting} pipelines with nesting depth >5',
                 'impact': 'Complex debugging, maintenance issues',
                 'recommendation': 'Flatten control flow structures'
             })
 
-        auto_resolve_count = len([
-            a for a in self.results['activities']
-            if a.get('IntegrationRuntime') == 'AutoResolveIR'
-        ])
-
         if auto_resolve_count > 100:
             bottlenecks.append({
                 'type': '🌐 AutoResolve IR',
@@ -3677,16 +4067,11 @@ def add_advanced_summary_sections(analyzer_class):
                 'recommendation': 'Specify dedicated Integration Runtimes'
             })
 
-        sequential_pipelines = [
-            p for p in self.results['pipeline_analysis']
-            if p.get('LoopActivities', 0) > 0 and p.get('TotalActivities', 0) > 20
-        ]
-
         if sequential_pipelines:
             bottlenecks.append({
                 'type': '🐌 Sequential Processing',
-                'count': len(sequential_pipelines),
-                'description': f'{len(sequential_pipelines)} pipelines may benefit from parallelization',
+                'count': sequential_pipelines,
+                'description': f'{sequential_pipelines} pipelines may benefit from parallelization',
                 'impact': 'Slow overall execution',
                 'recommendation': 'Use ForEach with parallel execution'
             })
@@ -3695,37 +4080,23 @@ def add_advanced_summary_sections(analyzer_class):
 
             headers = ['Bottleneck Type', 'Count', 'Impact', 'Recommendation']
             for col, header in enumerate(headers, 1):
-                cell = ws.cell(start_row, col)
-                cell.value = header
-                cell.font = Font(bold=True, size=10)
-                cell.fill = PatternFill(start_color='D3D3D3', end_color='D3D3D3', fill_type='solid')
-                cell.border = ExcelBorders.thin_border()
-                cell.alignment = Alignment(horizontal='center')
+                _put(ws, start_row, col, header, font=LABEL_FONT, fill=GREY_FILL,
+                     alignment=ALIGN_HCENTER, border=THIN_BORDER)
 
             start_row += 1
 
             for bottleneck in bottlenecks:
-                ws.cell(start_row, 1).value = bottleneck['type']
-                ws.cell(start_row, 1).font = Font(bold=True, size=10)
-
-                ws.cell(start_row, 2).value = bottleneck['count']
-                ws.cell(start_row, 2).font = Font(bold=True, color='CC0000')
-                ws.cell(start_row, 2).alignment = Alignment(horizontal='center')
-
-                ws.cell(start_row, 3).value = bottleneck['impact']
-                ws.cell(start_row, 3).font = Font(size=9)
-
-                ws.cell(start_row, 4).value = bottleneck['recommendation']
-                ws.cell(start_row, 4).font = Font(size=9, italic=True)
-
-                for col in range(1, 5):
-                    ws.cell(start_row, col).border = ExcelBorders.thin_border()
+                _put(ws, start_row, 1, bottleneck['type'], font=LABEL_FONT, border=THIN_BORDER)
+                _put(ws, start_row, 2, bottleneck['count'],
+                     font=_font(bold=True, color='CC0000'), alignment=ALIGN_HCENTER, border=THIN_BORDER)
+                _put(ws, start_row, 3, bottleneck['impact'], font=SMALL_FONT, border=THIN_BORDER)
+                _put(ws, start_row, 4, bottleneck['recommendation'], font=NOTE_FONT, border=THIN_BORDER)
 
                 start_row += 1
         else:
-            ws.cell(start_row, 1).value = " No significant performance bottlenecks detected!"
-            ws.merge_cells(f'A{start_row}:D{start_row}')
-            ws.cell(start_row, 1).font = Font(bold=True, color='00B050', size=11)
+            _put(ws, start_row, 1, " No significant performance bottlenecks detected!",
+                 font=_font(bold=True, color='00B050', size=11))
+            ws.merge_cells(_row_span(start_row))
             start_row += 1
 
         return start_row + 1
@@ -3740,109 +4111,81 @@ def add_advanced_summary_sections(analyzer_class):
         - Most active pipelines
         """
 
-        header_cell = ws.cell(start_row, 1)
-        header_cell.value = " TOP PIPELINES RANKING"
-        ws.merge_cells(f'A{start_row}:D{start_row}')
-
-        header_cell.font = Font(size=14, bold=True, color='FFFFFF')
-        header_cell.fill = PatternFill(start_color='FFD700', end_color='FFD700', fill_type='solid')
-        header_cell.alignment = Alignment(horizontal='left', vertical='center')
+        _section_header(ws, start_row, " TOP PIPELINES RANKING", 'FFD700')
 
         start_row += 1
 
-        ws.cell(start_row, 1).value = "🔥 Most Complex Pipelines"
-        ws.cell(start_row, 1).font = Font(bold=True, size=11, color='C00000')
-        ws.merge_cells(f'A{start_row}:D{start_row}')
+        _put(ws, start_row, 1, "🔥 Most Complex Pipelines", font=_font(bold=True, size=11, color='C00000'))
+        ws.merge_cells(_row_span(start_row))
         start_row += 1
 
-        ws.cell(start_row, 1).value = "Rank"
-        ws.cell(start_row, 2).value = "Pipeline"
-        ws.cell(start_row, 3).value = "Complexity"
-        ws.cell(start_row, 4).value = "Activities"
-
-        for col in range(1, 5):
-            ws.cell(start_row, col).font = Font(bold=True, size=9)
-            ws.cell(start_row, col).fill = PatternFill(start_color='E7E6E6', end_color='E7E6E6', fill_type='solid')
+        for col, header in enumerate(("Rank", "Pipeline", "Complexity", "Activities"), 1):
+            _put(ws, start_row, col, header, font=TABLE_HEADER_FONT, fill=TABLE_HEADER_FILL)
 
         start_row += 1
 
-        sorted_pipelines = sorted(
+        # Only the top 10 are shown: a bounded heap avoids sorting every pipeline
+        sorted_pipelines = heapq.nlargest(
+            10,
             self.results['pipeline_analysis'],
-            key=lambda p: p.get('ComplexityScore', 0),
-            reverse=True
-        )[:10]
+            key=_COMPLEXITY_SCORE
+        )
 
         for rank, pipeline in enumerate(sorted_pipelines, 1):
             medal = "🥇" if rank == 1 else "🥈" if rank == 2 else "🥉" if rank == 3 else f"{rank}."
 
-            ws.cell(start_row, 1).value = medal
-            ws.cell(start_row, 1).alignment = Alignment(horizontal='center')
+            _put(ws, start_row, 1, medal, alignment=ALIGN_HCENTER)
 
-            ws.cell(start_row, 2).value = pipeline['Pipeline']
-            ws.cell(start_row, 2).font = Font(size=9)
+            _put(ws, start_row, 2, pipeline['Pipeline'], font=SMALL_FONT)
 
-            ws.cell(start_row, 3).value = pipeline.get('ComplexityScore', 0)
-            ws.cell(start_row, 3).font = Font(bold=True, color='C00000')
-            ws.cell(start_row, 3).alignment = Alignment(horizontal='center')
+            _put(ws, start_row, 3, pipeline['ComplexityScore'],
+                 font=_font(bold=True, color='C00000'), alignment=ALIGN_HCENTER)
 
-            ws.cell(start_row, 4).value = pipeline.get('TotalActivities', 0)
-            ws.cell(start_row, 4).alignment = Alignment(horizontal='center')
+            _put(ws, start_row, 4, pipeline['TotalActivities'], alignment=ALIGN_HCENTER)
 
             start_row += 1
 
         start_row += 1
 
-        ws.cell(start_row, 1).value = "💥 Highest Impact Pipelines"
-        ws.cell(start_row, 1).font = Font(bold=True, size=11, color='FF6600')
-        ws.merge_cells(f'A{start_row}:D{start_row}')
+        _put(ws, start_row, 1, "💥 Highest Impact Pipelines", font=_font(bold=True, size=11, color='FF6600'))
+        ws.merge_cells(_row_span(start_row))
         start_row += 1
 
-        ws.cell(start_row, 1).value = "Rank"
-        ws.cell(start_row, 2).value = "Pipeline"
-        ws.cell(start_row, 3).value = "Impact"
-        ws.cell(start_row, 4).value = "Blast Radius"
-
-        for col in range(1, 5):
-            ws.cell(start_row, col).font = Font(bold=True, size=9)
-            ws.cell(start_row, col).fill = PatternFill(start_color='E7E6E6', end_color='E7E6E6', fill_type='solid')
+        for col, header in enumerate(("Rank", "Pipeline", "Impact", "Blast Radius"), 1):
+            _put(ws, start_row, col, header, font=TABLE_HEADER_FONT, fill=TABLE_HEADER_FILL)
 
         start_row += 1
 
-        impact_order = {'CRITICAL': 0, 'HIGH': 1, 'MEDIUM': 2, 'LOW': 3}
-        sorted_impact = sorted(
+        impact_rank = {'CRITICAL': 0, 'HIGH': 1, 'MEDIUM': 2, 'LOW': 3}.get
+        sorted_impact = heapq.nsmallest(
+            10,
             self.results['impact_analysis'],
-            key=lambda p: (impact_order.get(p.get('Impact', 'LOW'), 99), -p.get('BlastRadius', 0))
-        )[:10]
+            key=lambda p: (impact_rank(p['Impact'], 99), -p['BlastRadius'])
+        )
 
         for rank, pipeline in enumerate(sorted_impact, 1):
             medal = "🥇" if rank == 1 else "🥈" if rank == 2 else "🥉" if rank == 3 else f"{rank}."
 
-            ws.cell(start_row, 1).value = medal
-            ws.cell(start_row, 1).alignment = Alignment(horizontal='center')
+            _put(ws, start_row, 1, medal, alignment=ALIGN_HCENTER)
 
-            ws.cell(start_row, 2).value = pipeline['Pipeline']
-            ws.cell(start_row, 2).font = Font(size=9)
-
-            impact = pipeline.get('Impact', 'UNKNOWN')
-            ws.cell(start_row, 3).value = impact
-            ws.cell(start_row, 3).font = Font(bold=True)
-            ws.cell(start_row, 3).alignment = Alignment(horizontal='center')
+            _put(ws, start_row, 2, pipeline['Pipeline'], font=SMALL_FONT)
 
+            impact = pipeline['Impact']
             if impact == 'CRITICAL':
-                ws.cell(start_row, 3).fill = PatternFill(start_color='C00000', end_color='C00000', fill_type='solid')
-                ws.cell(start_row, 3).font = Font(bold=True, color='FFFFFF')
+                impact_font, impact_fill = WHITE_BOLD_FONT, _solid_fill('C00000')
             elif impact == 'HIGH':
-                ws.cell(start_row, 3).fill = PatternFill(start_color='FF6600', end_color='FF6600', fill_type='solid')
-                ws.cell(start_row, 3).font = Font(bold=True, color='FFFFFF')
+                impact_font, impact_fill = WHITE_BOLD_FONT, _solid_fill('FF6600')
+            else:
+                impact_font, impact_fill = _font(bold=True), None
+            _put(ws, start_row, 3, impact, font=impact_font, fill=impact_fill, alignment=ALIGN_HCENTER)
 
-            ws.cell(start_row, 4).value = pipeline.get('BlastRadius', 0)
-            ws.cell(start_row, 4).alignment = Alignment(horizontal='center')
+            _put(ws, start_row, 4, pipeline['BlastRadius'], alignment=ALIGN_HCENTER)
 
             start_row += 1
 
         return start_row + 1
 
-    def _write_security_compliance_checklist(self, ws, start_row: int) -> int:
+    def _write_security_compliance_checklist(self, ws, start_row: int, stats: SimpleNamespace) -> int:
         """
          SECURITY & COMPLIANCE CHECKLIST
 
@@ -3853,23 +4196,15 @@ def add_advanced_summary_sections(analyzer_class):
         - Network security
         """
 
-        header_cell = ws.cell(start_row, 1)
-        header_cell.value = "🔒 SECURITY & COMPLIANCE CHECKLIST"
-        ws.merge_cells(f'A{start_row}:D{start_row}')
-
-        header_cell.font = Font(size=14, bold=True, color='FFFFFF')
-        header_cell.fill = PatternFill(start_color='CC0000', end_color='CC0000', fill_type='solid')
-        header_cell.alignment = Alignment(horizontal='left', vertical='center')
+        _section_header(ws, start_row, "🔒 SECURITY & COMPLIANCE CHECKLIST", 'CC0000')
 
         start_row += 1
 
         checks = []
 
-        kv_usage = len([
-            ls for ls in self.results['linked_services']
-            if ls.get('UsesKeyVault') == 'Yes'
-        ])
-        total_ls = len(self.results['linked_services'])
+        security = stats.security
+        kv_usage = security.key_vault
+        total_ls = security.linked_services
         kv_percentage = (kv_usage / total_ls * 100) if total_ls > 0 else 0
 
         checks.append({
@@ -3879,10 +4214,7 @@ def add_advanced_summary_sections(analyzer_class):
             'recommendation': 'Good practice' if kv_percentage > 50 else 'Consider using Key Vault for secrets'
         })
 
-        mi_usage = len([
-            ls for ls in self.results['linked_services']
-            if 'Managed Identity' in ls.get('Authentication', '')
-        ])
+        mi_usage = security.managed_identity
         mi_percentage = (mi_usage / total_ls * 100) if total_ls > 0 else 0
 
         checks.append({
@@ -3892,10 +4224,7 @@ def add_advanced_summary_sections(analyzer_class):
             'recommendation': 'Good security practice' if mi_percentage > 30 else 'Consider Managed Identity for Azure resources'
         })
 
-        self_hosted_ir = len([
-            ir for ir in self.results['integration_runtimes']
-            if ir.get('Type') == 'SelfHosted'
-        ])
+        self_hosted_ir = security.self_hosted
 
         checks.append({
             'check': 'Self-Hosted IR Security',
@@ -3904,10 +4233,7 @@ def add_advanced_summary_sections(analyzer_class):
             'recommendation': 'Ensure network security and patching for self-hosted IRs'
         })
 
-        vnet_irs = len([
-            ir for ir in self.results['integration_runtimes']
-            if ir.get('VNetIntegration') == 'Yes'
-        ])
+        vnet_irs = security.vnet
 
         checks.append({
             'check': 'VNet Integration',
@@ -3926,26 +4252,13 @@ def add_advanced_summary_sections(analyzer_class):
         })
 
         for check in checks:
-            ws.cell(start_row, 1).value = check['check']
-            ws.cell(start_row, 1).font = Font(bold=True, size=10)
-
-            ws.cell(start_row, 2).value = check['status']
-            ws.cell(start_row, 2).font = Font(bold=True, size=10)
-            ws.cell(start_row, 2).alignment = Alignment(horizontal='center')
-
-            if '' in check['status']:
-                ws.cell(start_row, 2).fill = PatternFill(start_color='D4EDDA', end_color='D4EDDA', fill_type='solid')
-            elif '' in check['status']:
-                ws.cell(start_row, 2).fill = PatternFill(start_color='FFF3CD', end_color='FFF3CD', fill_type='solid')
-
-            ws.cell(start_row, 3).value = check['detail']
-            ws.cell(start_row, 3).font = Font(size=9)
+            _put(ws, start_row, 1, check['check'], font=LABEL_FONT, border=THIN_BORDER)
 
-            ws.cell(start_row, 4).value = check['recommendation']
-            ws.cell(start_row, 4).font = Font(size=9, italic=True)
+            _put(ws, start_row, 2, check['status'], font=LABEL_FONT,
+                 fill=_solid_fill('D4EDDA'), alignment=ALIGN_HCENTER, border=THIN_BORDER)
 
-            for col in range(1, 5):
-                ws.cell(start_row, col).border = ExcelBorders.thin_border()
+            _put(ws, start_row, 3, check['detail'], font=SMALL_FONT, border=THIN_BORDER)
+            _put(ws, start_row, 4, check['recommendation'], font=NOTE_FONT, border=THIN_BORDER)
 
             start_row += 1
 
@@ -3958,36 +4271,24 @@ def add_advanced_summary_sections(analyzer_class):
         Visual chart of activity type usage
         """
 
-        header_cell = ws.cell(start_row, 1)
-        header_cell.value = " ACTIVITY TYPE DISTRIBUTION"
-        ws.merge_cells(f'A{start_row}:D{start_row}')
-
-        header_cell.font = Font(size=14, bold=True, color='FFFFFF')
-        header_cell.fill = PatternFill(start_color='4472C4', end_color='4472C4', fill_type='solid')
-        header_cell.alignment = Alignment(horizontal='left', vertical='center')
+        _section_header(ws, start_row, " ACTIVITY TYPE DISTRIBUTION", '4472C4')
 
         start_row += 1
 
-        top_activities = self.metrics['activity_types'].most_common(15)
-        total_activities = sum(self.metrics['activity_types'].values())
-
-        for activity_type, count in top_activities:
-            percentage = (count / total_activities * 100) if total_activities > 0 else 0
-
-            ws.cell(start_row, 1).value = activity_type
-            ws.cell(start_row, 1).font = Font(size=9)
-
-            ws.cell(start_row, 2).value = count
-            ws.cell(start_row, 2).font = Font(bold=True, size=10)
-            ws.cell(start_row, 2).alignment = Alignment(horizontal='center')
+        activity_types = self.metrics['activity_types']
+        total_activities = sum(activity_types.values())
 
-            bar_length = int(percentage / 2)  # Scale
-            ws.cell(start_row, 3).value = "█" * bar_length
-            ws.cell(start_row, 3).font = Font(size=12, color='4472C4')
-
-            ws.cell(start_row, 4).value = f"{percentage:.1f}%"
-            ws.cell(start_row, 4).font = Font(size=9)
+        # Derive every row up front so the loop below only writes cells
+        rows = [(activity_type, count,
+                 (count / total_activities * 100) if total_activities > 0 else 0)
+                for activity_type, count in activity_types.most_common(15)]
+        bar_font = _font(size=12, color='4472C4')
 
+        for activity_type, count, percentage in rows:
+            _put(ws, start_row, 1, activity_type, font=SMALL_FONT)
+            _put(ws, start_row, 2, count, font=LABEL_FONT, alignment=ALIGN_HCENTER)
+            _put(ws, start_row, 3, _bar(int(percentage / 2)), font=bar_font)  # Scale
+            _put(ws, start_row, 4, f"{percentage:.1f}%", font=SMALL_FONT)
             start_row += 1
 
         return start_row + 1
@@ -3997,58 +4298,52 @@ def add_advanced_summary_sections(analyzer_class):
          DATA FLOW NETWORK STATISTICS
         """
 
-        header_cell = ws.cell(start_row, 1)
-        header_cell.value = "🌐 DATA FLOW NETWORK STATISTICS"
-        ws.merge_cells(f'A{start_row}:D{start_row}')
-
-        header_cell.font = Font(size=14, bold=True, color='FFFFFF')
-        header_cell.fill = PatternFill(start_color='00B0F0', end_color='00B0F0', fill_type='solid')
-        header_cell.alignment = Alignment(horizontal='left', vertical='center')
+        _section_header(ws, start_row, "🌐 DATA FLOW NETWORK STATISTICS", '00B0F0')
 
         start_row += 1
 
         total_nodes = len(self.graph)
-        total_edges = sum(len(node_data['depends_on']) for node_data in self.graph.values())
+        total_edges = 0
+        isolated = 0
+        connections = []
 
-        most_connected = sorted(
-            [(node, len(data['depends_on']) + len(data['used_by']))
-             for node, data in self.graph.items()],
-            key=lambda x: x[1],
-            reverse=True
-        )[:5]
+        # One walk over the graph feeds every metric below
+        for node, data in self.graph.items():
+            depends_on = len(data['depends_on'])
+            degree = depends_on + len(data['used_by'])
+            total_edges += depends_on
+            if not degree:
+                isolated += 1
+            connections.append((node, degree))
+
+        most_connected = heapq.nlargest(5, connections, key=lambda x: x[1])
 
         metrics = [
             ("Total Nodes (Resources)", total_nodes, "All resources in dependency graph"),
             ("Total Edges (Dependencies)", total_edges, "Direct dependency relationships"),
             ("Avg Connections per Node", f"{total_edges / total_nodes:.1f}" if total_nodes > 0 else "0", "Network density indicator"),
-            ("Isolated Resources", len([n for n, d in self.graph.items() if not d['depends_on'] and not d['used_by']]), "Resources with no connections"),
+            ("Isolated Resources", isolated, "Resources with no connections"),
         ]
 
         for metric, value, description in metrics:
-            ws.cell(start_row, 1).value = metric
-            ws.cell(start_row, 1).font = Font(bold=True, size=10)
+            _put(ws, start_row, 1, metric, font=LABEL_FONT)
 
-            ws.cell(start_row, 2).value = value
-            ws.cell(start_row, 2).font = Font(bold=True, size=11, color='0066CC')
-            ws.cell(start_row, 2).alignment = Alignment(horizontal='center')
+            _put(ws, start_row, 2, value, font=_font(bold=True, size=11, color='0066CC'), alignment=ALIGN_HCENTER)
 
-            ws.cell(start_row, 3).value = description
-            ws.merge_cells(f'C{start_row}:D{start_row}')
-            ws.cell(start_row, 3).font = Font(size=9, italic=True)
+            _put(ws, start_row, 3, description, font=NOTE_FONT)
+            ws.merge_cells(_row_span(start_row, 'C', 'D'))
 
             start_row += 1
 
         start_row += 1
-        ws.cell(start_row, 1).value = "Most Connected Resources:"
-        ws.cell(start_row, 1).font = Font(bold=True, size=10)
-        ws.merge_cells(f'A{start_row}:D{start_row}')
+        _put(ws, start_row, 1, "Most Connected Resources:", font=LABEL_FONT)
+        ws.merge_cells(_row_span(start_row))
         start_row += 1
 
         for node, connections in most_connected:
-            ws.cell(start_row, 1).value = f"• {node}"
-            ws.cell(start_row, 2).value = f"{connections} connections"
-            ws.merge_cells(f'A{start_row}:C{start_row}')
-            ws.cell(start_row, 1).font = Font(size=9)
+            _put(ws, start_row, 1, f"• {node}", font=SMALL_FONT)
+            _put(ws, start_row, 2, f"{connections} connections")
+            ws.merge_cells(_row_span(start_row, 'A', 'C'))
             start_row += 1
 
         return start_row + 1
@@ -4058,32 +4353,33 @@ def add_advanced_summary_sections(analyzer_class):
          CHANGE RISK ASSESSMENT
         """
 
-        header_cell = ws.cell(start_row, 1)
-        header_cell.value = " CHANGE RISK ASSESSMENT"
-        ws.merge_cells(f'A{start_row}:D{start_row}')
-
-        header_cell.font = Font(size=14, bold=True, color='FFFFFF')
-        header_cell.fill = PatternFill(start_color='FF9900', end_color='FF9900', fill_type='solid')
-        header_cell.alignment = Alignment(horizontal='left', vertical='center')
+        _section_header(ws, start_row, " CHANGE RISK ASSESSMENT", 'FF9900')
 
         start_row += 1
 
+        # First five pipelines per impact level, collected in one scan
+        by_impact = {'CRITICAL': [], 'HIGH': [], 'LOW': []}
+        for p in self.results['impact_analysis']:
+            names = by_impact.get(p['Impact'])
+            if names is not None and len(names) < 5:
+                names.append(p['Pipeline'])
+
         risks = [
             {
                 'category': ' High Risk Changes',
-                'resources': [p['Pipeline'] for p in self.results['impact_analysis'] if p.get('Impact') == 'CRITICAL'][:5],
+                'resources': by_impact['CRITICAL'],
                 'description': 'Changes to these pipelines affect many dependencies',
                 'mitigation': 'Thorough testing, staged rollout, backup plan'
             },
             {
                 'category': ' Medium Risk Changes',
-                'resources': [p['Pipeline'] for p in self.results['impact_analysis'] if p.get('Impact') == 'HIGH'][:5],
+                'resources': by_impact['HIGH'],
                 'description': 'Significant but contained impact',
                 'mitigation': 'Standard testing, monitor closely'
             },
             {
                 'category': ' Low Risk Changes',
-                'resources': [p['Pipeline'] for p in self.results['impact_analysis'] if p.get('Impact') == 'LOW'][:5],
+                'resources': by_impact['LOW'],
                 'description': 'Isolated or orphaned resources',
                 'mitigation': 'Basic testing sufficient'
             }
@@ -4091,36 +4387,25 @@ def add_advanced_summary_sections(analyzer_class):
 
         for risk in risks:
 
-            ws.cell(start_row, 1).value = risk['category']
-            ws.cell(start_row, 1).font = Font(bold=True, size=11)
-            ws.merge_cells(f'A{start_row}:D{start_row}')
-
-            if '' in risk['category']:
-                ws.cell(start_row, 1).fill = PatternFill(start_color='FFE6E6', end_color='FFE6E6', fill_type='solid')
-            elif '' in risk['category']:
-                ws.cell(start_row, 1).fill = PatternFill(start_color='FFF2CC', end_color='FFF2CC', fill_type='solid')
-            elif '' in risk['category']:
-                ws.cell(start_row, 1).fill = PatternFill(start_color='E6F7E6', end_color='E6F7E6', fill_type='solid')
+            _put(ws, start_row, 1, risk['category'], font=BOLD_11_FONT, fill=_solid_fill('FFE6E6'))
+            ws.merge_cells(_row_span(start_row))
 
             start_row += 1
 
-            ws.cell(start_row, 1).value = f"Count: {len(risk['resources'])}"
-            ws.cell(start_row, 1).font = Font(size=9)
+            _put(ws, start_row, 1, f"Count: {len(risk['resources'])}", font=SMALL_FONT)
             start_row += 1
 
             if risk['resources']:
-                ws.cell(start_row, 1).value = "Examples:"
-                ws.cell(start_row, 1).font = Font(size=9, italic=True)
+                _put(ws, start_row, 1, "Examples:", font=NOTE_FONT)
                 start_row += 1
 
                 for resource in risk['resources'][:3]:
-                    ws.cell(start_row, 1).value = f"  • {resource}"
-                    ws.cell(start_row, 1).font = Font(size=8)
+                    _put(ws, start_row, 1, f"  • {resource}", font=_font(size=8))
                     start_row += 1
 
-            ws.cell(start_row, 1).value = f"Mitigation: {risk['mitigation']}"
-            ws.cell(start_row, 1).font = Font(size=9, italic=True, color='666666')
-            ws.merge_cells(f'A{start_row}:D{start_row}')
+            _put(ws, start_row, 1, f"Mitigation: {risk['mitigation']}",
+                 font=_font(size=9, italic=True, color='666666'))
+            ws.merge_cells(_row_span(start_row))
             start_row += 2
 
         return start_row
@@ -4140,7 +4425,7 @@ def add_advanced_summary_sections(analyzer_class):
         orphan_percentage = (orphaned / max(len(self.resources['all']), 1)) * 100
         score -= min(orphan_percentage, 20)
 
-        broken_triggers = len([t for t in self.results['orphaned_triggers'] if t.get('Type') == 'BrokenReference'])
+        broken_triggers = sum(1 for t in self.results['orphaned_triggers'] if t.get('Type') == 'BrokenReference')
         score -= min(broken_triggers * 5, 15)
 
         return max(0, min(100, int(score)))
@@ -4149,27 +4434,27 @@ def add_advanced_summary_sections(analyzer_class):
         """Calculate performance score (0-100)"""
         score = 100
 
-        complex_pipelines = len([
-            p for p in self.results['pipeline_analysis']
+        complex_pipelines = sum(
+            1 for p in self.results['pipeline_analysis']
             if p.get('ComplexityScore', 0) > 100
-        ])
+        )
         total_pipelines = len(self.results['pipeline_analysis'])
         if total_pipelines > 0:
             complex_percentage = (complex_pipelines / total_pipelines) * 100
             score -= min(complex_percentage, 25)
 
-        deep_nesting = len([
-            p for p in self.results['pipeline_analysis']
+        deep_nesting = sum(
+            1 for p in self.results['pipeline_analysis']
             if p.get('MaxNestingDepth', 0) > 5
-        ])
+        )
         if total_pipelines > 0:
             nesting_percentage = (deep_nesting / total_pipelines) * 100
             score -= min(nesting_percentage, 15)
 
-        auto_resolve = len([
-            a for a in self.results['activities']
+        auto_resolve = sum(
+            1 for a in self.results['activities']
             if a.get('IntegrationRuntime') == 'AutoResolveIR'
-        ])
+        )
         total_activities = len(self.results['activities'])
         if total_activities > 0:
             auto_percentage = (auto_resolve / total_activities) * 100
@@ -4177,34 +4462,58 @@ def add_advanced_summary_sections(analyzer_class):
 
         return max(0, min(100, int(score)))
 
-    def _calculate_security_score(self) -> int:
+    def _security_counts(self) -> SimpleNamespace:
+        """Linked service / IR security counts shared by the security score and checklist"""
+        linked_services = self.results['linked_services']
+        integration_runtimes = self.results['integration_runtimes']
+
+        return SimpleNamespace(
+            linked_services=len(linked_services),
+            key_vault=sum(1 for ls in linked_services if ls.get('UsesKeyVault') == 'Yes'),
+            managed_identity=sum(1 for ls in linked_services if 'Managed Identity' in ls.get('Authentication', '')),
+            integration_runtimes=len(integration_runtimes),
+            self_hosted=sum(1 for ir in integration_runtimes if ir.get('Type') == 'SelfHosted'),
+            vnet=sum(1 for ir in integration_runtimes if ir.get('VNetIntegration') == 'Yes'),
+        )
+
+    def _calculate_health_scores(self, security: SimpleNamespace = None) -> SimpleNamespace:
+        """All four health scores plus the weighted overall score, computed once per Summary"""
+        quality = self._calculate_quality_score()
+        performance = self._calculate_performance_score()
+        security_score = self._calculate_security_score(security)
+        maintainability = self._calculate_maintainability_score()
+
+        overall = int(
+            quality * 0.3 +
+            performance * 0.2 +
+            security_score * 0.3 +
+            maintainability * 0.2
+        )
+
+        return SimpleNamespace(quality=quality, performance=performance, security=security_score,
+                               maintainability=maintainability, overall=overall)
+
+    def _calculate_security_score(self, security: SimpleNamespace = None) -> int:
         """Calculate security score (0-100)"""
         score = 100
 
-        kv_usage = len([
-            ls for ls in self.results['linked_services']
-            if ls.get('UsesKeyVault') == 'Yes'
-        ])
-        total_ls = len(self.results['linked_services'])
+        if security is None:
+            security = self._security_counts()
+
+        kv_usage = security.key_vault
+        total_ls = security.linked_services
         if total_ls > 0:
             kv_percentage = (kv_usage / total_ls) * 100
             if kv_percentage < 50:
                 score -= (50 - kv_percentage) / 2
 
-        mi_usage = len([
-            ls for ls in self.results['linked_services']
-            if 'Managed Identity' in ls.get('Authentication', '')
-        ])
+        mi_usage = security.managed_identity
         if total_ls > 0:
             mi_percentage = (mi_usage / total_ls) * 100
             if mi_percentage < 30:
                 score -= (30 - mi_percentage) / 2
 
-        vnet_irs = len([
-            ir for ir in self.results['integration_runtimes']
-            if ir.get('VNetIntegration') == 'Yes'
-        ])
-        if vnet_irs == 0 and len(self.results['integration_runtimes']) > 0:
+        if security.vnet == 0 and security.integration_runtimes > 0:
             score -= 10
 
         return max(0, min(100, int(score)))
@@ -4213,27 +4522,27 @@ def add_advanced_summary_sections(analyzer_class):
         """Calculate maintainability score (0-100)"""
         score = 100
 
-        poorly_named = len([
-            p for p in self.results['pipelines']
+        poorly_named = sum(
+            1 for p in self.results['pipelines']
             if len(p.get('Pipeline', '')) < 5 or not any(c.isupper() for c in p.get('Pipeline', ''))
-        ])
+        )
         total_pipelines = len(self.results['pipelines'])
         if total_pipelines > 0:
             poorly_named_percentage = (poorly_named / total_pipelines) * 100
             score -= min(poorly_named_percentage / 2, 15)
 
-        no_description = len([
-            p for p in self.results['pipelines']
+        no_description = sum(
+            1 for p in self.results['pipelines']
             if not p.get('Description')
-        ])
+        )
         if total_pipelines > 0:
             no_desc_percentage = (no_description / total_pipelines) * 100
             score -= min(no_desc_percentage / 3, 10)
 
-        no_folder = len([
-            p for p in self.results['pipelines']
+        no_folder = sum(
+            1 for p in self.results['pipelines']
             if not p.get('Folder')
-        ])
+        )
         if total_pipelines > 0:
             no_folder_percentage = (no_folder / total_pipelines) * 100
             score -= min(no_folder_percentage / 3, 10)
@@ -4266,7 +4575,7 @@ def add_advanced_summary_sections(analyzer_class):
 
     analyzer_class._write_health_score_dashboard = _write_health_score_dashboard
 
-    if EnhancementConfig.is_enabled(ENHANCEMENT_CONFIG, 'advanced_dashboard', 'cost_analysis'):
+    if EnhancementConfig.is_enabled(get_enhancement_config(), 'advanced_dashboard', 'cost_analysis'):
         analyzer_class._write_cost_analysis = _write_cost_analysis
     analyzer_class._write_complexity_heat_map = _write_complexity_heat_map
     analyzer_class._write_performance_insights = _write_performance_insights
@@ -4277,6 +4586,8 @@ def add_advanced_summary_sections(analyzer_class):
     analyzer_class._write_dataflow_complexity_heat_map = _write_dataflow_complexity_heat_map
     analyzer_class._write_change_risk_assessment = _write_change_risk_assessment
 
+    analyzer_class._security_counts = _security_counts
+    analyzer_class._calculate_health_scores = _calculate_health_scores
     analyzer_class._calculate_quality_score = _calculate_quality_score
     analyzer_class._calculate_performance_score = _calculate_performance_score
     analyzer_class._calculate_security_score = _calculate_security_score
@@ -4296,33 +4607,34 @@ def integrate_advanced_sections_into_summary(analyzer_class):
          COMPLETE ENHANCED SUMMARY WITH ADVANCED SECTIONS
         """
 
-        import pandas as pd
-
         workbook = writer.book
 
-        df_init = pd.DataFrame({'_': ['']})
-        sheet_name = self._get_unique_sheet_name('Summary')
-        df_init.to_excel(writer, sheet_name=sheet_name, index=False, header=False)
-
-        ws = writer.sheets[sheet_name]
+        ws = workbook.create_sheet(title=self._get_unique_sheet_name('Summary'))
+        _register_summary_styles(workbook)
 
         ws.column_dimensions['A'].width = 25
         ws.column_dimensions['B'].width = 35
         ws.column_dimensions['C'].width = 15
         ws.column_dimensions['D'].width = 50
 
+        stats = self._summary_stats()
+        stats.security = self._security_counts()
+        stats.health = self._calculate_health_scores(stats.security)
+        now_str = _display_time(timestamp)
+        src_str = str(self.json_path)
+
         current_row = 1
 
-        current_row = self._write_project_banner(ws, current_row, timestamp)
+        current_row = self._write_project_banner(ws, current_row, timestamp, now_str, src_str)
         current_row += 2
-        current_row = self._write_executive_summary(ws, current_row)
+        current_row = self._write_executive_summary(ws, current_row, stats)
         current_row += 2
-        current_row = self._write_critical_alerts(ws, current_row)
+        current_row = self._write_critical_alerts(ws, current_row, stats)
 
         current_row += 2
-        current_row = self._write_health_score_dashboard(ws, current_row)
+        current_row = self._write_health_score_dashboard(ws, current_row, stats)
 
-        if EnhancementConfig.is_enabled(ENHANCEMENT_CONFIG, 'advanced_dashboard', 'cost_analysis') and hasattr(self, '_write_cost_analysis'):
+        if EnhancementConfig.is_enabled(get_enhancement_config(), 'advanced_dashboard', 'cost_analysis') and hasattr(self, '_write_cost_analysis'):
             current_row += 2
             current_row = self._write_cost_analysis(ws, current_row)
 
@@ -4340,7 +4652,7 @@ def integrate_advanced_sections_into_summary(analyzer_class):
         current_row = self._write_top_pipelines_ranking(ws, current_row)
 
         current_row += 2
-        current_row = self._write_security_compliance_checklist(ws, current_row)
+        current_row = self._write_security_compliance_checklist(ws, current_row, stats)
 
         current_row += 2
         current_row = self._write_activity_distribution_chart(ws, current_row)
@@ -4352,11 +4664,11 @@ def integrate_advanced_sections_into_summary(analyzer_class):
         current_row = self._write_change_risk_assessment(ws, current_row)
 
         current_row += 2
-        current_row = self._write_metrics_dashboard(ws, current_row)
+        current_row = self._write_metrics_dashboard(ws, current_row, stats)
         current_row += 2
-        current_row = self._write_resource_overview(ws, current_row)
+        current_row = self._write_resource_overview(ws, current_row, stats)
         current_row += 2
-        current_row = self._write_recommendations(ws, current_row)
+        current_row = self._write_recommendations(ws, current_row, stats)
         current_row += 2
         current_row = self._write_detailed_statistics(ws, current_row, timestamp)
 
@@ -4378,24 +4690,29 @@ def apply_complete_excel_enhancements(analyzer_class=None, verbose: bool = True)
 
     if analyzer_class is None:
         try:
-            from adf_analyzer_v10_complete import UltimateEnterpriseADFAnalyzer
-            analyzer_class = UltimateEnterpriseADFAnalyzer
+            analyzer_class = _resolve_default_class()
         except ImportError:
             print(" ERROR: Could not import analyzer")
             return False
 
+    if _already_patched(analyzer_class, '_adf_excel_enhanced_complete'):
+        return True
+
     if verbose:
-        print("\n" + "="*80)
-        print(" APPLYING COMPLETE EXCEL ENHANCEMENTS (ULTIMATE EDITION)")
-        print("="*80 + "\n")
+        print("\n".join((
+            "\n" + "="*80,
+            " APPLYING COMPLETE EXCEL ENHANCEMENTS (ULTIMATE EDITION)",
+            "="*80 + "\n",
+        )))
 
     try:
 
         if verbose:
             print("📦 Parts 1-4: Base formatting, conditional formatting, hyperlinks...")
 
-        create_enhanced_export_function(analyzer_class)
-        create_enhanced_beautification_method(analyzer_class)
+        if not _already_patched(analyzer_class, '_adf_excel_enhanced'):
+            create_enhanced_export_function(analyzer_class)
+            create_enhanced_beautification_method(analyzer_class)
 
         if verbose:
             print("📦 Part 5: Enhanced summary sheet...")
@@ -4407,30 +4724,37 @@ def apply_complete_excel_enhancements(analyzer_class=None, verbose: bool = True)
 
         add_advanced_summary_sections(analyzer_class)
         integrate_advanced_sections_into_summary(analyzer_class)
+        _mark_patched(analyzer_class, '_adf_excel_enhanced', '_adf_excel_enhanced_with_summary',
+                      '_adf_excel_enhanced_complete')
 
         if verbose:
-            print("\n" + "="*80)
-            print(" COMPLETE EXCEL ENHANCEMENTS APPLIED (ULTIMATE EDITION)")
-            print("="*80)
-            print("\n🎨 Summary Sheet Now Includes:")
-            print("   Beautiful project banner")
-            print("   Executive summary")
-            print("   Critical alerts")
-            print("   🏥 Health Score Dashboard (Quality, Performance, Security)")
-            if EnhancementConfig.is_enabled(ENHANCEMENT_CONFIG, 'advanced_dashboard', 'cost_analysis'):
-                print("   💰 Cost Analysis & Optimization")
-            print("   🌡 Complexity Heat Map")
-            print("   ⚡ Performance Insights & Bottlenecks")
-            print("    Top Pipelines Ranking")
-            print("   🔒 Security & Compliance Checklist")
-            print("    Activity Distribution Chart")
-            print("   🌐 Data Flow Network Statistics")
-            print("    Change Risk Assessment")
-            print("    Recommendations")
-            print("    Detailed Metrics")
-            print("   🔗 Navigation Links")
-            print("\n🌟 Plus ALL formatting enhancements from Parts 1-4!")
-            print("="*80 + "\n")
+            lines = [
+                "\n" + "="*80,
+                " COMPLETE EXCEL ENHANCEMENTS APPLIED (ULTIMATE EDITION)",
+                "="*80,
+                "\n🎨 Summary Sheet Now Includes:",
+                "   Beautiful project banner",
+                "   Executive summary",
+                "   Critical alerts",
+                "   🏥 Health Score Dashboard (Quality, Performance, Security)",
+            ]
+            if EnhancementConfig.is_enabled(get_enhancement_config(), 'advanced_dashboard', 'cost_analysis'):
+                lines.append("   💰 Cost Analysis & Optimization")
+            lines += [
+                "   🌡 Complexity Heat Map",
+                "   ⚡ Performance Insights & Bottlenecks",
+                "    Top Pipelines Ranking",
+                "   🔒 Security & Compliance Checklist",
+                "    Activity Distribution Chart",
+                "   🌐 Data Flow Network Statistics",
+                "    Change Risk Assessment",
+                "    Recommendations",
+                "    Detailed Metrics",
+                "   🔗 Navigation Links",
+                "\n🌟 Plus ALL formatting enhancements from Parts 1-4!",
+                "="*80 + "\n",
+            ]
+            print("\n".join(lines))
 
         return True
 
@@ -4440,14 +4764,15 @@ def apply_complete_excel_enhancements(analyzer_class=None, verbose: bool = True)
             traceback.print_exc()
         return False
 
-print(" Part 6/6 loaded: Advanced Summary Enhancements loaded")
-print("\n" + "="*80)
-print("🎉 ALL 6 PARTS LOADED SUCCESSFULLY!")
-print("="*80)
-print("\n📚 For usage guide, run:")
-print("   from adf_analyzer_v10_excel_enhancements import print_usage_guide")
-print("   print_usage_guide()")
-print("\n🚀 To apply enhancements:")
-print("   from adf_analyzer_v10_excel_enhancements import apply_excel_enhancements")
-print("   Use: apply_complete_excel_enhancements() for ULTIMATE enhancement")
-print("="*80 + "\n")
\ No newline at end of file
+if _DEBUG:
+    print(" Part 6/6 loaded: Advanced Summary Enhancements loaded")
+    print("\n" + "="*80)
+    print("🎉 ALL 6 PARTS LOADED SUCCESSFULLY!")
+    print("="*80)
+    print("\n📚 For usage guide, run:")
+    print("   from adf_analyzer_v10_excel_enhancements import print_usage_guide")
+    print("   print_usage_guide()")
+    print("\n🚀 To apply enhancements:")
+    print("   from adf_analyzer_v10_excel_enhancements import apply_excel_enhancements")
+    print("   Use: apply_complete_excel_enhancements() for ULTIMATE enhancement")
+    print("="*80 + "\n")
\ No newline at end of file